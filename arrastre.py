@@ -0,0 +1,275 @@
+"""Tiro con rozamiento cuadrático del aire
+
+La fuerza de arrastre es -arrastre * |v| * v (arrastre en kg/m, p. ej. 0.5 * densidad del
+aire * Cd * área), así que la masa y el coeficiente cambian la trayectoria. No hay
+solución cerrada: se integra con Dormand-Prince (RK45 de paso adaptativo), muchos
+lanzamientos a la vez con arreglos de NumPy, cada uno con su propio paso.
+Mismo sistema que trayectoria.py: metros, origen en el cañón y el eje y hacia arriba.
+"""
+from collections import OrderedDict
+import numpy as np
+from trayectoria import GRAVEDAD
+
+# Tablero de Butcher de Dormand-Prince 5(4)
+_C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1, 1])
+_A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    [35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84],
+]
+_B5 = np.array([35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0])
+_B4 = np.array([5179 / 57600, 0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40])
+
+# Resolución de la caché: tiros que caen en la misma celda comparten trayectoria
+CUANTOS = (0.01, 0.01, 0.1, 1e-4)  # masa (kg), ángulo (°), potencia (J), arrastre (kg/m)
+
+
+def _derivada(estado, c, g):
+    """estado: (n, 4) con x, y, vx, vy; c = arrastre / masa por lanzamiento"""
+    vx = estado[:, 2]
+    vy = estado[:, 3]
+    rapidez = np.hypot(vx, vy)
+    return np.stack((vx, vy, -c * rapidez * vx, -g - c * rapidez * vy), axis=1)
+
+
+def _hermite(t0, e0, t1, e1, f0, f1, t):
+    """Posición en t con el polinomio cúbico que respeta posición y velocidad en los extremos"""
+    h = t1 - t0
+    s = np.where(h > 0, (t - t0) / np.where(h > 0, h, 1), 0.0)[..., None]
+    s2 = s * s
+    s3 = s2 * s
+    return ((2 * s3 - 3 * s2 + 1) * e0 + (s3 - 2 * s2 + s) * h[..., None] * f0
+            + (-2 * s3 + 3 * s2) * e1 + (s3 - s2) * h[..., None] * f1)
+
+
+def integrar(masas, angulos_deg, potencias, arrastres, gravedad=GRAVEDAD, x_max=None,
+             rtol=1e-6, atol=1e-6, max_pasos=100000):
+    """Integra muchos lanzamientos a la vez; devuelve una TrayectoriaArrastre por lanzamiento
+
+    Cada lanzamiento termina al volver al suelo (y = 0) o al pasar x_max.
+    """
+    masas, angulos_deg, potencias, arrastres = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (masas, angulos_deg, potencias, arrastres)))
+    masas = masas.ravel()
+    if np.any(masas <= 0):
+        raise ValueError("la masa debe ser positiva")
+    n = len(masas)
+    angulos = np.radians(angulos_deg.ravel())
+    v0 = np.sqrt(2 * potencias.ravel() / masas)
+    c = arrastres.ravel() / masas
+    fin_x = np.inf if x_max is None else x_max
+
+    estado = np.stack((np.zeros(n), np.zeros(n), v0 * np.cos(angulos), v0 * np.sin(angulos)), axis=1)
+    t = np.zeros(n)
+    # Paso inicial: una pequeña fracción del tiempo de vuelo sin aire
+    h = np.maximum(0.01 * v0 / gravedad, 1e-4)
+
+    # Nodos aceptados de cada lanzamiento: t, x, y, vx, vy
+    capacidad = 64
+    nodos = np.empty((n, capacidad, 5))
+    cuenta = np.ones(n, dtype=np.int64)
+    nodos[:, 0, 0] = 0.0
+    nodos[:, 0, 1:] = estado
+    # Los que salen hacia abajo ya están en el suelo
+    activo = estado[:, 3] > 0
+
+    for _ in range(max_pasos):
+        idx = np.flatnonzero(activo)
+        if idx.size == 0:
+            break
+        e = estado[idx]
+        hh = h[idx][:, None]
+        ci = c[idx]
+        k = []
+        for fila in _A:
+            paso = e + hh * sum(a * kj for a, kj in zip(fila, k)) if fila else e
+            k.append(_derivada(paso, ci, gravedad))
+        nuevo = e + hh * sum(b * kj for b, kj in zip(_B5, k) if b)
+        error = hh * sum((b5 - b4) * kj for b5, b4, kj in zip(_B5, _B4, k))
+        escala = atol + rtol * np.maximum(np.abs(e), np.abs(nuevo))
+        norma = np.sqrt(np.mean((error / escala) ** 2, axis=1))
+        aceptado = norma <= 1.0
+
+        # Control de paso clásico, con límites para no saltar demasiado
+        factor = np.clip(0.9 * np.where(norma > 0, norma, 1e-10) ** -0.2, 0.2, 5.0)
+        ok = idx[aceptado]
+        if ok.size:
+            t[ok] += h[ok]
+            estado[ok] = nuevo[aceptado]
+            if cuenta[ok].max() >= capacidad:
+                capacidad *= 2
+                nodos = np.concatenate([nodos, np.empty_like(nodos)], axis=1)
+            nodos[ok, cuenta[ok], 0] = t[ok]
+            nodos[ok, cuenta[ok], 1:] = estado[ok]
+            cuenta[ok] += 1
+            terminado = (estado[ok, 1] < 0) | (estado[ok, 0] > fin_x)
+            activo[ok[terminado]] = False
+        h[idx] *= factor
+    else:
+        raise RuntimeError("la integración no terminó en max_pasos pasos")
+
+    # Instante exacto de llegada al suelo o al borde dentro del último paso (bisección)
+    fin = cuenta - 1
+    filas = np.arange(n)
+    a, b = nodos[filas, np.maximum(fin - 1, 0)], nodos[filas, fin]
+    fa = _derivada(a[:, 1:], c, gravedad)
+    fb = _derivada(b[:, 1:], c, gravedad)
+    lo, hi = a[:, 0].copy(), b[:, 0].copy()
+    for _ in range(60):
+        medio = 0.5 * (lo + hi)
+        p = _hermite(a[:, 0], a[:, 1:], b[:, 0], b[:, 1:], fa, fb, medio)
+        fuera = (p[:, 1] < 0) | (p[:, 0] > fin_x)
+        hi = np.where(fuera, medio, hi)
+        lo = np.where(fuera, lo, medio)
+    duracion = np.where(fin > 0, lo, 0.0)
+
+    return [TrayectoriaArrastre(nodos[i, :cuenta[i]].copy(), c[i], gravedad, duracion[i]) for i in range(n)]
+
+
+class TrayectoriaArrastre:
+    """Trayectoria integrada; misma interfaz que trayectoria.Trayectoria
+
+    Entre nodos la posición se interpola con polinomios cúbicos de Hermite (posición y
+    velocidad en cada nodo), que tienen el mismo orden que el integrador.
+    """
+
+    def __init__(self, nodos, c, gravedad, duracion):
+        self.t = nodos[:, 0]
+        self.estados = nodos[:, 1:]
+        self.c = c
+        self.g = gravedad
+        self.duracion = float(duracion)
+        self.derivadas = _derivada(self.estados, c, gravedad)
+        self.vx, self.vy = float(self.estados[0, 2]), float(self.estados[0, 3])
+
+    def _estado(self, t):
+        t = np.clip(np.asarray(t, dtype=float), 0.0, self.t[-1])
+        i = np.clip(np.searchsorted(self.t, t, side="right") - 1, 0, max(len(self.t) - 2, 0))
+        j = np.minimum(i + 1, len(self.t) - 1)
+        return _hermite(self.t[i], self.estados[i], self.t[j], self.estados[j],
+                        self.derivadas[i], self.derivadas[j], t)
+
+    def posicion(self, t):
+        e = self._estado(t)
+        return float(e[0]), float(e[1])
+
+    def velocidad(self, t):
+        e = self._estado(t)
+        return float(e[2]), float(e[3])
+
+    @property
+    def tiempo_vuelo(self):
+        return self.duracion
+
+    @property
+    def alcance(self):
+        return self.posicion(self.duracion)[0]
+
+    @property
+    def apice(self):
+        """(t, x, y) del punto más alto"""
+        t = self.t[self.t <= self.duracion]
+        vy = self.estados[:len(t), 3]
+        k = np.flatnonzero((vy[:-1] > 0) & (vy[1:] <= 0))
+        if k.size == 0:
+            t_apice = 0.0
+        else:
+            # vy cambia de signo dentro del paso k: se interpola linealmente
+            k = k[0]
+            t_apice = t[k] + vy[k] / (vy[k] - vy[k + 1]) * (t[k + 1] - t[k])
+        x, y = self.posicion(t_apice)
+        return float(t_apice), x, y
+
+    def puntos(self, paso, t_fin=None):
+        """Genera las posiciones cada paso segundos hasta t_fin (incluido), sin guardarlas"""
+        t_fin = self.duracion if t_fin is None else t_fin
+        k = 0
+        while k * paso < t_fin:
+            yield self.posicion(k * paso)
+            k += 1
+        yield self.posicion(t_fin)
+
+    def muestrear(self, n, t_fin=None):
+        e = self._estado(np.linspace(0.0, self.duracion if t_fin is None else t_fin, n))
+        return e[:, 0], e[:, 1]
+
+    def tiempo_impacto(self, izquierda, abajo, derecha, arriba, radio=0.0, t_fin=None):
+        """Primer instante en que un disco de ese radio toca el rectángulo, o None si no lo toca
+
+        Se recorre la trayectoria en muestras que avanzan a lo sumo medio radio (o 1 cm)
+        y el primer contacto se afina por bisección.
+        """
+        t_fin = self.duracion if t_fin is None else t_fin
+        # Con el aire frenando y sin bajar del suelo, la rapidez nunca supera la inicial
+        avance = max(radio, 0.02) / 2
+        n = min(int(np.hypot(self.vx, self.vy) * t_fin / avance) + 2, 1000000)
+        t = np.linspace(0.0, t_fin, n)
+
+        def dentro(t):
+            e = self._estado(t)
+            dx = np.maximum(np.maximum(izquierda - e[..., 0], e[..., 0] - derecha), 0.0)
+            dy = np.maximum(np.maximum(abajo - e[..., 1], e[..., 1] - arriba), 0.0)
+            return dx * dx + dy * dy <= radio * radio
+
+        toca = np.flatnonzero(dentro(t))
+        if toca.size == 0:
+            return None
+        k = toca[0]
+        if k == 0:
+            return 0.0
+        lo, hi = t[k - 1], t[k]
+        for _ in range(50):
+            medio = 0.5 * (lo + hi)
+            if dentro(medio):
+                hi = medio
+            else:
+                lo = medio
+        return float(hi)
+
+class CacheTrayectorias:
+    """Trayectorias ya integradas por (masa, angulo, potencia, arrastre) redondeados, con desalojo LRU
+
+    Se integra con los valores redondeados, así que un tiro repetido o casi igual
+    devuelve exactamente la misma trayectoria sin volver a integrar.
+    """
+
+    def __init__(self, max_size=1024, cuantos=CUANTOS, gravedad=GRAVEDAD, x_max=None):
+        self.max_size = max_size
+        self.cuantos = cuantos
+        self.gravedad = gravedad
+        self.x_max = x_max
+        self.trayectorias = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def __len__(self):
+        return len(self.trayectorias)
+
+    def clave(self, masa, angulo, potencia, arrastre):
+        return tuple(int(round(v / q)) for v, q in zip((masa, angulo, potencia, arrastre), self.cuantos))
+
+    def obtener(self, masa, angulo, potencia, arrastre):
+        return self.obtener_muchas([(masa, angulo, potencia, arrastre)])[0]
+
+    def obtener_muchas(self, disparos):
+        """Una trayectoria por (masa, angulo, potencia, arrastre); las que faltan se integran juntas"""
+        claves = [self.clave(*d) for d in disparos]
+        faltan = list(dict.fromkeys(k for k in claves if k not in self.trayectorias))
+        if faltan:
+            valores = np.array(faltan, dtype=float) * np.array(self.cuantos)
+            nuevas = integrar(*valores.T, gravedad=self.gravedad, x_max=self.x_max)
+            for k, trayectoria in zip(faltan, nuevas):
+                self.trayectorias[k] = trayectoria
+        self.fallos += len(faltan)
+        self.aciertos += len(claves) - len(faltan)
+        resultado = []
+        for k in claves:
+            self.trayectorias.move_to_end(k)
+            resultado.append(self.trayectorias[k])
+        while len(self.trayectorias) > self.max_size:
+            self.trayectorias.popitem(last=False)
+        return resultado
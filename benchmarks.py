@@ -0,0 +1,377 @@
+"""Benchmarks de los núcleos de física y de cuadros completos
+
+    python benchmarks.py --out bench.json
+    python benchmarks.py --kernels grid_batch,gas_frame --counts 1000,10000 --steps 10
+    python benchmarks.py --kernels render_sprites,render_circles --counts 10,1000,10000 --compare
+
+Cada caso se ejecuta sin ventana y guarda pasos por segundo y memoria pico
+(tracemalloc) en JSON, para comparar corridas entre commits en la misma máquina.
+Con --compare, cada núcleo de COMPARISONS se compara con el que reemplaza en los
+mismos casos, y la salida es 1 si alguno resulta más lento.
+"""
+import argparse
+import json
+import math
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+from particles import Particle, ParticleSystem
+from collisions import brute_force_pairs, spatial_hash_pairs, resolve_collision, resolve_pairs, resolve_collisions_batch
+from gas import GasSimulation, spawn_particles
+from diagnostics import GasDiagnostics
+
+DEFAULT_COUNTS = [10, 100, 1000, 10000, 100000]
+DEFAULT_STEPS = [1, 10, 100]
+PACKING = 0.15  # fracción de área ocupada por los discos en los casos de gas
+MEAN_DISK_AREA = math.pi * 15 ** 2
+
+KERNELS = {}
+# (núcleo nuevo, el que reemplaza): el nuevo tiene que ser al menos igual de rápido
+COMPARISONS = [("render_sprites", "render_circles")]
+
+
+def kernel(name, max_n=None):
+    """Registra un caso: setup(n, rng) devuelve la función que ejecuta un paso"""
+    def register(setup):
+        KERNELS[name] = (setup, max_n)
+        return setup
+    return register
+
+
+def box_for(n):
+    side = math.sqrt(n * MEAN_DISK_AREA / PACKING)
+    return max(side, 100.0), max(side * 0.75, 100.0)
+
+
+def random_gas(n, rng):
+    width, height = box_for(n)
+    radius = rng.integers(10, 21, n).astype(float)
+    angle = rng.uniform(0, 2 * math.pi, n)
+    speed = rng.uniform(50, 150, n)
+    system = ParticleSystem(n)
+    system.extend(rng.uniform(radius, width - radius), rng.uniform(radius, height - radius),
+                  speed * np.cos(angle), speed * np.sin(angle), radius, radius ** 2)
+    return system, width, height
+
+
+@kernel("particle_move_wall", max_n=10000)
+def bench_particle_move_wall(n, rng):
+    system, width, height = random_gas(n, rng)
+    particles = [Particle(p.x, p.y, p.vx, p.vy, p.radius, p.mass) for p in system]
+
+    def step():
+        for p in particles:
+            p.move(1 / 180)
+            p.wall_collision(width, height)
+    return step
+
+
+@kernel("system_move_wall")
+def bench_system_move_wall(n, rng):
+    system, width, height = random_gas(n, rng)
+
+    def step():
+        system.move(1 / 180)
+        system.wall_collision(width, height)
+        system.clamp_speed(300)
+    return step
+
+
+@kernel("resolve_collision", max_n=10000)
+def bench_resolve_collision(n, rng):
+    # n pares que se solapan; se recolocan antes de cada paso
+    system = ParticleSystem(2 * n)
+    x = np.repeat(np.arange(n) * 50.0, 2)
+    x[1::2] += 15
+    y = rng.uniform(0, 5, 2 * n)
+    system.extend(x, y, rng.normal(0, 100, 2 * n), rng.normal(0, 100, 2 * n), 10, 100)
+    x0, y0 = x.copy(), y.copy()
+    views = list(system)
+
+    def step():
+        system.x[:] = x0
+        system.y[:] = y0
+        for k in range(n):
+            resolve_collision(views[2 * k], views[2 * k + 1])
+    return step
+
+
+def _all_pairs(broad, narrow):
+    def setup(n, rng):
+        system, width, height = random_gas(n, rng)
+
+        def step():
+            i, j = broad(system)
+            narrow(system, i, j)
+        return step
+    return setup
+
+
+kernel("brute_sequential", max_n=1000)(_all_pairs(brute_force_pairs, resolve_pairs))
+kernel("grid_sequential", max_n=10000)(_all_pairs(spatial_hash_pairs, resolve_pairs))
+kernel("grid_batch")(_all_pairs(spatial_hash_pairs, resolve_collisions_batch))
+
+
+def _spawn(method, packing):
+    def setup(n, rng):
+        side = math.sqrt(n * MEAN_DISK_AREA / packing)
+        seed = int(rng.integers(2 ** 31))
+
+        def step():
+            spawn_particles(n, side, side, method, np.random.default_rng(seed))
+        return step
+    return setup
+
+
+kernel("spawn")(_spawn("random", PACKING))
+kernel("spawn_lattice")(_spawn("lattice", 0.3))
+
+
+def _gas_frame(engine, diagnostics=False):
+    def setup(n, rng):
+        width, height = box_for(n)
+        random.seed(int(rng.integers(2 ** 31)))
+        particles = spawn_particles(n, int(width), int(height))
+        monitor = GasDiagnostics(particles, int(width), int(height)) if diagnostics else None
+        simulation = GasSimulation(particles, int(width), int(height), engine=engine, monitor=monitor)
+
+        def step():
+            simulation.step(1 / 60)
+        return step
+    return setup
+
+
+kernel("gas_frame", max_n=5000)(_gas_frame("substeps"))
+# Con celdas cada evento cuesta lo mismo con cualquier N; el límite es el tiempo de arranque
+kernel("gas_frame_events", max_n=10000)(_gas_frame("events"))
+kernel("gas_frame_diagnostics", max_n=5000)(_gas_frame("substeps", diagnostics=True))
+
+
+@kernel("disparar", max_n=10000)
+def bench_disparar(n, rng):
+    from juego_tiro_parabolico import disparar
+    shots = list(zip(rng.uniform(0.5, 10, n), rng.uniform(10, 80, n), rng.uniform(100, 2000, n)))
+
+    def step():
+        for masa, angulo, potencia in shots:
+            disparar(masa, angulo, potencia)
+    return step
+
+
+@kernel("trayectoria_impacto", max_n=100000)
+def bench_trayectoria_impacto(n, rng):
+    from trayectoria import Trayectoria
+    shots = [Trayectoria(m, a, e) for m, a, e in
+             zip(rng.uniform(0.5, 10, n), rng.uniform(10, 80, n), rng.uniform(100, 2000, n))]
+    targets = list(zip(rng.uniform(35, 70, n), rng.uniform(3, 30, n)))
+
+    def step():
+        for shot, (x, y) in zip(shots, targets):
+            shot.tiempo_impacto(x, y - 4, x + 1, y, 0.5)
+    return step
+
+
+@kernel("disparo_arrastre", max_n=100000)
+def bench_disparo_arrastre(n, rng):
+    from arrastre import integrar
+    shots = (rng.uniform(0.5, 10, n), rng.uniform(10, 80, n), rng.uniform(100, 2000, n), rng.uniform(0, 0.02, n))
+
+    def step():
+        integrar(*shots, x_max=75)
+    return step
+
+
+@kernel("dificultad_objetivos", max_n=100000)
+def bench_dificultad_objetivos(n, rng):
+    from solucionador_tiro import dificultad
+    x = rng.uniform(35, 75, n)
+    y = rng.uniform(2, 30, n)
+
+    def step():
+        dificultad(x, y - 4, x + 1, y, 2.0, 3000, 0.5, 75)
+    return step
+
+
+@kernel("rafaga")
+def bench_rafaga(n, rng):
+    from rafaga import Rafaga
+    # n proyectiles en el aire contra n / 10 objetivos
+    volley = Rafaga(n, max(n // 10, 1), rng, x_max=75, por_paso=n)
+    for _ in range(60):
+        volley.step(1 / 60)
+
+    def step():
+        volley.step(1 / 60)
+    return step
+
+
+@kernel("spring_update", max_n=10000)
+def bench_spring_update(n, rng):
+    from springs import VerticalSpring, SpringImpact
+    springs = [VerticalSpring(k=k, mass=m) for k, m in zip(rng.uniform(10, 500, n), rng.uniform(1, 100, n))]
+    impacts = [SpringImpact(k=k, vx=v) for k, v in zip(rng.uniform(1, 100, n), rng.uniform(1, 10, n))]
+
+    def step():
+        for s in springs:
+            s.step(1 / 60)
+        for s in impacts:
+            s.step(0.02)
+    return step
+
+
+@kernel("spring_impact_events", max_n=10000)
+def bench_spring_impact_events(n, rng):
+    from springs import SpringImpact
+    impacts = [SpringImpact(k=k, vx=v, engine="events") for k, v in zip(rng.uniform(1, 100, n), rng.uniform(1, 10, n))]
+
+    def step():
+        for s in impacts:
+            s.step(0.02)
+    return step
+
+
+@kernel("contact_table")
+def bench_contact_table(n, rng):
+    from springs import contact_table
+    k, mass, vx = rng.uniform(1, 100, n), rng.uniform(0.1, 10, n), rng.uniform(0, 10, n)
+
+    def step():
+        contact_table(k, mass, vx)
+    return step
+
+
+@kernel("render_circles", max_n=100000)
+def bench_render_circles(n, rng):
+    import pygame
+    system, width, height = random_gas(n, rng)
+    surface = pygame.Surface((int(width), int(height)))
+
+    def step():
+        system.draw(surface)
+    return step
+
+
+@kernel("render_sprites")
+def bench_render_sprites(n, rng):
+    import pygame
+    from rendering import ParticleRenderer
+    system, width, height = random_gas(n, rng)
+    surface = pygame.Surface((int(width), int(height)))
+    renderer = ParticleRenderer()
+
+    def step():
+        renderer.draw(surface, system)
+    return step
+
+
+def run_case(name, n, steps, budget, seed):
+    setup, _ = KERNELS[name]
+    step = setup(n, np.random.default_rng(seed))
+    step()  # calentamiento
+
+    done = 0
+    start = time.perf_counter()
+    while done < steps:
+        step()
+        done += 1
+        if time.perf_counter() - start > budget:
+            break
+    elapsed = time.perf_counter() - start
+
+    # La memoria se mide aparte porque tracemalloc altera los tiempos
+    step = setup(n, np.random.default_rng(seed))
+    tracemalloc.start()
+    for _ in range(min(done, 3)):
+        step()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "kernel": name,
+        "n": n,
+        "steps": done,
+        "seconds": elapsed,
+        "steps_per_second": done / elapsed if elapsed > 0 else None,
+        "peak_memory_bytes": peak,
+    }
+
+
+def compare(results):
+    """Cociente de pasos por segundo de cada par de COMPARISONS en los casos que corrieron los dos"""
+    speed = {(r["kernel"], r["n"], r["steps"]): r["steps_per_second"]
+             for r in results if r.get("steps_per_second")}
+    comparisons = []
+    for name, baseline in COMPARISONS:
+        for (kernel_name, n, steps), fast in speed.items():
+            slow = speed.get((baseline, n, steps))
+            if kernel_name == name and slow:
+                comparisons.append({"kernel": name, "baseline": baseline, "n": n, "steps": steps,
+                                    "speedup": fast / slow})
+    return comparisons
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de la física")
+    parser.add_argument("--kernels", default=",".join(KERNELS), help="lista separada por comas")
+    parser.add_argument("--counts", default=",".join(map(str, DEFAULT_COUNTS)))
+    parser.add_argument("--steps", default=",".join(map(str, DEFAULT_STEPS)))
+    parser.add_argument("--budget", type=float, default=10.0, help="segundos máximos por caso")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="archivo JSON de salida (por defecto, la salida estándar)")
+    parser.add_argument("--compare", action="store_true",
+                        help="fallar si un núcleo de COMPARISONS es más lento que el que reemplaza")
+    args = parser.parse_args(argv)
+
+    results = []
+    for name in args.kernels.split(","):
+        _, max_n = KERNELS[name]
+        for n in map(int, args.counts.split(",")):
+            for steps in map(int, args.steps.split(",")):
+                if max_n is not None and n > max_n:
+                    results.append({"kernel": name, "n": n, "steps": steps, "skipped": f"n > {max_n}"})
+                    continue
+                result = run_case(name, n, steps, args.budget, args.seed)
+                results.append(result)
+                print(f"{name:20} n={n:<7} steps={result['steps']:<4} "
+                      f"{result['steps_per_second']:12.2f} pasos/s  {result['peak_memory_bytes'] / 1e6:8.2f} MB",
+                      file=sys.stderr)
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.platform(),
+        "processor": platform.processor(),
+        "seed": args.seed,
+        "results": results,
+    }
+    slower = []
+    if args.compare:
+        report["comparisons"] = compare(results)
+        slower = [c for c in report["comparisons"] if c["speedup"] < 1]
+        for c in report["comparisons"]:
+            print(f"{c['kernel']} / {c['baseline']:12} n={c['n']:<7} x{c['speedup']:.2f}", file=sys.stderr)
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+    if slower:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+import math
+import numpy as np
+
+
+def resolve_collision(p1, p2):
+    dx = p2.x - p1.x
+    dy = p2.y - p1.y
+    dist = math.hypot(dx, dy)
+    min_dist = p1.radius + p2.radius
+    if dist < min_dist and dist != 0:
+        nx = dx / dist
+        ny = dy / dist
+        overlap = 0.5 * (min_dist - dist + 1)
+        p1.x -= nx * overlap
+        p1.y -= ny * overlap
+        p2.x += nx * overlap
+        p2.y += ny * overlap
+        tx = -ny
+        ty = nx
+        v1n = p1.vx * nx + p1.vy * ny
+        v1t = p1.vx * tx + p1.vy * ty
+        v2n = p2.vx * nx + p2.vy * ny
+        v2t = p2.vx * tx + p2.vy * ty
+        v1n_post = (v1n * (p1.mass - p2.mass) + 2 * p2.mass * v2n) / (p1.mass + p2.mass)
+        v2n_post = (v2n * (p2.mass - p1.mass) + 2 * p1.mass * v1n) / (p1.mass + p2.mass)
+        p1.vx = v1n_post * nx + v1t * tx
+        p1.vy = v1n_post * ny + v1t * ty
+        p2.vx = v2n_post * nx + v2t * tx
+        p2.vy = v2n_post * ny + v2t * ty
+        return True
+    return False
+
+
+def _empty_pairs():
+    return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+
+def brute_force_pairs(system):
+    """Todos los pares (i, j) con i < j, en el orden del doble bucle original"""
+    i, j = np.triu_indices(len(system), k=1)
+    return i.astype(np.int64), j.astype(np.int64)
+
+
+# Celdas vecinas "hacia adelante": cada par de celdas se visita una sola vez
+_NEIGHBOR_OFFSETS = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+
+def spatial_hash_pairs(system, cell_size=None):
+    """Pares candidatos de partículas que caen en la misma celda o en celdas vecinas
+
+    La rejilla se reconstruye en cada llamada; con cell_size >= 2 * radio máximo
+    cualquier par que se toque queda entre los candidatos.
+    """
+    if len(system) < 2:
+        return _empty_pairs()
+    if cell_size is None:
+        cell_size = 2 * float(system.radius.max())
+    return grid_pairs(system.x, system.y, cell_size)
+
+
+def grid_pairs(x, y, cell_size):
+    """Pares (i, j), i < j, de puntos en celdas vecinas, ordenados como la fuerza bruta"""
+    n = len(x)
+    if n < 2:
+        return _empty_pairs()
+    cx = np.floor(x / cell_size).astype(np.int64)
+    cy = np.floor(y / cell_size).astype(np.int64)
+    cx -= cx.min()
+    cy -= cy.min()
+    # Una fila de margen arriba y abajo para que los vecinos no se confundan de columna
+    rows = int(cy.max()) + 3
+    keys = cx * rows + cy + 1
+
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    positions = np.arange(n)
+
+    found_i = []
+    found_j = []
+    for dx, dy in _NEIGHBOR_OFFSETS:
+        target = sorted_keys + dx * rows + dy
+        end = np.searchsorted(sorted_keys, target, side="right")
+        if dx == 0 and dy == 0:
+            start = positions + 1
+        else:
+            start = np.searchsorted(sorted_keys, target, side="left")
+        counts = np.maximum(end - start, 0)
+        total = int(counts.sum())
+        if total == 0:
+            continue
+        a = np.repeat(positions, counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        b = np.repeat(start, counts) + offsets
+        found_i.append(order[a])
+        found_j.append(order[b])
+
+    if not found_i:
+        return _empty_pairs()
+    i = np.concatenate(found_i)
+    j = np.concatenate(found_j)
+    lo = np.minimum(i, j)
+    hi = np.maximum(i, j)
+    # Mismo orden que la fuerza bruta para obtener resultados idénticos
+    order = np.lexsort((hi, lo))
+    return lo[order], hi[order]
+
+
+BROAD_PHASES = {
+    "brute": brute_force_pairs,
+    "grid": spatial_hash_pairs,
+}
+
+
+def candidate_pairs(system, method="grid"):
+    return BROAD_PHASES[method](system)
+
+
+def resolve_pairs(system, i, j):
+    """Fase fina secuencial: resuelve los pares en el orden recibido"""
+    resolved = 0
+    for a, b in zip(i.tolist(), j.tolist()):
+        resolved += resolve_collision(system[a], system[b])
+    return resolved
+
+
+def _independent_batches(i, j, n):
+    """Coloreado voraz de pares: en cada lote ninguna partícula aparece dos veces
+
+    Un par entra en el lote si es el primer par pendiente de sus dos partículas,
+    así que el reparto sólo depende del orden de los pares (determinista).
+    """
+    remaining = np.arange(len(i))
+    first = np.empty(n, dtype=np.int64)
+    while remaining.size:
+        a = i[remaining]
+        b = j[remaining]
+        ends = np.stack((a, b), axis=1).ravel()
+        particles, position = np.unique(ends, return_index=True)
+        first[particles] = position // 2
+        k = np.arange(remaining.size)
+        chosen = (first[a] == k) & (first[b] == k)
+        yield remaining[chosen]
+        remaining = remaining[~chosen]
+
+
+def resolve_collisions_batch(system, i, j):
+    """Fase fina vectorizada: resuelve de una vez todos los pares que se tocan
+
+    Devuelve cuántos choques se resolvieron.
+    """
+    x, y, vx, vy = system.x, system.y, system.vx, system.vy
+    radius, mass = system.radius, system.mass
+
+    dist = np.hypot(x[j] - x[i], y[j] - y[i])
+    touching = (dist < radius[i] + radius[j]) & (dist != 0)
+    i = i[touching]
+    j = j[touching]
+
+    resolved = 0
+    for batch in _independent_batches(i, j, len(system)):
+        a = i[batch]
+        b = j[batch]
+        # Las posiciones pudieron cambiar en un lote anterior: se vuelve a comprobar
+        dx = x[b] - x[a]
+        dy = y[b] - y[a]
+        dist = np.hypot(dx, dy)
+        min_dist = radius[a] + radius[b]
+        hit = (dist < min_dist) & (dist != 0)
+        if not hit.all():
+            a, b, dx, dy, dist, min_dist = a[hit], b[hit], dx[hit], dy[hit], dist[hit], min_dist[hit]
+        if a.size == 0:
+            continue
+
+        nx = dx / dist
+        ny = dy / dist
+        overlap = 0.5 * (min_dist - dist + 1)
+        x[a] -= nx * overlap
+        y[a] -= ny * overlap
+        x[b] += nx * overlap
+        y[b] += ny * overlap
+
+        tx = -ny
+        ty = nx
+        m1 = mass[a]
+        m2 = mass[b]
+        v1n = vx[a] * nx + vy[a] * ny
+        v1t = vx[a] * tx + vy[a] * ty
+        v2n = vx[b] * nx + vy[b] * ny
+        v2t = vx[b] * tx + vy[b] * ty
+        v1n_post = (v1n * (m1 - m2) + 2 * m2 * v2n) / (m1 + m2)
+        v2n_post = (v2n * (m2 - m1) + 2 * m1 * v1n) / (m1 + m2)
+        vx[a] = v1n_post * nx + v1t * tx
+        vy[a] = v1n_post * ny + v1t * ty
+        vx[b] = v2n_post * nx + v2t * tx
+        vy[b] = v2n_post * ny + v2t * ty
+        resolved += a.size
+    return resolved
+
+
+NARROW_PHASES = {
+    "sequential": resolve_pairs,
+    "batch": resolve_collisions_batch,
+}
+
+
+def resolve_candidates(system, i, j, method="batch"):
+    return NARROW_PHASES[method](system, i, j)
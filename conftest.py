@@ -0,0 +1 @@
+# Las pruebas importan los módulos de la raíz del repositorio (python -m pytest o pytest)
@@ -0,0 +1,223 @@
+"""Observables del gas medidos en línea, con memoria fija
+
+    monitor = GasDiagnostics(particles, width, height)
+    simulation = GasSimulation(particles, width, height, monitor=monitor)
+    ...
+    monitor.summary()
+
+GasSimulation llama a update() en cada subpaso (o en cada paso del motor de
+eventos) con el impulso que recibieron las paredes y los choques nuevos. Se lleva:
+energía cinética y su deriva desde el arranque, momento total, histograma de
+rapideces (con olvido exponencial, para seguir al gas mientras se equilibra) y su
+distancia a Maxwell–Boltzmann en 2D, presión sobre las paredes y frecuencia de
+choques en una ventana de los últimos subpasos. El impulso y los choques se suman
+en cada update(); energía, momento e histograma, que recorren todo el gas, se miden
+cuando pasan sample_interval segundos simulados desde la medida anterior. Así el
+ritmo de medida es el mismo con los dos motores (el de subpasos llama a update()
+varias veces por cuadro, el de eventos una). Entre medidas, lo que muestra el
+monitor es de la última: a lo sumo sample_interval segundos viejo. Todo usa
+arreglos reservados al crear el monitor: actualizar no crea arreglos del tamaño
+del gas.
+pygame se importa sólo para el panel: el monitor sirve sin ventana.
+"""
+import numpy as np
+
+SPEED_BINS = 60
+MAX_PLOT_SPEED = 300  # rapidez del último intervalo; las más rápidas caen en él
+HISTOGRAM_MEMORY = 1.0  # segundos simulados en los que el histograma olvida ~63 % de lo visto
+WINDOW = 180  # actualizaciones que promedian la presión y la frecuencia de choques
+PLOT_REFRESH = 15  # cuadros entre redibujos del panel
+SAMPLE_INTERVAL = 1 / 60  # segundos simulados entre medidas de todo el gas
+
+
+class GasDiagnostics:
+    """Energía, momento, distribución de rapideces, presión y choques del gas"""
+
+    def __init__(self, particles, width, height, bins=SPEED_BINS, max_speed=MAX_PLOT_SPEED,
+                 memory=HISTOGRAM_MEMORY, window=WINDOW, sample_interval=SAMPLE_INTERVAL):
+        self.particles = particles
+        self.perimeter = 2 * (width + height)
+        self.bins = bins
+        self.edges = np.linspace(0, max_speed, bins + 1)
+        self.memory = memory
+        self.sample_interval = sample_interval
+        self._since_sample = 0.0
+        self.histogram = np.zeros(bins)
+        # Ventana circular de (dt, impulso, choques) y sus sumas corrientes
+        self._window = np.zeros((window, 3))
+        self._window_sum = np.zeros(3)
+        self._slot = 0
+        self.time = 0.0
+        self.updates = 0
+        self.wall_impulse = 0.0
+        self.collisions = 0
+        self._resize(len(particles))
+        self._measure(sample=False)
+        self.initial_energy = self.kinetic_energy
+
+    def _resize(self, n):
+        self._speed2 = np.empty(n)
+        self._speed = np.empty(n)
+        self._index = np.empty(n, dtype=np.intp)
+        # Las masas no cambian: Maxwell–Boltzmann se arma por masa distinta, no por partícula
+        self.masses, self.mass_counts = np.unique(self.particles.mass, return_counts=True)
+
+    def _measure(self, sample=True, elapsed=0.0):
+        p = self.particles
+        if len(p) != len(self._speed):
+            self._resize(len(p))
+        speed2, speed = self._speed2, self._speed
+        np.multiply(p.vx, p.vx, out=speed2)
+        np.multiply(p.vy, p.vy, out=speed)
+        speed2 += speed
+        self.kinetic_energy = 0.5 * float(np.dot(p.mass, speed2))
+        self.momentum = (float(np.dot(p.mass, p.vx)), float(np.dot(p.mass, p.vy)))
+        if not sample:
+            return
+        np.sqrt(speed2, out=speed)
+        speed *= self.bins / self.edges[-1]
+        np.minimum(speed, self.bins - 1, out=speed)
+        np.copyto(self._index, speed, casting="unsafe")
+        # El olvido depende del tiempo simulado, no de cuántas medidas hubo
+        self.histogram *= np.exp(-elapsed / self.memory)
+        self.histogram += np.bincount(self._index, minlength=self.bins)
+
+    def update(self, dt, wall_impulse=0.0, collisions=0):
+        """Suma un subpaso de duración dt ya resuelto"""
+        self.time += dt
+        self.updates += 1
+        self.wall_impulse += wall_impulse
+        self.collisions += collisions
+        row = self._window[self._slot]
+        self._window_sum -= row
+        row[:] = dt, wall_impulse, collisions
+        self._window_sum += row
+        self._slot = (self._slot + 1) % len(self._window)
+        if self._slot == 0:
+            # Se recalcula en cada vuelta para que el redondeo no se acumule
+            self._window.sum(axis=0, out=self._window_sum)
+        self._since_sample += dt
+        # Con tolerancia: la suma de los subpasos de un cuadro puede quedar apenas debajo
+        if self._since_sample >= self.sample_interval * (1 - 1e-9):
+            self._measure(elapsed=self._since_sample)
+            self._since_sample = 0.0
+
+    @property
+    def energy_drift(self):
+        """Cambio relativo de la energía cinética desde el arranque"""
+        return self.kinetic_energy / self.initial_energy - 1 if self.initial_energy else 0.0
+
+    @property
+    def wall_pressure(self):
+        """Fuerza por unidad de longitud de pared, promediada en la ventana"""
+        dt, impulse, _ = self._window_sum
+        return impulse / (dt * self.perimeter) if dt > 0 else 0.0
+
+    @property
+    def collision_rate(self):
+        """Choques entre partículas por segundo, promediados en la ventana"""
+        dt, _, collisions = self._window_sum
+        return collisions / dt if dt > 0 else 0.0
+
+    def temperature(self):
+        """kT por equipartición en 2D: E = N kT"""
+        return self.kinetic_energy / max(len(self.particles), 1)
+
+    def speed_distribution(self, out=None):
+        """Fracción del histograma en cada intervalo de rapidez"""
+        if out is None:
+            out = np.empty(self.bins)
+        total = self.histogram.sum()
+        if total == 0:
+            out.fill(0)
+            return out
+        return np.divide(self.histogram, total, out=out)
+
+    def maxwell_boltzmann(self):
+        """Fracción esperada por intervalo en equilibrio a la temperatura actual
+
+        Cada masa m tiene en 2D la distribución acumulada 1 - exp(-m v² / 2kT); como
+        las masas son distintas se mezclan según cuántas partículas hay de cada una.
+        """
+        kT = self.temperature()
+        if kT <= 0:
+            return np.zeros(self.bins)
+        cdf = 1 - np.exp(-np.outer(self.masses, self.edges ** 2) / (2 * kT))
+        cdf[:, -1] = 1  # el último intervalo junta toda la cola
+        return self.mass_counts @ np.diff(cdf, axis=1) / self.mass_counts.sum()
+
+    def maxwell_boltzmann_distance(self):
+        """Distancia de variación total entre el histograma y Maxwell–Boltzmann (0 a 1)"""
+        return 0.5 * float(np.abs(self.speed_distribution() - self.maxwell_boltzmann()).sum())
+
+    def summary(self):
+        self._measure(sample=False)  # energía y momento del estado final, no de la última medida
+        return {
+            "energy_drift": self.energy_drift,
+            "wall_pressure": self.wall_pressure,
+            "collision_rate": self.collision_rate,
+            "wall_impulse": self.wall_impulse,
+            "temperature": self.temperature(),
+            "maxwell_boltzmann_distance": self.maxwell_boltzmann_distance(),
+        }
+
+
+class DiagnosticsPanel:
+    """Gráfico en vivo del histograma de rapideces contra Maxwell–Boltzmann y los valores
+
+    Se redibuja cada refresh cuadros sobre una superficie propia; en los demás sólo se
+    copia, así que dibujarlo no crea superficies ni arreglos en cada cuadro.
+    """
+
+    def __init__(self, monitor, font, size=(300, 200), refresh=PLOT_REFRESH):
+        import pygame
+        self.monitor = monitor
+        self.font = font
+        self.refresh = refresh
+        self.frame = 0
+        self.surface = pygame.Surface(size)
+        self.surface.set_alpha(220)
+        width, height = size
+        self.plot = pygame.Rect(10, 10, width - 20, height - 90)
+        bins = monitor.bins
+        self._fractions = np.empty(bins)
+        self._heights = np.empty(bins, dtype=np.int64)
+        bar_left = self.plot.left + np.arange(bins) * self.plot.width / bins
+        self._bar_left = bar_left.astype(np.int64).tolist()
+        self._bar_width = max(int(self.plot.width / bins) - 1, 1)
+        self._curve = np.empty((bins, 2), dtype=np.int64)
+        self._curve[:, 0] = bar_left + self.plot.width / bins / 2
+
+    def _redraw(self):
+        import pygame
+        monitor, plot, surface = self.monitor, self.plot, self.surface
+        surface.fill((20, 20, 30))
+        fractions = monitor.speed_distribution(self._fractions)
+        expected = monitor.maxwell_boltzmann()
+        scale = plot.height / max(fractions.max(), expected.max(), 1e-12)
+        np.multiply(fractions, scale, out=fractions)
+        np.copyto(self._heights, fractions, casting="unsafe")
+        for left, bar in zip(self._bar_left, self._heights.tolist()):
+            if bar:
+                pygame.draw.rect(surface, (80, 160, 255), (left, plot.bottom - bar, self._bar_width, bar))
+        self._curve[:, 1] = plot.bottom - expected * scale
+        pygame.draw.lines(surface, (255, 200, 0), False, self._curve.tolist(), 2)
+        pygame.draw.line(surface, (200, 200, 200), plot.bottomleft, plot.bottomright)
+        px, py = monitor.momentum
+        lines = [
+            f"Rapidez 0-{monitor.edges[-1]:.0f}  (MB: {monitor.maxwell_boltzmann_distance():.3f})",
+            f"Momento: ({px:.0f}, {py:.0f})   Deriva E: {monitor.energy_drift * 100:+.2f} %",
+            f"Presión: {monitor.wall_pressure:.1f}   Choques/s: {monitor.collision_rate:.1f}",
+        ]
+        y = plot.bottom + 8
+        for line in lines:
+            text = self.font.render(line, True, (255, 255, 255))
+            surface.blit(text, (plot.left, y))
+            y += text.get_height() + 2
+
+    def draw(self, surface, pos):
+        """Copia el panel (redibujándolo si toca); devuelve el área ocupada"""
+        if self.frame % self.refresh == 0:
+            self._redraw()
+        self.frame += 1
+        return surface.blit(self.surface, pos)
@@ -0,0 +1,217 @@
+"""Muchas corridas independientes del gas en paralelo, para estadística de equilibrio
+
+    python ensemble.py --runs 200 --particles 50 100 --radius 5-10 10-20 --seconds 20
+    python ensemble.py --runs 64 --workers 8 --out corridas.jsonl
+
+Con 10 partículas de radios 10-20 en 800x600, cada corrida es la de
+`python main.py --seed N` sin ventana (mismo arranque y mismo paso). Vuelve al
+proceso principal como un resumen chico: energía, momento, choques e histograma
+de rapideces muestreado después del calentamiento. Los resúmenes se
+agregan a medida que llegan, sin guardar trayectorias, y se pueden ir escribiendo
+en un archivo JSON Lines. Cada corrida ocupa un proceso entero, así que el tiempo
+total baja casi en proporción a los núcleos.
+"""
+import argparse
+import itertools
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import numpy as np
+
+WIDTH, HEIGHT = 800, 600
+SPEED_BINS = np.linspace(0, 600, 61)  # bordes del histograma; lo que pasa del último va al último
+
+
+def make_runs(runs, particle_counts=(10,), radius_ranges=((10, 20),), seconds=10.0, dt=1 / 60,
+              warmup=0.5, sample_every=10, engine="substeps", width=WIDTH, height=HEIGHT, first_seed=0):
+    """Especificaciones de runs corridas por cada combinación de cantidad y radios
+
+    warmup es la fracción inicial de la corrida que no entra en el histograma.
+    """
+    specs = []
+    seed = first_seed
+    for num_particles, radius_range in itertools.product(particle_counts, radius_ranges):
+        for _ in range(runs):
+            specs.append({
+                "seed": seed,
+                "num_particles": num_particles,
+                "radius_range": tuple(radius_range),
+                "steps": int(round(seconds / dt)),
+                "dt": dt,
+                "warmup_steps": int(round(warmup * seconds / dt)),
+                "sample_every": sample_every,
+                "engine": engine,
+                "width": width,
+                "height": height,
+            })
+            seed += 1
+    return specs
+
+
+def run_one(spec):
+    """Corre una especificación y devuelve su resumen (se ejecuta en un proceso del pool)"""
+    from gas import GasSimulation, spawn_particles
+    from placement import PlacementError
+
+    summary = dict(spec)
+    start = time.perf_counter()
+    try:
+        particles = spawn_particles(spec["num_particles"], spec["width"], spec["height"],
+                                    rng=np.random.default_rng(spec["seed"]),
+                                    radius_range=spec["radius_range"])
+    except PlacementError as error:
+        summary["error"] = str(error)
+        return summary
+    simulation = GasSimulation(particles, spec["width"], spec["height"], engine=spec["engine"])
+    initial_energy = particles.kinetic_energy()
+    histogram = np.zeros(len(SPEED_BINS) - 1, dtype=np.int64)
+    top = SPEED_BINS[-1] - 1e-9
+    for step in range(1, spec["steps"] + 1):
+        simulation.step(spec["dt"])
+        if step > spec["warmup_steps"] and step % spec["sample_every"] == 0:
+            speed = np.minimum(np.hypot(particles.vx, particles.vy), top)
+            histogram += np.histogram(speed, SPEED_BINS)[0]
+    diagnostics = simulation.diagnostics()
+    summary.update({
+        "initial_kinetic_energy": initial_energy,
+        "kinetic_energy": diagnostics["kinetic_energy"],
+        "momentum": diagnostics["momentum"],
+        "collisions": diagnostics["collisions"],
+        "speed_histogram": histogram.tolist(),
+        "wall_time": time.perf_counter() - start,
+    })
+    return summary
+
+
+def run_ensemble(specs, workers=None, max_pending=None):
+    """Genera los resúmenes a medida que terminan (en cualquier orden)
+
+    Como mucho max_pending corridas encargadas a la vez (por defecto 4 por proceso),
+    así que ni las especificaciones ni los resultados se acumulan en memoria.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 4 * workers
+    specs = iter(specs)
+    with ProcessPoolExecutor(workers) as pool:
+        pending = {pool.submit(run_one, spec) for spec in itertools.islice(specs, max_pending)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+            pending |= {pool.submit(run_one, spec) for spec in itertools.islice(specs, len(done))}
+
+
+class _Running:
+    """Media y varianza en una pasada (Welford)"""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value):
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+
+    def result(self):
+        std = math.sqrt(self.m2 / (self.n - 1)) if self.n > 1 else 0.0
+        return {"mean": self.mean, "std": std}
+
+
+class EnsembleStats:
+    """Estadística agregada por grupo (cantidad de partículas, radios)"""
+
+    def __init__(self):
+        self.groups = {}
+        self.failed = 0
+        self.wall_time = 0.0
+
+    def add(self, summary):
+        if "error" in summary:
+            self.failed += 1
+            return
+        key = (summary["num_particles"], tuple(summary["radius_range"]))
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = {
+                "runs": 0,
+                "energy_per_particle": _Running(),
+                "energy_drift": _Running(),
+                "momentum_x": _Running(),
+                "momentum_y": _Running(),
+                "collisions": _Running(),
+                "speed_histogram": np.zeros(len(SPEED_BINS) - 1, dtype=np.int64),
+            }
+        group["runs"] += 1
+        group["energy_per_particle"].add(summary["kinetic_energy"] / summary["num_particles"])
+        group["energy_drift"].add(summary["kinetic_energy"] / summary["initial_kinetic_energy"] - 1)
+        group["momentum_x"].add(summary["momentum"][0])
+        group["momentum_y"].add(summary["momentum"][1])
+        group["collisions"].add(summary["collisions"])
+        group["speed_histogram"] += summary["speed_histogram"]
+        self.wall_time += summary["wall_time"]
+
+    def result(self):
+        groups = []
+        for (num_particles, radius_range), group in self.groups.items():
+            histogram = group["speed_histogram"]
+            centers = (SPEED_BINS[:-1] + SPEED_BINS[1:]) / 2
+            total = histogram.sum()
+            groups.append({
+                "num_particles": num_particles,
+                "radius_range": list(radius_range),
+                "runs": group["runs"],
+                **{name: value.result() for name, value in group.items() if isinstance(value, _Running)},
+                "mean_speed": float(np.dot(centers, histogram) / total) if total else 0.0,
+                "speed_bins": SPEED_BINS.tolist(),
+                "speed_histogram": histogram.tolist(),
+            })
+        return {"groups": groups, "failed": self.failed, "cpu_time": self.wall_time}
+
+
+def _radius_range(text):
+    low, _, high = text.partition("-")
+    return int(low), int(high or low)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Conjunto de corridas del gas en paralelo")
+    parser.add_argument("--runs", type=int, default=16, help="corridas por combinación")
+    parser.add_argument("--particles", type=int, nargs="+", default=[10])
+    parser.add_argument("--radius", type=_radius_range, nargs="+", default=[(10, 20)],
+                        help="radios mínimo-máximo, p. ej. 5-10")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--dt", type=float, default=1 / 60)
+    parser.add_argument("--warmup", type=float, default=0.5, help="fracción inicial sin muestrear")
+    parser.add_argument("--engine", choices=["substeps", "events"], default="substeps")
+    parser.add_argument("--width", type=int, default=WIDTH)
+    parser.add_argument("--height", type=int, default=HEIGHT)
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--out", help="archivo JSON Lines con el resumen de cada corrida")
+    args = parser.parse_args(argv)
+
+    specs = make_runs(args.runs, args.particles, args.radius, args.seconds, args.dt, args.warmup,
+                      engine=args.engine, width=args.width, height=args.height, first_seed=args.first_seed)
+    stats = EnsembleStats()
+    start = time.perf_counter()
+    out = open(args.out, "w") if args.out else None
+    try:
+        for summary in run_ensemble(specs, args.workers):
+            stats.add(summary)
+            if out is not None:
+                out.write(json.dumps(summary) + "\n")
+    finally:
+        if out is not None:
+            out.close()
+    result = stats.result()
+    result["wall_time"] = time.perf_counter() - start
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
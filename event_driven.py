@@ -0,0 +1,238 @@
+import heapq
+import math
+import numpy as np
+
+# Paredes y bordes de celda como "compañero" de un evento
+VERTICAL_WALL = -1
+HORIZONTAL_WALL = -2
+CELL_X = -3
+CELL_Y = -4
+CELL_OCCUPANCY = 2  # partículas por celda buscadas (el lado nunca baja de 2 * radio máximo)
+
+
+class EventDrivenGas:
+    """Gas de discos duros que salta de choque en choque con tiempos exactos
+
+    Cada partícula guarda el instante de su último estado (last_time), así que sólo
+    se mueven las partículas que participan en un evento. Los eventos viejos se
+    descartan al sacarlos de la cola comparando el contador de choques.
+
+    La caja se parte en celdas de lado >= 2 * radio máximo: dos discos sólo pueden
+    tocarse si están en celdas vecinas, así que cada predicción mira las 9 celdas
+    alrededor y no todo el gas. Salir de una celda es un evento más (sin choque),
+    que cambia la partícula de celda y vuelve a predecir. Así cada evento cuesta
+    lo mismo con cualquier N y arrancar es O(N) en vez de O(N²).
+    """
+
+    def __init__(self, system, width, height):
+        self.system = system
+        self.width = width
+        self.height = height
+        self.time = 0.0
+        n = len(system)
+        self.last_time = np.zeros(n)
+        self.counts = np.zeros(n, dtype=np.int64)
+        self.collisions = 0
+        self.wall_collisions = 0
+        self.wall_impulse = 0.0  # suma de 2 m |v| de los rebotes en paredes (para la presión)
+        self.queue = []
+        self._seq = 0
+        # Celdas chicas en un gas ralo sólo suman cruces: se busca unas CELL_OCCUPANCY por celda
+        side = max(2 * float(system.radius.max()), math.sqrt(width * height * CELL_OCCUPANCY / n)) if n else 1.0
+        self.nx = max(int(width // side), 1)
+        self.ny = max(int(height // side), 1)
+        self.cell_w = width / self.nx
+        self.cell_h = height / self.ny
+        self.cell_x = np.clip((system.x // self.cell_w).astype(np.int64), 0, self.nx - 1)
+        self.cell_y = np.clip((system.y // self.cell_h).astype(np.int64), 0, self.ny - 1)
+        self.cells = [set() for _ in range(self.nx * self.ny)]
+        for i, (cx, cy) in enumerate(zip(self.cell_x.tolist(), self.cell_y.tolist())):
+            self.cells[cy * self.nx + cx].add(i)
+        for i in range(n):
+            self._predict(i)
+
+    def _position(self, i):
+        s = self.system
+        dt = self.time - self.last_time[i]
+        return s.x[i] + s.vx[i] * dt, s.y[i] + s.vy[i] * dt
+
+    def _bring_to_now(self, i):
+        s = self.system
+        s.x[i], s.y[i] = self._position(i)
+        self.last_time[i] = self.time
+
+    def _wall_time(self, i):
+        s = self.system
+        x, y = self._position(i)
+        r = s.radius[i]
+        vx = s.vx[i]
+        vy = s.vy[i]
+        tx = ty = math.inf
+        if vx > 0:
+            tx = (self.width - r - x) / vx
+        elif vx < 0:
+            tx = (r - x) / vx
+        if vy > 0:
+            ty = (self.height - r - y) / vy
+        elif vy < 0:
+            ty = (r - y) / vy
+        if tx <= ty:
+            return max(tx, 0.0), VERTICAL_WALL
+        return max(ty, 0.0), HORIZONTAL_WALL
+
+    def _cell_time(self, i):
+        """Cuándo sale i de su celda (por un borde que no sea pared)"""
+        s = self.system
+        x, y = self._position(i)
+        cx = self.cell_x[i]
+        cy = self.cell_y[i]
+        vx = s.vx[i]
+        vy = s.vy[i]
+        tx = ty = math.inf
+        if vx > 0 and cx < self.nx - 1:
+            tx = ((cx + 1) * self.cell_w - x) / vx
+        elif vx < 0 and cx > 0:
+            tx = (cx * self.cell_w - x) / vx
+        if vy > 0 and cy < self.ny - 1:
+            ty = ((cy + 1) * self.cell_h - y) / vy
+        elif vy < 0 and cy > 0:
+            ty = (cy * self.cell_h - y) / vy
+        if tx <= ty:
+            return max(tx, 0.0), CELL_X
+        return max(ty, 0.0), CELL_Y
+
+    def _cross_cell(self, i, axis):
+        s = self.system
+        cells = self.cells
+        cx = self.cell_x[i]
+        cy = self.cell_y[i]
+        cells[cy * self.nx + cx].remove(i)
+        if axis == CELL_X:
+            cx += 1 if s.vx[i] > 0 else -1
+            self.cell_x[i] = cx
+        else:
+            cy += 1 if s.vy[i] > 0 else -1
+            self.cell_y[i] = cy
+        cells[cy * self.nx + cx].add(i)
+
+    def _neighbours(self, i):
+        """Discos en las (hasta) 9 celdas alrededor de la de i, sin contar a i"""
+        cx = int(self.cell_x[i])
+        cy = int(self.cell_y[i])
+        found = []
+        for row in range(max(cy - 1, 0), min(cy + 2, self.ny)):
+            start = row * self.nx
+            for cell in range(start + max(cx - 1, 0), start + min(cx + 2, self.nx)):
+                found.extend(self.cells[cell])
+        found.remove(i)
+        return np.array(found, dtype=np.intp)
+
+    def _disk_time(self, i):
+        """Primer choque de i contra los discos de las celdas vecinas (vectorizado)"""
+        s = self.system
+        others = self._neighbours(i)
+        if not len(others):
+            return math.inf, -1
+        ago = self.time - self.last_time[others]
+        xi, yi = self._position(i)
+        vx = s.vx[others]
+        vy = s.vy[others]
+        dx = s.x[others] + vx * ago - xi
+        dy = s.y[others] + vy * ago - yi
+        dvx = vx - s.vx[i]
+        dvy = vy - s.vy[i]
+        dvdr = dx * dvx + dy * dvy
+        dvdv = dvx * dvx + dvy * dvy
+        drdr = dx * dx + dy * dy
+        sigma = s.radius[others] + s.radius[i]
+        d = dvdr * dvdr - dvdv * (drdr - sigma * sigma)
+        approaching = (dvdr < 0) & (d >= 0)
+        if not approaching.any():
+            return math.inf, -1
+        t = np.full(len(others), math.inf)
+        k = approaching
+        t[k] = -(dvdr[k] + np.sqrt(d[k])) / dvdv[k]
+        j = int(np.argmin(t))
+        return max(float(t[j]), 0.0), int(others[j])
+
+    def _predict(self, i):
+        # Sólo se guarda el evento más próximo de i; si se invalida, se vuelve a predecir
+        t_disk, j = self._disk_time(i)
+        t_wall, wall = self._wall_time(i)
+        t_cell, axis = self._cell_time(i)
+        if t_wall <= t_disk:
+            t, partner, partner_count = t_wall, wall, 0
+        else:
+            t, partner, partner_count = t_disk, j, self.counts[j]
+        if t_cell < t:
+            t, partner, partner_count = t_cell, axis, 0
+        if math.isinf(t):
+            return
+        self._seq += 1
+        heapq.heappush(self.queue, (self.time + t, self._seq, i, partner, self.counts[i], partner_count))
+
+    def _bounce_disks(self, i, j):
+        s = self.system
+        self._bring_to_now(i)
+        self._bring_to_now(j)
+        dx = s.x[j] - s.x[i]
+        dy = s.y[j] - s.y[i]
+        dvx = s.vx[j] - s.vx[i]
+        dvy = s.vy[j] - s.vy[i]
+        dist = math.hypot(dx, dy)
+        mi = s.mass[i]
+        mj = s.mass[j]
+        impulse = 2 * mi * mj * (dx * dvx + dy * dvy) / ((mi + mj) * dist)
+        fx = impulse * dx / dist
+        fy = impulse * dy / dist
+        s.vx[i] += fx / mi
+        s.vy[i] += fy / mi
+        s.vx[j] -= fx / mj
+        s.vy[j] -= fy / mj
+
+    def _bounce_wall(self, i, wall):
+        s = self.system
+        self._bring_to_now(i)
+        if wall == VERTICAL_WALL:
+            self.wall_impulse += 2 * s.mass[i] * abs(s.vx[i])
+            s.vx[i] *= -1
+        else:
+            self.wall_impulse += 2 * s.mass[i] * abs(s.vy[i])
+            s.vy[i] *= -1
+
+    def advance(self, t_end):
+        """Procesa todos los eventos hasta t_end y deja el sistema en ese instante"""
+        while self.queue and self.queue[0][0] <= t_end:
+            t, _, i, partner, count_i, count_partner = heapq.heappop(self.queue)
+            if self.counts[i] != count_i:
+                continue  # i ya cambió: su predicción vigente está en otro evento
+            self.time = t
+            if partner >= 0 and self.counts[partner] != count_partner:
+                self._predict(i)
+                continue
+            if partner >= 0:
+                self._bounce_disks(i, partner)
+                self.counts[i] += 1
+                self.counts[partner] += 1
+                self.collisions += 1
+                self._predict(i)
+                self._predict(partner)
+            elif partner in (CELL_X, CELL_Y):
+                # Cambiar de celda no cambia la velocidad: los eventos con i siguen valiendo
+                self._cross_cell(i, partner)
+                self._predict(i)
+            else:
+                self._bounce_wall(i, partner)
+                self.counts[i] += 1
+                self.wall_collisions += 1
+                self._predict(i)
+
+        self.time = t_end
+        s = self.system
+        ago = t_end - self.last_time
+        s.x += s.vx * ago
+        s.y += s.vy * ago
+        self.last_time[:] = t_end
+
+    def step(self, dt):
+        self.advance(self.time + dt)
@@ -0,0 +1,102 @@
+import random
+import math
+import numpy as np
+from particles import ParticleSystem
+from collisions import candidate_pairs, resolve_candidates
+from event_driven import EventDrivenGas
+from placement import place_disks
+from profiling import profiler
+
+NUM_PARTICLES = 10
+MAX_SPEED = 300
+SUBSTEPS = 3
+
+
+def spawn_particles(num_particles, width, height, method="auto", rng=None, radius_range=(10, 20)):
+    """Crea el gas sin solapamientos; lanza PlacementError si no caben todas
+
+    method: "auto", "random" (dardos con rejilla) o "lattice" (red hexagonal con ruido)
+    radius_range: radios enteros mínimo y máximo (incluidos), repartidos uniformemente
+    """
+    if rng is None:
+        # Sigue la semilla de random para que random.seed(...) reproduzca la corrida
+        rng = np.random.default_rng(random.getrandbits(64))
+    radius = rng.integers(radius_range[0], radius_range[1] + 1, num_particles).astype(float)
+    mass = radius ** 2
+    x, y = place_disks(radius, width, height, rng, method)
+    angle = rng.uniform(0, 2 * math.pi, num_particles)
+    speed = rng.uniform(50, 150, num_particles)
+    particles = ParticleSystem(num_particles)
+    particles.extend(x, y, speed * np.cos(angle), speed * np.sin(angle), radius, mass,
+                     rng.integers(100, 256, (num_particles, 3)))
+    return particles
+
+
+class GasSimulation:
+    """Física del gas de partículas, sin nada de pygame
+
+    engine: "substeps" (pasos fijos) o "events" (choques con tiempos exactos)
+    broad_phase: "grid" (rejilla espacial) o "brute" (todos contra todos)
+    narrow_phase: "batch" (vectorizada) o "sequential" (par a par)
+    monitor: diagnostics.GasDiagnostics opcional, actualizado en cada subpaso
+    """
+
+    def __init__(self, particles, width, height, engine="substeps", broad_phase="grid",
+                 narrow_phase="batch", max_speed=MAX_SPEED, substeps=SUBSTEPS, monitor=None):
+        self.particles = particles
+        self.width = width
+        self.height = height
+        self.engine = engine
+        self.broad_phase = broad_phase
+        self.narrow_phase = narrow_phase
+        self.max_speed = max_speed
+        self.substeps = substeps
+        self.time = 0.0
+        self.steps = 0
+        self.collisions = 0
+        self.monitor = monitor
+        # El motor de eventos no necesita subpasos ni límite de velocidad:
+        # el cuadro sólo decide hasta qué instante se avanza la física
+        self.events = EventDrivenGas(particles, width, height) if engine == "events" else None
+
+    def step(self, dt):
+        particles = self.particles
+        monitor = self.monitor
+        if self.events is not None:
+            impulse = self.events.wall_impulse
+            self.events.step(dt)
+            if monitor is not None:
+                monitor.update(dt, self.events.wall_impulse - impulse, self.events.collisions - self.collisions)
+            self.collisions = self.events.collisions
+        else:
+            step_dt = dt / self.substeps
+            for _ in range(self.substeps):
+                particles.move(step_dt)
+                impulse = particles.wall_collision(self.width, self.height)
+                particles.clamp_speed(self.max_speed)
+                # La rejilla se reconstruye en cada subpaso con celdas de 2 * radio máximo
+                with profiler.section("broad_phase"):
+                    i, j = candidate_pairs(particles, self.broad_phase)
+                profiler.count("pairs", len(i))
+                with profiler.section("narrow_phase"):
+                    collisions = resolve_candidates(particles, i, j, self.narrow_phase)
+                self.collisions += collisions
+                if monitor is not None:
+                    with profiler.section("diagnostics"):
+                        monitor.update(step_dt, impulse, collisions)
+        self.time += dt
+        self.steps += 1
+
+    def diagnostics(self):
+        p = self.particles
+        result = {
+            "time": self.time,
+            "steps": self.steps,
+            "num_particles": len(p),
+            "kinetic_energy": p.kinetic_energy(),
+            "momentum": [float(np.dot(p.mass, p.vx)), float(np.dot(p.mass, p.vy))],
+            "collisions": int(self.collisions),
+        }
+        if self.monitor is not None:
+            result.update(self.monitor.summary())
+        return result
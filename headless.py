@@ -0,0 +1,267 @@
+"""Ejecución sin ventana de todas las simulaciones (desde Python o desde la terminal)
+
+    python headless.py gas --particles 300 --seconds 10
+    python headless.py gas --particles 200 --seconds 30 --diagnostics
+    python headless.py gas --particles 5000 --width 4000 --height 3000 --seconds 600 --record gas.traj --stride 6 --float32
+    python headless.py spring --k 200 --mass 5 --steps 600
+    python headless.py spring --k 500 --integrator exact --seconds 3600 --dt 60
+    python headless.py impact --vx 8 --seconds 3
+    python headless.py impact-sweep --k 10 50 100 --mass 0.5 1 --vx 2 5 8
+    python headless.py projectile --masa 2 --angulo 45 --potencia 600 --objetivo-x 40 --objetivo-y 10
+    python headless.py volley --projectiles 1000 --targets 200 --seconds 10
+
+Con --record, gas, spring e impact graban cada paso (uno de cada --stride) en un
+archivo que después se mira con `python replay.py gas.traj` (ver recording.py).
+--float32 es sólo del gas: los resortes graban escalares, que quedan en float64.
+"""
+import argparse
+import json
+import time
+
+WIDTH, HEIGHT = 800, 600
+
+
+def _num_steps(steps, seconds, dt):
+    if steps is None and seconds is None:
+        raise ValueError("hay que indicar steps o seconds")
+    if steps is None:
+        steps = int(round(seconds / dt))
+    return steps
+
+
+def run_gas(num_particles=10, steps=None, seconds=None, dt=1 / 60, engine="substeps",
+            broad_phase="grid", narrow_phase="batch", width=WIDTH, height=HEIGHT, seed=None,
+            placement="auto", diagnostics=False, record=None, stride=1, quantize=False):
+    import numpy as np
+    from gas import GasSimulation, spawn_particles
+    from diagnostics import GasDiagnostics
+    from recording import gas_writer, record_gas
+
+    steps = _num_steps(steps, seconds, dt)
+    # Misma semilla y mismo dt que `python main.py --seed N`: se obtiene la misma corrida
+    particles = spawn_particles(num_particles, width, height, placement, np.random.default_rng(seed))
+    monitor = GasDiagnostics(particles, width, height) if diagnostics else None
+    simulation = GasSimulation(particles, width, height, engine=engine,
+                               broad_phase=broad_phase, narrow_phase=narrow_phase, monitor=monitor)
+    initial = simulation.diagnostics()
+    writer = gas_writer(record, simulation, dt, stride=stride, quantize=quantize) if record else None
+    start = time.perf_counter()
+    if writer is not None:
+        record_gas(writer, simulation)
+    for _ in range(steps):
+        simulation.step(dt)
+        if writer is not None:
+            record_gas(writer, simulation)
+    elapsed = time.perf_counter() - start
+    result = simulation.diagnostics()
+    if writer is not None:
+        writer.close()
+        result["recorded_frames"] = writer.frames
+    result["initial_kinetic_energy"] = initial["kinetic_energy"]
+    result["wall_time"] = elapsed
+    result["state"] = {
+        "x": particles.x.tolist(),
+        "y": particles.y.tolist(),
+        "vx": particles.vx.tolist(),
+        "vy": particles.vy.tolist(),
+    }
+    return result
+
+
+def run_vertical_spring(k=100, mass=20, steps=None, seconds=None, dt=1 / 60, integrator="euler",
+                        energy_tolerance=None, record=None, stride=1):
+    from springs import VerticalSpring
+    from recording import spring_writer, record_spring
+
+    steps = _num_steps(steps, seconds, dt)
+    spring = VerticalSpring((WIDTH // 2, 100), rest_length=150, k=k, mass=mass, radius=15, floor=HEIGHT,
+                            integrator=integrator, energy_tolerance=energy_tolerance)
+    writer = None
+    if record:
+        writer = spring_writer(record, spring, dt, (WIDTH, HEIGHT), stride=stride)
+        record_spring(writer, spring, 0, 0.0)
+    for step in range(1, steps + 1):
+        spring.step(dt)
+        if writer is not None:
+            record_spring(writer, spring, step, step * dt)
+    result = spring.diagnostics()
+    result["time"] = steps * dt
+    if writer is not None:
+        writer.close()
+        result["recorded_frames"] = writer.frames
+    return result
+
+
+def run_spring_impact(k=50.0, mass=1.0, vx=5.0, steps=None, seconds=None, dt=0.02, engine="steps",
+                      record=None, stride=1):
+    from springs import SpringImpact
+    from recording import impact_writer, record_impact
+
+    steps = _num_steps(steps, seconds, dt)
+    impact = SpringImpact(k, mass, vx, engine=engine)
+    writer = None
+    if record:
+        writer = impact_writer(record, impact, dt, stride=stride)
+        record_impact(writer, impact, 0)
+    for step in range(1, steps + 1):
+        impact.step(dt)
+        if writer is not None:
+            record_impact(writer, impact, step)
+    if writer is not None:
+        writer.close()
+    result = impact.diagnostics()
+    result["time"] = steps * dt
+    result["peak_restoring_force"] = impact.peak_force
+    if engine == "events":
+        result["contacts"] = impact.contacts
+    if writer is not None:
+        result["recorded_frames"] = writer.frames
+    return result
+
+
+def run_impact_sweep(k_values, mass_values, vx_values):
+    """Tabla de choques para todas las combinaciones de k, masa y vx, sin simular"""
+    import numpy as np
+    from springs import contact_table
+
+    k, mass, vx = np.meshgrid(k_values, mass_values, vx_values, indexing="ij")
+    table = contact_table(k, mass, vx)
+    columns = {"k": k, "mass": mass, "vx": vx, **table}
+    return [dict(zip(columns, map(float, row))) for row in zip(*(c.ravel() for c in columns.values()))]
+
+
+def run_projectile(masa, angulo, potencia, objetivo_x_m, objetivo_y_m, arrastre=0.0):
+    from juego_tiro_parabolico import lanzar, tiempo_impacto
+
+    tiro = lanzar(masa, angulo, potencia, arrastre)
+    t = tiempo_impacto(tiro, objetivo_x_m, objetivo_y_m)
+    apex_time, apex_x, apex_y = tiro.apice
+    return {
+        "hit": t is not None,
+        "time": t if t is not None else tiro.duracion,
+        "point": list(tiro.posicion(t if t is not None else tiro.duracion)),
+        "flight_time": tiro.duracion,
+        "apex": [apex_x, apex_y],
+    }
+
+
+def run_volley(num_projectiles=300, num_targets=40, steps=None, seconds=None, dt=1 / 60, seed=None):
+    import numpy as np
+    from juego_tiro_parabolico import (GRAVEDAD, RADIO_PROYECTIL, ESCALA, OBJETIVO_ANCHO_M,
+                                       OBJETIVO_ALTO_M, X_MAX_M)
+    from rafaga import Rafaga
+
+    steps = _num_steps(steps, seconds, dt)
+    volley = Rafaga(num_projectiles, num_targets, np.random.default_rng(seed), RADIO_PROYECTIL / ESCALA,
+                    OBJETIVO_ANCHO_M, OBJETIVO_ALTO_M, X_MAX_M, GRAVEDAD, max(num_projectiles // 30, 1))
+    start = time.perf_counter()
+    for _ in range(steps):
+        volley.step(dt)
+    elapsed = time.perf_counter() - start
+    return {
+        "time": steps * dt,
+        "steps": steps,
+        "in_flight": len(volley),
+        "launched": volley.lanzados,
+        "hits": volley.aciertos,
+        "fallen": volley.caidos,
+        "wall_time": elapsed,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulaciones sin ventana")
+    sub = parser.add_subparsers(dest="scene", required=True)
+
+    def add_duration(p, dt):
+        p.add_argument("--steps", type=int)
+        p.add_argument("--seconds", type=float)
+        p.add_argument("--dt", type=float, default=dt)
+
+    def add_recording(p):
+        p.add_argument("--record", metavar="ARCHIVO", help="grabar la corrida (se ve con replay.py)")
+        p.add_argument("--stride", type=int, default=1, help="grabar uno de cada N pasos")
+
+    gas = sub.add_parser("gas", help="gas de partículas (main_simulation)")
+    gas.add_argument("--particles", type=int, default=10)
+    gas.add_argument("--engine", choices=["substeps", "events"], default="substeps")
+    gas.add_argument("--broad-phase", choices=["grid", "brute"], default="grid")
+    gas.add_argument("--narrow-phase", choices=["batch", "sequential"], default="batch")
+    gas.add_argument("--placement", choices=["auto", "random", "lattice"], default="auto")
+    gas.add_argument("--width", type=int, default=WIDTH)
+    gas.add_argument("--height", type=int, default=HEIGHT)
+    gas.add_argument("--seed", type=int)
+    gas.add_argument("--state", action="store_true", help="incluir posiciones y velocidades finales")
+    gas.add_argument("--diagnostics", action="store_true",
+                     help="medir presión, frecuencia de choques y distancia a Maxwell–Boltzmann")
+    add_duration(gas, 1 / 60)
+    add_recording(gas)
+    gas.add_argument("--float32", action="store_true", help="grabar posiciones y velocidades en float32")
+
+    spring = sub.add_parser("spring", help="resorte vertical (run_spring_simulation)")
+    spring.add_argument("--k", type=float, default=100)
+    spring.add_argument("--mass", type=float, default=20)
+    spring.add_argument("--integrator", choices=["euler", "verlet", "rk4", "exact"], default="euler")
+    spring.add_argument("--energy-tolerance", type=float, help="error de energía máximo por paso (parte los pasos)")
+    add_duration(spring, 1 / 60)
+    add_recording(spring)
+
+    impact = sub.add_parser("impact", help="choque contra resorte horizontal (simulacion_de_choque)")
+    impact.add_argument("--k", type=float, default=50.0)
+    impact.add_argument("--mass", type=float, default=1.0)
+    impact.add_argument("--vx", type=float, default=5.0)
+    impact.add_argument("--engine", choices=["steps", "events"], default="steps")
+    add_duration(impact, 0.02)
+    add_recording(impact)
+
+    sweep = sub.add_parser("impact-sweep", help="duración y fuerza máxima del choque para muchos k, masas y vx")
+    sweep.add_argument("--k", type=float, nargs="+", default=[50.0])
+    sweep.add_argument("--mass", type=float, nargs="+", default=[1.0])
+    sweep.add_argument("--vx", type=float, nargs="+", default=[5.0])
+
+    projectile = sub.add_parser("projectile", help="tiro parabólico (juego_tiro_parabolico)")
+    projectile.add_argument("--masa", type=float, required=True)
+    projectile.add_argument("--angulo", type=float, required=True)
+    projectile.add_argument("--potencia", type=float, required=True)
+    projectile.add_argument("--objetivo-x", type=float, required=True)
+    projectile.add_argument("--objetivo-y", type=float, required=True)
+    projectile.add_argument("--arrastre", type=float, default=0.0, help="rozamiento del aire en kg/m")
+
+    volley = sub.add_parser("volley", help="modo ráfaga del tiro parabólico (prueba de carga)")
+    volley.add_argument("--projectiles", type=int, default=300)
+    volley.add_argument("--targets", type=int, default=40)
+    volley.add_argument("--seed", type=int)
+    add_duration(volley, 1 / 60)
+
+    args = parser.parse_args(argv)
+    if "steps" in args and args.steps is None and args.seconds is None:
+        parser.error("hay que indicar --steps o --seconds")
+    if args.scene == "gas":
+        from placement import PlacementError
+        try:
+            result = run_gas(args.particles, args.steps, args.seconds, args.dt, args.engine,
+                             args.broad_phase, args.narrow_phase, args.width, args.height,
+                             args.seed, args.placement, args.diagnostics, args.record, args.stride,
+                             args.float32)
+        except PlacementError as error:
+            parser.error(f"{error} (probar con menos partículas o una caja más grande)")
+        if not args.state:
+            del result["state"]
+    elif args.scene == "spring":
+        result = run_vertical_spring(args.k, args.mass, args.steps, args.seconds, args.dt, args.integrator,
+                                     args.energy_tolerance, args.record, args.stride)
+    elif args.scene == "impact":
+        result = run_spring_impact(args.k, args.mass, args.vx, args.steps, args.seconds, args.dt,
+                                   args.engine, args.record, args.stride)
+    elif args.scene == "impact-sweep":
+        result = run_impact_sweep(args.k, args.mass, args.vx)
+    elif args.scene == "volley":
+        result = run_volley(args.projectiles, args.targets, args.steps, args.seconds, args.dt, args.seed)
+    else:
+        result = run_projectile(args.masa, args.angulo, args.potencia, args.objetivo_x, args.objetivo_y,
+                                args.arrastre)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Integradores para una coordenada con aceleración que depende sólo de la posición
+
+Cada integrador recibe (x, v, dt, accel) y devuelve la nueva (x, v); accel(x) da la
+aceleración. El oscilador lineal sin rozamiento tiene además solución exacta, con la
+que se pueden buscar los cruces por un nivel sin importar el tamaño del paso.
+"""
+import math
+
+
+def symplectic_euler(x, v, dt, accel):
+    """Euler semi-implícito: primero la velocidad, después la posición con la velocidad nueva"""
+    v = v + accel(x) * dt
+    return x + v * dt, v
+
+
+def velocity_verlet(x, v, dt, accel):
+    """Verlet de velocidades: simpléctico y de segundo orden, la energía oscila sin derivar"""
+    a0 = accel(x)
+    x = x + v * dt + 0.5 * a0 * dt * dt
+    return x, v + 0.5 * (a0 + accel(x)) * dt
+
+
+def rk4(x, v, dt, accel):
+    """Runge-Kutta clásico de cuarto orden (preciso, pero la energía deriva poco a poco)"""
+    k1x, k1v = v, accel(x)
+    k2x, k2v = v + 0.5 * dt * k1v, accel(x + 0.5 * dt * k1x)
+    k3x, k3v = v + 0.5 * dt * k2v, accel(x + 0.5 * dt * k2x)
+    k4x, k4v = v + dt * k3v, accel(x + dt * k3x)
+    return (x + dt / 6 * (k1x + 2 * k2x + 2 * k3x + k4x),
+            v + dt / 6 * (k1v + 2 * k2v + 2 * k3v + k4v))
+
+
+INTEGRATORS = {
+    "euler": symplectic_euler,
+    "verlet": velocity_verlet,
+    "rk4": rk4,
+}
+
+
+class Harmonic:
+    """Oscilación exacta x(t) = center + amplitude cos(omega t - phase)
+
+    Se trabaja con el ángulo theta = omega t - phase: el estado actual es theta0 = -phase.
+    """
+
+    def __init__(self, x, v, omega, center):
+        self.omega = omega
+        self.center = center
+        self.amplitude = math.hypot(x - center, v / omega)
+        self.theta0 = -math.atan2(v / omega, x - center)
+
+    def state(self, theta):
+        return (self.center + self.amplitude * math.cos(theta),
+                -self.amplitude * self.omega * math.sin(theta))
+
+    def theta(self, t):
+        return self.theta0 + self.omega * t
+
+    def time(self, theta):
+        return (theta - self.theta0) / self.omega
+
+    def _level_angle(self, level):
+        # Ángulo en [0, π] con cos = (level - center) / amplitude, o None si no lo alcanza
+        if self.amplitude == 0:
+            return None
+        c = (level - self.center) / self.amplitude
+        if not -1 < c < 1:
+            return None
+        return math.acos(c)
+
+    def crossings(self, level, theta_a, theta_b):
+        """Cuántas veces pasa por level con theta en (theta_a, theta_b] (sin contar roces)"""
+        beta = self._level_angle(level)
+        if beta is None:
+            return 0
+        turn = 2 * math.pi
+
+        def up_to(theta):
+            return math.floor((theta - beta) / turn) + math.floor((theta + beta) / turn)
+        return up_to(theta_b) - up_to(theta_a)
+
+    def first_reach(self, level, theta_a, increasing):
+        """Primer theta > theta_a en que x llega a level creciendo (o decreciendo), o None"""
+        beta = self._level_angle(level)
+        if beta is None:
+            return None
+        # x crece cuando sin(theta) < 0: raíces -beta + 2πn; decrece en beta + 2πn
+        base = -beta if increasing else beta
+        turn = 2 * math.pi
+        return base + turn * (math.floor((theta_a - base) / turn) + 1)
+
+
+class EnergyMonitor:
+    """Error relativo de energía de un paso y acumulado desde la última referencia
+
+    tolerance acota el error de cada paso; None sólo mide, sin rechazar pasos.
+    """
+
+    def __init__(self, tolerance=None):
+        self.tolerance = tolerance
+        self.reference = None
+        self.drift = 0.0
+        self.max_drift = 0.0
+        self.max_step_error = 0.0
+
+    def rebase(self, energy):
+        """Nueva referencia (al reiniciar, cambiar parámetros o perder energía a propósito)"""
+        self.reference = energy
+
+    def _scale(self):
+        return max(abs(self.reference), 1e-12)
+
+    def step_error(self, before, after):
+        return abs(after - before) / self._scale()
+
+    def accepts(self, before, after):
+        return self.tolerance is None or self.step_error(before, after) <= self.tolerance
+
+    def record(self, before, after):
+        self.max_step_error = max(self.max_step_error, self.step_error(before, after))
+        self.drift = abs(after - self.reference) / self._scale()
+        self.max_drift = max(self.max_drift, self.drift)
@@ -1,15 +1,24 @@
 import pygame
 import math
 import sys
+import argparse
+import atexit
 import random
-
-# Inicialización
-pygame.init()
+import numpy as np
+from rendering import ParticleRenderer, StaticLayer, DirtyRects, render_text, get_events
+from trayectoria import Trayectoria, Reproduccion
+from arrastre import CacheTrayectorias
+from solucionador_tiro import SolucionadorTiro
+from rafaga import Rafaga
+from profiling import profiler
+from recording import projectile_writer
+
+# Inicialización (la ventana se crea en init_display, no al importar)
 WIDTH, HEIGHT = 800, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Juego de Tiro Parabólico")
-font = pygame.font.SysFont("arial", 20)
-big_font = pygame.font.SysFont("arial", 40)
+DIRTY_RECTS = True  # actualizar sólo las regiones que cambian (False: flip completo)
+screen = None
+font = None
+big_font = None
 
 # Colores
 WHITE = (255, 255, 255)
@@ -22,6 +31,20 @@ GREEN = (0, 200, 0)
 GRAVEDAD = 9.81
 ESCALA = 10  # 1 metro = 10 píxeles
 
+BASE_X, BASE_Y = 50, HEIGHT - 50  # Posición de lanzamiento en píxeles
+RADIO_PROYECTIL = 5  # píxeles
+OBJETIVO_ANCHO_M = 1
+OBJETIVO_ALTO_M = 4
+
+PASO_TRAYECTORIA = 0.05  # segundos de vuelo entre puntos de disparar()
+
+# Velocidad de la animación del disparo (TAB las recorre); None = instantáneo
+RITMOS = [("tiempo real", 1.0), ("cámara lenta", 0.25), ("instantáneo", None)]
+
+# Rozamiento del aire (kg/m): 0 = vacío, tiro parabólico exacto; con aire importa la masa
+ARRASTRE = 0.0
+X_MAX_M = (WIDTH - BASE_X) / ESCALA  # el vuelo se corta al salir por la derecha
+
 # Inputs
 input_boxes = {
     "masa": pygame.Rect(100, 50, 140, 32),
@@ -30,42 +53,94 @@ input_boxes = {
 }
 inputs = {"masa": "Kg", "angulo": "Grados", "potencia": "Joules"}
 active_input = None
+boton_disparo = pygame.Rect(100, 200, 140, 32)
+
+def init_display():
+    global screen, font, big_font
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Juego de Tiro Parabólico")
+    font = pygame.font.SysFont("arial", 20)
+    big_font = pygame.font.SysFont("arial", 40)
 
 def calcular_velocidad_inicial(potencia, masa):
     return math.sqrt((2 * potencia) / masa)
 
-def dibujar_texto(texto, x, y, fuente=font, color=BLACK):
-    label = fuente.render(texto, True, color)
-    screen.blit(label, (x, y))
-
-def disparar(masa, angulo_deg, energia):
-    if masa <= 0:
-        return []
-
-    angulo_rad = math.radians(angulo_deg)
-    v0 = calcular_velocidad_inicial(energia, masa)
-    t = 0
-    puntos = []
-
-    base_x, base_y = 50, HEIGHT - 50  # Posición de lanzamiento en píxeles
+def dibujar_texto(texto, x, y, fuente=None, color=BLACK, superficie=None):
+    if fuente is None:
+        fuente = font
+    label = render_text(fuente, texto, color)
+    return (superficie or screen).blit(label, (x, y))
 
-    while True:
-        x = v0 * math.cos(angulo_rad) * t  # x en metros
-        y = v0 * math.sin(angulo_rad) * t - 0.5 * GRAVEDAD * t ** 2  # y en metros
-
-        if y < 0:
-            break
+def a_pantalla(x_m, y_m):
+    """Metros respecto del cañón -> píxeles de la pantalla"""
+    return int(x_m * ESCALA) + BASE_X, BASE_Y - int(y_m * ESCALA)
 
-        pantalla_x = int(x * ESCALA) + base_x
-        pantalla_y = HEIGHT - int(y * ESCALA) - (HEIGHT - base_y)
+# Trayectorias con aire ya integradas: repetir (o casi) un tiro no vuelve a integrar
+trayectorias_con_aire = CacheTrayectorias(gravedad=GRAVEDAD, x_max=X_MAX_M)
 
-        if pantalla_y > HEIGHT or pantalla_x > WIDTH:
-            break
+def lanzar(masa, angulo_deg, energia, arrastre=None):
+    # El vuelo se corta al tocar el suelo o al salir por la derecha de la pantalla
+    arrastre = ARRASTRE if arrastre is None else arrastre
+    if arrastre > 0:
+        return trayectorias_con_aire.obtener(masa, angulo_deg, energia, arrastre)
+    return Trayectoria(masa, angulo_deg, energia, GRAVEDAD, x_max=X_MAX_M)
 
-        puntos.append((pantalla_x, pantalla_y))
-        t += 0.05  # Más precisión
-
-    return puntos
+def disparar(masa, angulo_deg, energia):
+    """Puntos de la trayectoria en píxeles, cada PASO_TRAYECTORIA segundos"""
+    if masa <= 0:
+        return []
+    return [a_pantalla(x, y) for x, y in lanzar(masa, angulo_deg, energia).puntos(PASO_TRAYECTORIA)]
+
+def caja_objetivo(objetivo_x_m, objetivo_y_m):
+    """(izquierda, abajo, derecha, arriba) del objetivo en metros; objetivo_y_m es su borde superior"""
+    return (objetivo_x_m, objetivo_y_m - OBJETIVO_ALTO_M,
+            objetivo_x_m + OBJETIVO_ANCHO_M, objetivo_y_m)
+
+def rect_objetivo(objetivo_x_m, objetivo_y_m):
+    objetivo_x, objetivo_y = a_pantalla(objetivo_x_m, objetivo_y_m)
+    return pygame.Rect(objetivo_x, objetivo_y, int(OBJETIVO_ANCHO_M * ESCALA), int(OBJETIVO_ALTO_M * ESCALA))
+
+def tiempo_impacto(tiro, objetivo_x_m, objetivo_y_m):
+    """Instante exacto en que el proyectil toca el objetivo, o None si no lo toca"""
+    return tiro.tiempo_impacto(*caja_objetivo(objetivo_x_m, objetivo_y_m), RADIO_PROYECTIL / ESCALA)
+
+# Tiros que aciertan cada objetivo; se recuerdan por objetivo
+solucionador = SolucionadorTiro(RADIO_PROYECTIL / ESCALA, X_MAX_M, GRAVEDAD)
+
+def texto_pista(objetivo_x_m, objetivo_y_m):
+    """Sugerencia de tiro con la masa (y el ángulo, si hay) que escribió el jugador"""
+    if ARRASTRE > 0:
+        return "Las pistas sólo valen sin aire"
+    try:
+        masa = float(inputs["masa"])
+    except ValueError:
+        masa = 1.0
+    if masa <= 0:
+        return "La masa debe ser positiva"
+    try:
+        angulo = float(inputs["angulo"])
+    except ValueError:
+        angulo = None
+    solucion = solucionador.resolver(caja_objetivo(objetivo_x_m, objetivo_y_m))
+    pista = solucion.pista(masa, angulo)
+    if pista is None and angulo is not None:
+        pista = solucion.pista(masa)  # con ese ángulo no se llega; se sugiere otro
+    if pista is None:
+        return "Este objetivo no se puede alcanzar"
+    return f"Pista ({masa:g} kg): ángulo {pista[0]:.1f}°, energía {pista[1]:.0f} J"
+
+def construir_fondo(superficie):
+    # Lo que no cambia entre cuadros: fondo, rótulos, botón de disparo y base del cañón
+    superficie.fill(WHITE)
+    for key, box in input_boxes.items():
+        dibujar_texto(key.capitalize(), box.x - 80, box.y + 5, superficie=superficie)
+    pygame.draw.rect(superficie, BLUE, boton_disparo)
+    dibujar_texto("Disparar", 130, 205, superficie=superficie)
+    dibujar_texto("H: pista", 260, 205, superficie=superficie)
+    if ARRASTRE > 0:
+        dibujar_texto(f"Con aire: arrastre {ARRASTRE:g} kg/m", 350, 20, superficie=superficie)
+    pygame.draw.circle(superficie, (80, 80, 80), (BASE_X, BASE_Y), 18)  # Base del cañón
 
 def pantalla_final(mensaje, reiniciar_visible):
     screen.fill(WHITE)
@@ -77,159 +152,178 @@ def pantalla_final(mensaje, reiniciar_visible):
     pygame.display.flip()
     return boton_reiniciar
 
-def main():
+def main(semilla=None, ritmo=0, grabar=None):
+    # ritmo: índice en RITMOS de la velocidad inicial de la animación
+    # grabar: archivo donde se graba la partida (se ve con replay.py)
     global active_input, inputs
 
+    # Con la misma semilla los objetivos salen en el mismo orden
+    azar = random.Random(semilla)
     clock = pygame.time.Clock()
+    tiempo_cuadro = 0.0
     disparo = False
-    puntos_disparo = []
+    acierto = False
+    vuelo = None
     resultado = ""
+    pista = ""
+    pista_objetivo = None
     vidas = 5
     aciertos = 0
 
     # Objetivo en metros
-    objetivo_x_m = random.uniform(35, 70)  # metros desde el cañón
-    objetivo_y_m = random.uniform(3, 30)   # altura en metros sobre el suelo
+    objetivo_x_m = azar.uniform(35, 70)  # metros desde el cañón
+    objetivo_y_m = azar.uniform(3, 30)   # altura en metros sobre el suelo
 
     estado_juego = "jugando"
     boton_reiniciar = None
+    boton = boton_disparo
+    fondo = StaticLayer((WIDTH, HEIGHT), construir_fondo)
+    sucios = DirtyRects(fondo, enabled=DIRTY_RECTS)
+    # Sin proyectil en el aire la pantalla sólo cambia con un evento (escribir, hacer clic)
+    quieto = False
+    grabacion = None
+    reloj = 0.0
+    if grabar:
+        grabacion = projectile_writer(grabar, ESCALA, (BASE_X, BASE_Y), RADIO_PROYECTIL,
+                                      (OBJETIVO_ANCHO_M, OBJETIVO_ALTO_M), (WIDTH, HEIGHT))
+        # El juego termina con sys.exit() desde varios lugares: se cierra al salir
+        atexit.register(grabacion.close)
 
     while True:
-        screen.fill(WHITE)
-
-        # Dibujar campos de entrada
-        for key, box in input_boxes.items():
-            color = GREEN if active_input == key else BLACK
-            pygame.draw.rect(screen, color, box, 2)
-            txt_surface = font.render(inputs[key], True, BLACK)
-            screen.blit(txt_surface, (box.x + 5, box.y + 5))
-            dibujar_texto(key.capitalize(), box.x - 80, box.y + 5)
-
-        # Botón de disparo
-        boton = pygame.Rect(100, 200, 140, 32)
-        pygame.draw.rect(screen, BLUE, boton)
-        dibujar_texto("Disparar", 130, 205)
-
-        # Mostrar vidas y puntos
-        dibujar_texto(f"Vidas: {vidas}", 600, 50)
-        dibujar_texto(f"Aciertos: {aciertos}/5", 600, 80)
-
-        # --- DIBUJAR CAÑONCITO ---
-        base_x, base_y = 50, HEIGHT - 50  # Posición de lanzamiento
-        pygame.draw.circle(screen, (80, 80, 80), (base_x, base_y), 18)  # Base del cañón
-
-        # Dibuja el tubo del cañón según el ángulo ingresado (si es válido)
-        try:
-            angulo = float(inputs["angulo"])
-        except:
-            angulo = 45  # Valor por defecto si no hay ángulo válido
-
-        # Calcula la dirección del cañón
-        longitud_canon = 40
-        rad = math.radians(angulo)
-        punta_x = int(base_x + longitud_canon * math.cos(rad))
-        punta_y = int(base_y - longitud_canon * math.sin(rad))
-        pygame.draw.line(screen, (60, 60, 60), (base_x, base_y), (punta_x, punta_y), 8)
-
-        # Dibujar objetivo (si no ha terminado el juego)
-        if estado_juego == "jugando":
-            objetivo_x = int(objetivo_x_m * ESCALA) + base_x
-            objetivo_y = HEIGHT - int(objetivo_y_m * ESCALA) - (HEIGHT - base_y)
-            objetivo_ancho = int(1 * ESCALA)   # 1 metro de ancho
-            objetivo_alto = int(4 * ESCALA)    # 4 metros de alto
-            pygame.draw.rect(screen, RED, (objetivo_x, objetivo_y, objetivo_ancho, objetivo_alto))
-            # Mostrar distancia y altura en metros
-            dibujar_texto(f"Distancia: {objetivo_x_m:.1f} m",  350,  70)
-            dibujar_texto(f"Altura: {objetivo_y_m:.1f} m",   350,  50)
+        with profiler.section("render"):
+            sucios.begin(screen)
+
+            # Dibujar campos de entrada
+            for key, box in input_boxes.items():
+                color = GREEN if active_input == key else BLACK
+                sucios.add(pygame.draw.rect(screen, color, box, 2))
+                txt_surface = render_text(font, inputs[key], BLACK)
+                sucios.add(screen.blit(txt_surface, (box.x + 5, box.y + 5)))
+
+            # Mostrar vidas y puntos
+            sucios.add(dibujar_texto(f"Vidas: {vidas}", 600, 50))
+            sucios.add(dibujar_texto(f"Aciertos: {aciertos}/5", 600, 80))
+            sucios.add(dibujar_texto(f"TAB: {RITMOS[ritmo][0]}", 600, 110))
+
+            # --- DIBUJAR CAÑONCITO --- (la base está en el fondo)
+            # Dibuja el tubo del cañón según el ángulo ingresado (si es válido)
+            try:
+                angulo = float(inputs["angulo"])
+            except:
+                angulo = 45  # Valor por defecto si no hay ángulo válido
+
+            # Calcula la dirección del cañón
+            longitud_canon = 40
+            rad = math.radians(angulo)
+            punta_x = int(BASE_X + longitud_canon * math.cos(rad))
+            punta_y = int(BASE_Y - longitud_canon * math.sin(rad))
+            sucios.add(pygame.draw.line(screen, (60, 60, 60), (BASE_X, BASE_Y), (punta_x, punta_y), 8))
+
+            # Dibujar objetivo (si no ha terminado el juego)
+            if estado_juego == "jugando":
+                sucios.add(pygame.draw.rect(screen, RED, rect_objetivo(objetivo_x_m, objetivo_y_m)))
+                # Mostrar distancia y altura en metros
+                sucios.add(dibujar_texto(f"Distancia: {objetivo_x_m:.1f} m",  350,  70))
+                sucios.add(dibujar_texto(f"Altura: {objetivo_y_m:.1f} m",   350,  50))
 
         # Evento
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-            elif estado_juego == "final":
-                if event.type == pygame.MOUSEBUTTONDOWN and boton_reiniciar and boton_reiniciar.collidepoint(event.pos):
-                    # Reiniciar juego
-                    vidas = 5
-                    aciertos = 0
-                    resultado = ""
-                    puntos_disparo = []
-                    inputs = {"masa": "Kg", "angulo": "Grados", "potencia": "Joules"}
-                    estado_juego = "jugando"
-                    objetivo_x_m = random.uniform(35, 75)
-                    objetivo_y_m = random.uniform(2, 10)
-                    continue
-
-            elif estado_juego == "jugando":
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    for key, box in input_boxes.items():
-                        if box.collidepoint(event.pos):
-                            active_input = key
-                            break
-                    else:
-                        active_input = None
-
-                    if boton.collidepoint(event.pos):
-                        try:
-                            masa = float(inputs["masa"])
-                            angulo = float(inputs["angulo"])
-                            potencia = float(inputs["potencia"])
-                            puntos_disparo = disparar(masa, angulo, potencia)
-                            disparo = True
-                            resultado = ""
-                        except:
-                            resultado = "Entrada inválida"
-
-                elif event.type == pygame.KEYDOWN and active_input:
-                    if event.key == pygame.K_RETURN:
-                        active_input = None
-                    elif event.key == pygame.K_BACKSPACE:
-                        inputs[active_input] = inputs[active_input][:-1]
-                    else:
-                        inputs[active_input] += event.unicode
+        eventos = get_events(quieto, clock)
+        with profiler.section("events"):
+            for event in eventos:
+                sucios.handle_event(event)
+                profiler.handle_event(event)
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+
+                elif estado_juego == "final":
+                    if event.type == pygame.MOUSEBUTTONDOWN and boton_reiniciar and boton_reiniciar.collidepoint(event.pos):
+                        # Reiniciar juego
+                        vidas = 5
+                        aciertos = 0
+                        resultado = ""
+                        disparo = False
+                        inputs = {"masa": "Kg", "angulo": "Grados", "potencia": "Joules"}
+                        estado_juego = "jugando"
+                        objetivo_x_m = azar.uniform(35, 75)
+                        objetivo_y_m = azar.uniform(2, 10)
+                        continue
+
+                elif estado_juego == "jugando":
+                    if event.type == pygame.MOUSEBUTTONDOWN:
+                        for key, box in input_boxes.items():
+                            if box.collidepoint(event.pos):
+                                active_input = key
+                                break
+                        else:
+                            active_input = None
+
+                        if boton.collidepoint(event.pos):
+                            try:
+                                masa = float(inputs["masa"])
+                                angulo = float(inputs["angulo"])
+                                potencia = float(inputs["potencia"])
+                                tiro = lanzar(masa, angulo, potencia)
+                                # Acierto o fallo se decide ya; la animación sólo lo muestra
+                                t_impacto = tiempo_impacto(tiro, objetivo_x_m, objetivo_y_m)
+                                acierto = t_impacto is not None
+                                vuelo = Reproduccion(tiro, t_impacto if acierto else None, RITMOS[ritmo][1])
+                                disparo = True
+                                resultado = ""
+                            except:
+                                resultado = "Entrada inválida"
+
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_TAB:
+                        # Cambia el ritmo de los próximos disparos
+                        ritmo = (ritmo + 1) % len(RITMOS)
+
+                    elif event.type == pygame.KEYDOWN and not active_input and event.key == pygame.K_h:
+                        pista = texto_pista(objetivo_x_m, objetivo_y_m)
+                        pista_objetivo = (objetivo_x_m, objetivo_y_m)
+
+                    elif event.type == pygame.KEYDOWN and active_input:
+                        if event.key == pygame.K_RETURN:
+                            active_input = None
+                        elif event.key == pygame.K_BACKSPACE:
+                            inputs[active_input] = inputs[active_input][:-1]
+                        else:
+                            inputs[active_input] += event.unicode
                         
-        # Animar disparo
-        if disparo and puntos_disparo:
-            punto = puntos_disparo.pop(0)
-            radio_proyectil = 5  # Más pequeño para mayor precisión
-            pygame.draw.circle(screen, BLACK, punto, radio_proyectil)
-            # (Opcional) Dibuja el centro del proyectil
-            # pygame.draw.circle(screen, (0, 255, 0), punto, 2)
-
-            # Precisión mejorada: colisión círculo-rectángulo
-            # Calcula el rectángulo del objetivo y la posición del proyectil
-            objetivo_x = int(objetivo_x_m * ESCALA) + base_x
-            objetivo_y = HEIGHT - int(objetivo_y_m * ESCALA) - (HEIGHT - base_y)
-            objetivo_ancho = int(1 * ESCALA)
-            objetivo_alto = int(4 * ESCALA)
-            objetivo_rect = pygame.Rect(objetivo_x, objetivo_y, objetivo_ancho, objetivo_alto)
-            px, py = punto
-
-            # Encuentra el punto más cercano del rectángulo al centro del círculo
-            closest_x = max(objetivo_rect.left, min(px, objetivo_rect.right))
-            closest_y = max(objetivo_rect.top, min(py, objetivo_rect.bottom))
-            dist_sq = (px - closest_x) ** 2 + (py - closest_y) ** 2
-
-            if dist_sq <= radio_proyectil ** 2:
-                resultado = "¡Le diste al objetivo!"
-                disparo = False
-                aciertos += 1
-                puntos_disparo = []
-
-                # Reposicionar el objetivo después de un acierto (en metros)
-                objetivo_x_m = random.uniform(35, 70)
-                objetivo_y_m = random.uniform(2, 30)
-
-        elif disparo and not puntos_disparo:
-            if resultado == "":
-                resultado = "Fallaste el disparo"
-                vidas -= 1
-                disparo = False
-
-        # Mostrar resultado
-        if resultado:
-            dibujar_texto(resultado, 100, 250)
+
+        with profiler.section("physics"):
+            # Animar disparo: la posición sale de la trayectoria en el instante que toca
+            posicion = None
+            termino = False
+            if disparo:
+                posicion = vuelo.avanzar(tiempo_cuadro)
+                punto = a_pantalla(*posicion)
+                sucios.add(pygame.draw.circle(screen, BLACK, punto, RADIO_PROYECTIL))
+                if vuelo.terminado:
+                    # Terminó el vuelo (en el objetivo o fuera de él)
+                    disparo = False
+                    termino = True
+                    if acierto:
+                        resultado = "¡Le diste al objetivo!"
+                        aciertos += 1
+                        # Reposicionar el objetivo después de un acierto (en metros)
+                        objetivo_x_m = azar.uniform(35, 70)
+                        objetivo_y_m = azar.uniform(2, 30)
+                    else:
+                        resultado = "Fallaste el disparo"
+                        vidas -= 1
+        if grabacion is not None:
+            x_m, y_m = posicion if posicion is not None else (0.0, 0.0)
+            grabacion.append(time=reloj, in_flight=posicion is not None, x=x_m, y=y_m,
+                             target_x=objetivo_x_m, target_y=objetivo_y_m, lives=vidas, hits=aciertos)
+
+        with profiler.section("render"):
+            # Mostrar resultado
+            if resultado:
+                sucios.add(dibujar_texto(resultado, 100, 250))
+            # La pista se borra sola cuando el objetivo cambia de lugar
+            if pista and pista_objetivo == (objetivo_x_m, objetivo_y_m) and estado_juego == "jugando":
+                sucios.add(dibujar_texto(pista, 100, 280))
+            sucios.add(profiler.draw_hud(screen, font, (600, 140), BLACK))
 
         # Fin del juego
         if estado_juego == "jugando" and (aciertos >= 5 or vidas <= 0):
@@ -242,7 +336,7 @@ def main():
             # Esperar a que el usuario pulse el botón de reinicio
             esperando = True
             while esperando:
-                for event in pygame.event.get():
+                for event in get_events(True, clock):
                     if event.type == pygame.QUIT:
                         pygame.quit()
                         sys.exit()
@@ -251,17 +345,93 @@ def main():
                         vidas = 5
                         aciertos = 0
                         resultado = ""
-                        puntos_disparo = []
+                        disparo = False
                         inputs = {"masa": "Kg", "angulo": "Grados", "potencia": "Joules"}
                         estado_juego = "jugando"
-                        objetivo_x_m = random.uniform(35, 70)
-                        objetivo_y_m = random.uniform(3, 30)
+                        objetivo_x_m = azar.uniform(35, 70)
+                        objetivo_y_m = azar.uniform(3, 30)
                         esperando = False
-                pygame.time.delay(10)
+            sucios.invalidate()  # la pantalla final tapó todo
+            quieto = False
             continue
 
-        pygame.display.flip()
-        clock.tick(60)
+        with profiler.section("flip"):
+            sucios.finish()
+        profiler.end_frame()
+        # Lo dibujado arriba es de antes de los eventos y de la física: si cambiaron
+        # algo (o terminó el vuelo: objetivo, vidas y aciertos nuevos) va un cuadro más
+        quieto = not disparo and not eventos and not termino
+        tiempo_cuadro = clock.tick(60) / 1000
+        reloj += tiempo_cuadro
+
+def modo_rafaga(num_proyectiles=300, num_objetivos=40, semilla=None):
+    """Cientos de disparos a la vez contra muchos objetivos (también prueba de carga)"""
+    rafaga = Rafaga(num_proyectiles, num_objetivos, np.random.default_rng(semilla),
+                    radio=RADIO_PROYECTIL / ESCALA, ancho=OBJETIVO_ANCHO_M, alto=OBJETIVO_ALTO_M,
+                    x_max=X_MAX_M, gravedad=GRAVEDAD, por_paso=max(num_proyectiles // 30, 1))
+    renderer = ParticleRenderer()
+    colores = np.zeros((num_proyectiles, 3), dtype=np.uint8)
+    radios = np.full(num_proyectiles, RADIO_PROYECTIL)
+    ancho, alto = int(OBJETIVO_ANCHO_M * ESCALA), int(OBJETIVO_ALTO_M * ESCALA)
+
+    def construir(superficie):
+        superficie.fill(WHITE)
+        pygame.draw.circle(superficie, (80, 80, 80), (BASE_X, BASE_Y), 18)  # Base del cañón
+        dibujar_texto("Modo ráfaga - ESC para salir", 20, 20, superficie=superficie)
+    fondo = StaticLayer((WIDTH, HEIGHT), construir)
+    # Con cientos de proyectiles se pasa de max_rects y se dibuja la pantalla completa
+    sucios = DirtyRects(fondo, enabled=DIRTY_RECTS)
+    clock = pygame.time.Clock()
+    tiempo_cuadro = 0.0
+
+    while True:
+        with profiler.section("events"):
+            for event in pygame.event.get():
+                sucios.handle_event(event)
+                profiler.handle_event(event)
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    return
+
+        # Un cuadro muy largo no debe hacer saltar los proyectiles por encima de todo
+        with profiler.section("physics"):
+            rafaga.step(min(tiempo_cuadro, 0.1))
+        profiler.count("particles", len(rafaga))
+
+        with profiler.section("render"):
+            sucios.begin(screen)
+            izquierda = (rafaga.objetivo_x * ESCALA).astype(int) + BASE_X
+            arriba = BASE_Y - (rafaga.objetivo_y * ESCALA).astype(int)
+            for x, y in zip(izquierda.tolist(), arriba.tolist()):
+                sucios.add(pygame.draw.rect(screen, RED, (x, y, ancho, alto)))
+            n = len(rafaga)
+            px = rafaga.x * ESCALA + BASE_X
+            py = BASE_Y - rafaga.y * ESCALA
+            renderer.draw_arrays(screen, px, py, radios[:n], colores[:n])
+            sucios.add_disks(px, py, radios[:n])
+            sucios.add(dibujar_texto(f"En el aire: {n}  Aciertos: {rafaga.aciertos}  Caídos: {rafaga.caidos}  "
+                                     f"FPS: {clock.get_fps():.0f}", 20, 50))
+            sucios.add(profiler.draw_hud(screen, font, (20, 80), BLACK))
+        with profiler.section("flip"):
+            sucios.finish()
+        profiler.end_frame()
+        tiempo_cuadro = clock.tick(60) / 1000
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Juego de tiro parabólico")
+    parser.add_argument("--semilla", type=int, help="semilla para repetir la posición de los objetivos")
+    parser.add_argument("--arrastre", type=float, default=ARRASTRE, help="rozamiento del aire en kg/m (0 = vacío)")
+    parser.add_argument("--ritmo", choices=[nombre for nombre, _ in RITMOS], default=RITMOS[0][0],
+                        help="velocidad de la animación del disparo")
+    parser.add_argument("--rafaga", type=int, metavar="N", help="modo ráfaga con N proyectiles en el aire")
+    parser.add_argument("--objetivos", type=int, default=40, help="objetivos del modo ráfaga")
+    parser.add_argument("--grabar", metavar="ARCHIVO", help="grabar la partida (se ve con replay.py)")
+    args = parser.parse_args()
+    ARRASTRE = args.arrastre
+    init_display()
+    if args.rafaga:
+        modo_rafaga(args.rafaga, args.objetivos, args.semilla)
+    else:
+        main(args.semilla, [nombre for nombre, _ in RITMOS].index(args.ritmo), args.grabar)
@@ -1,107 +1,168 @@
+import argparse
+import numpy as np
 import pygame
-import random
-import math
-from particles import Particle
+from gas import GasSimulation, spawn_particles, NUM_PARTICLES
+from springs import VerticalSpring
+from rendering import ParticleRenderer, StaticLayer, DirtyRects, render_text, get_events
+from timestep import FixedTimestep, interpolate
+from trails import Trail, Trails
+from profiling import profiler
+from physics_thread import PhysicsThread
+from diagnostics import GasDiagnostics, DiagnosticsPanel
+from recording import gas_writer, record_gas
 
-pygame.init()
 WIDTH, HEIGHT = 800, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Simulación de Partículas 2D")
-clock = pygame.time.Clock()
-font = pygame.font.SysFont(None, 24)
+DIRTY_RECTS = True  # actualizar sólo las regiones que cambian (False: flip completo)
+PHYSICS_DT = 1 / 60  # paso fijo de la física, independiente de los FPS
+MAX_CATCH_UP = 5     # pasos de física como máximo por cuadro si la pantalla se atrasa
+SPRING_INTEGRATOR = "exact"  # "exact", "verlet", "rk4" o "euler" (ver springs.VerticalSpring)
+TRAIL_LENGTH = 10000  # pasos de física que se guardan en cada estela
+GAS_TRAIL_LENGTH = 600
+GAS_TRAIL_POINTS = 64  # puntos dibujados por estela del gas (son muchas)
+GAS_ENGINE = "substeps"  # "substeps" (pasos fijos) o "events" (choques con tiempos exactos)
+PHYSICS_THREAD = False  # física del gas en otro hilo (ver physics_thread.PhysicsThread)
+SNAPSHOT_POLICY = "latest"  # "latest" (se saltan instantáneas) o "block" (la física espera al dibujo)
+RECORD_STRIDE = 1  # con --record, se graba uno de cada tantos pasos de física
+RECORD_FLOAT32 = False  # grabar posiciones y velocidades en float32 (la mitad de espacio)
+screen = None
+clock = None
+font = None
 
-# --------- Simulación Principal ---------
-def main_simulation():
-    NUM_PARTICLES = 10
-    MAX_SPEED = 300
-    particles = []
-    while len(particles) < NUM_PARTICLES:
-        radius = random.randint(10, 20)
-        mass = radius ** 2
-        x = random.randint(radius, WIDTH - radius)
-        y = random.randint(radius, HEIGHT - radius)
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(50, 150)
-        vx = speed * math.cos(angle)
-        vy = speed * math.sin(angle)
-        new_particle = Particle(x, y, vx, vy, radius, mass)
-        overlap = False
-        for p in particles:
-            dx = p.x - new_particle.x
-            dy = p.y - new_particle.y
-            distance = math.hypot(dx, dy)
-            if distance < p.radius + new_particle.radius:
-                overlap = True
-                break
-        if not overlap:
-            particles.append(new_particle)
 
-    def resolve_collision(p1, p2):
-        dx = p2.x - p1.x
-        dy = p2.y - p1.y
-        dist = math.hypot(dx, dy)
-        min_dist = p1.radius + p2.radius
-        if dist < min_dist and dist != 0:
-            nx = dx / dist
-            ny = dy / dist
-            overlap = 0.5 * (min_dist - dist + 1)
-            p1.x -= nx * overlap
-            p1.y -= ny * overlap
-            p2.x += nx * overlap
-            p2.y += ny * overlap
-            tx = -ny
-            ty = nx
-            v1n = p1.vx * nx + p1.vy * ny
-            v1t = p1.vx * tx + p1.vy * ty
-            v2n = p2.vx * nx + p2.vy * ny
-            v2t = p2.vx * tx + p2.vy * ty
-            v1n_post = (v1n * (p1.mass - p2.mass) + 2 * p2.mass * v2n) / (p1.mass + p2.mass)
-            v2n_post = (v2n * (p2.mass - p1.mass) + 2 * p1.mass * v1n) / (p1.mass + p2.mass)
-            p1.vx = v1n_post * nx + v1t * tx
-            p1.vy = v1n_post * ny + v1t * ty
-            p2.vx = v2n_post * nx + v2t * tx
-            p2.vy = v2n_post * ny + v2t * ty
+def init_display():
+    # La ventana sólo se crea al ejecutar el programa, no al importarlo
+    global screen, clock, font
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Simulación de Partículas 2D")
+    clock = pygame.time.Clock()
+    font = pygame.font.SysFont(None, 24)
 
-    def total_kinetic_energy(particles):
-        return sum(0.5 * p.mass * (p.vx**2 + p.vy**2) for p in particles)
+# --------- Simulación Principal ---------
+def main_simulation(seed=None, threaded=PHYSICS_THREAD, record=None, engine=GAS_ENGINE):
+    # Con la misma semilla el gas arranca igual y, al ir a paso fijo, evoluciona igual
+    particles = spawn_particles(NUM_PARTICLES, WIDTH, HEIGHT, rng=np.random.default_rng(seed))
+    # El monitor suma en cada subpaso y mide el gas cada tanto; el panel se muestra con la tecla D
+    monitor = GasDiagnostics(particles, WIDTH, HEIGHT)
+    simulation = GasSimulation(particles, WIDTH, HEIGHT, engine=engine, monitor=monitor)
+    panel = DiagnosticsPanel(monitor, font, (380, 200))
+    panel_pos = (WIDTH - 390, HEIGHT - 210)
+    show_panel = False
+    # Grabación de la corrida (se ve después con replay.py)
+    writer = None
+    if record:
+        writer = gas_writer(record, simulation, PHYSICS_DT, stride=RECORD_STRIDE, quantize=RECORD_FLOAT32)
+        record_gas(writer, simulation)
+    renderer = ParticleRenderer()
+    physics_clock = FixedTimestep(PHYSICS_DT, MAX_CATCH_UP)
+    # Posiciones del paso anterior, para dibujar entre dos pasos de física
+    prev_x = particles.x.copy()
+    prev_y = particles.y.copy()
+    draw_x = np.empty_like(prev_x)
+    draw_y = np.empty_like(prev_y)
+    # Estelas del gas, se muestran con la tecla T (se reservan recién la primera vez)
+    trails = None
+    show_trails = False
+    # En modo hilo la simulación sólo la toca el hilo de física: se dibujan sus instantáneas
+    on_step = (lambda simulation: record_gas(writer, simulation)) if writer is not None else None
+    physics = PhysicsThread(simulation, PHYSICS_DT, MAX_CATCH_UP, policy=SNAPSHOT_POLICY,
+                            on_step=on_step) if threaded else None
+    last_step = -1
+    last_dropped = 0
+    if physics is not None:
+        physics.start()
 
     button_rect = pygame.Rect(WIDTH - 210, 10, 200, 40)
+
+    def build_button(surface):
+        surface.fill((50, 150, 250))
+        surface.blit(render_text(font, "Simulación con resortes", (255, 255, 255)), (10, 10))
+    button = StaticLayer(button_rect.size, build_button, button_rect.topleft)
+
+    def build_background(surface):
+        surface.fill((0, 0, 0))
+    background = StaticLayer((WIDTH, HEIGHT), build_background)
+    # Con muchas partículas hay más regiones que max_rects y se cae al flip completo
+    dirty = DirtyRects(background, enabled=DIRTY_RECTS)
+
     running = True
-    substeps = 3
 
     while running:
-        dt = clock.tick(60) / 1000
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if button_rect.collidepoint(event.pos):
-                    run_spring_simulation()
+        frame_time = clock.tick(60) / 1000
+        with profiler.section("events"):
+            for event in pygame.event.get():
+                dirty.handle_event(event)
+                profiler.handle_event(event)
+                if event.type == pygame.QUIT:
+                    running = False
+                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    if button_rect.collidepoint(event.pos):
+                        if physics is not None:
+                            physics.send("pause")
+                        run_spring_simulation()
+                        if physics is not None:
+                            physics.send("resume")
+                        dirty.invalidate()  # se vuelve de otra escena
+                        clock.tick()  # el tiempo pasado en la otra escena no cuenta
+                        physics_clock.accumulator = 0.0
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_t:
+                    show_trails = not show_trails
+                    if trails is None:
+                        trails = Trails(len(particles), GAS_TRAIL_LENGTH)
+                    trails.clear()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_d:
+                    show_panel = not show_panel
+
+        if physics is None:
+            with profiler.section("physics"):
+                for _ in range(physics_clock.advance(frame_time)):
+                    np.copyto(prev_x, particles.x)
+                    np.copyto(prev_y, particles.y)
+                    simulation.step(PHYSICS_DT)
+                    if writer is not None:
+                        record_gas(writer, simulation)
+                    if show_trails:
+                        trails.append(particles.x, particles.y)
+            alpha = physics_clock.alpha
+            interpolate(prev_x, particles.x, alpha, draw_x)
+            interpolate(prev_y, particles.y, alpha, draw_y)
+            shown_x, shown_y = draw_x, draw_y
+            ke = particles.kinetic_energy()  # el monitor mide cada SAMPLE_INTERVAL segundos
+        else:
+            snapshot = physics.take()
+            shown_x, shown_y = snapshot.x, snapshot.y
+            ke = snapshot.kinetic_energy
+            if show_trails and snapshot.step != last_step:
+                trails.append(shown_x, shown_y)
+            last_step = snapshot.step
+            profiler.count("dropped_snapshots", physics.dropped - last_dropped)
+            last_dropped = physics.dropped
+        profiler.count("particles", len(particles))
 
-        for _ in range(substeps):
-            step_dt = dt / substeps
-            for p in particles:
-                p.move(step_dt)
-                p.wall_collision(WIDTH, HEIGHT)
-                speed = math.hypot(p.vx, p.vy)
-                if speed > MAX_SPEED:
-                    scale = MAX_SPEED / speed
-                    p.vx *= scale
-                    p.vy *= scale
-            for i in range(len(particles)):
-                for j in range(i + 1, len(particles)):
-                    resolve_collision(particles[i], particles[j])
+        with profiler.section("render"):
+            dirty.begin(screen)
+            if show_trails:
+                for rect in trails.draw(screen, particles.color, max_points=GAS_TRAIL_POINTS):
+                    dirty.add(rect)
+            # Radio y color no cambian: se pueden leer aunque la física esté en otro hilo
+            renderer.draw_arrays(screen, shown_x, shown_y, particles.radius, particles.color)
+            dirty.add_disks(shown_x, shown_y, particles.radius)
+            text = font.render(f"Energía Cinética: {ke:.2f}", True, (255, 255, 255))
+            dirty.add(screen.blit(text, (10, 10)))
+            dirty.add(button.blit(screen))
+            if show_panel:
+                # En modo hilo el panel puede leer el monitor a mitad de un subpaso:
+                # sólo se nota en lo que muestra ese cuadro
+                dirty.add(panel.draw(screen, panel_pos))
+            dirty.add(profiler.draw_hud(screen, font))
+        with profiler.section("flip"):
+            dirty.finish()
+        profiler.end_frame()
 
-        screen.fill((0, 0, 0))
-        for p in particles:
-            p.draw(screen)
-        ke = total_kinetic_energy(particles)
-        text = font.render(f"Energía Cinética: {ke:.2f}", True, (255, 255, 255))
-        screen.blit(text, (10, 10))
-        pygame.draw.rect(screen, (50, 150, 250), button_rect)
-        button_text = font.render("Simulación con resortes", True, (255, 255, 255))
-        screen.blit(button_text, (button_rect.x + 10, button_rect.y + 10))
-        pygame.display.flip()
+    if physics is not None:
+        physics.stop()
+    if writer is not None:
+        writer.close()
 
 # --------- Simulación con Resortes ---------
 def run_spring_simulation():
@@ -126,26 +187,24 @@ def run_spring_simulation():
                 self.value = self.min_val + (rel_x - self.rect.left) / self.rect.width * (self.max_val - self.min_val)
 
         def draw(self, surface):
-            pygame.draw.rect(surface, (180, 180, 180), self.rect)
+            area = pygame.draw.rect(surface, (180, 180, 180), self.rect)
             slider_x = self.rect.left + ((self.value - self.min_val) / (self.max_val - self.min_val)) * self.rect.width
-            pygame.draw.circle(surface, (100, 200, 255), (int(slider_x), self.rect.centery), 8)
-            label_surface = font.render(f"{self.label}: {self.value:.1f} {self.unit}", True, (255, 255, 255))
-            surface.blit(label_surface, (self.rect.left, self.rect.top - 20))
+            area = area.union(pygame.draw.circle(surface, (100, 200, 255), (int(slider_x), self.rect.centery), 8))
+            label_surface = render_text(font, f"{self.label}: {self.value:.1f} {self.unit}", (255, 255, 255))
+            return area.union(surface.blit(label_surface, (self.rect.left, self.rect.top - 20)))
 
     fixed_point = [WIDTH // 2, 100]  # Fijo arriba
-    particle = Particle(fixed_point[0], fixed_point[1] + 150, 0, 0, 15, 20)
-    rest_length = 150
-    g = 9.81 * 100  # gravedad "escalada" visualmente (pixeles ≈ cm)
-    
+    spring = VerticalSpring(fixed_point, rest_length=150, k=100, mass=20, radius=15, floor=HEIGHT,
+                            integrator=SPRING_INTEGRATOR)
+    particle = spring.particle
+
     # Sliders con unidades SI
     k_slider = Slider(20, HEIGHT - 80, 200, 10, 500, 100, "Constante k", "N/m")
     mass_slider = Slider(20, HEIGHT - 40, 200, 1, 100, particle.mass, "Masa", "kg")
 
-    oscillation_count = 0
-    previous_above = None
-    equilibrium_y = fixed_point[1] + rest_length
-    trail = []
-    max_trail_length = 100
+    trail = Trail(TRAIL_LENGTH)
+    physics_clock = FixedTimestep(PHYSICS_DT, MAX_CATCH_UP)
+    prev_y = particle.y
 
     # Botones
     start_button_rect = pygame.Rect(WIDTH // 2 - 100, HEIGHT // 2 - 30, 200, 60)
@@ -154,120 +213,126 @@ def run_spring_simulation():
     simulation_started = False
     paused = False
 
+    def build_background(surface):
+        # Fondo, botones y rótulos fijos; sólo cambian al iniciar o pausar
+        surface.fill((0, 0, 0))
+        white = (255, 255, 255)
+        if not simulation_started:
+            pygame.draw.rect(surface, (50, 200, 50), start_button_rect)
+            surface.blit(render_text(font, "Iniciar simulación", white), (start_button_rect.x + 25, start_button_rect.y + 18))
+            surface.blit(render_text(font, "Ajusta los valores y presiona el botón", white), (10, 10))
+            return
+        pygame.draw.rect(surface, (200, 200, 50), pause_button_rect)
+        pause_text = render_text(font, "Pausar" if not paused else "Reanudar", (0, 0, 0))
+        surface.blit(pause_text, (pause_button_rect.x + 10, pause_button_rect.y + 10))
+        pygame.draw.rect(surface, (200, 50, 50), reset_button_rect)
+        surface.blit(render_text(font, "Reiniciar", white), (reset_button_rect.x + 15, reset_button_rect.y + 10))
+        surface.blit(render_text(font, "ESC para volver", white), (10, 10))
+    background = StaticLayer((WIDTH, HEIGHT), build_background)
+    dirty = DirtyRects(background, enabled=DIRTY_RECTS)
+
     running = True
-    last_cross = None  # Para evitar dobles conteos
+    # Antes de iniciar y en pausa no se mueve nada: se espera al próximo evento
+    idle = False
 
     while running:
-        dt = clock.tick(60) / 1000
+        frame_time = clock.tick(60) / 1000
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
-                running = False
-            k_slider.handle_event(event)
-            mass_slider.handle_event(event)
-            if not simulation_started:
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    if start_button_rect.collidepoint(event.pos):
-                        simulation_started = True
-                        paused = False
-                        oscillation_count = 0
-                        previous_above = None
-                        last_cross = None
-                        particle.mass = mass_slider.value
-                        particle.vy = 0
-                        particle.y = fixed_point[1] + rest_length
-                        trail.clear()
-            else:
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    if pause_button_rect.collidepoint(event.pos):
-                        paused = not paused
-                    if reset_button_rect.collidepoint(event.pos):
-                        oscillation_count = 0
-                        previous_above = None
-                        last_cross = None
-                        particle.mass = mass_slider.value
-                        particle.vy = 0
-                        particle.y = fixed_point[1] + rest_length
-                        trail.clear()
-                        paused = False
+        events = get_events(idle, clock)
+        with profiler.section("events"):
+            for event in events:
+                dirty.handle_event(event)
+                profiler.handle_event(event)
+                if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                    running = False
+                k_slider.handle_event(event)
+                mass_slider.handle_event(event)
+                if not simulation_started:
+                    if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                        if start_button_rect.collidepoint(event.pos):
+                            simulation_started = True
+                            paused = False
+                            particle.mass = mass_slider.value
+                            spring.reset()
+                            trail.clear()
+                else:
+                    if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                        if pause_button_rect.collidepoint(event.pos):
+                            paused = not paused
+                        if reset_button_rect.collidepoint(event.pos):
+                            particle.mass = mass_slider.value
+                            spring.reset()
+                            trail.clear()
+                            paused = False
+                            physics_clock.reset()
+                            prev_y = particle.y
 
-        screen.fill((0, 0, 0))
+        dirty.begin(screen, (simulation_started, paused))
 
         if not simulation_started:
             # Dibuja la partícula en reposo (posición de equilibrio)
             particle.mass = mass_slider.value
-            k = k_slider.value
-            particle.y = fixed_point[1] + rest_length
-            particle.vy = 0
+            spring.k = k_slider.value
+            spring.reset()
+            prev_y = particle.y
 
-            pygame.draw.line(screen, (255, 255, 255), fixed_point, (particle.x, particle.y), 2)
-            pygame.draw.circle(screen, (255, 0, 0), fixed_point, 10)
-            particle.draw(screen)
-            k_slider.draw(screen)
-            mass_slider.draw(screen)
-            pygame.draw.rect(screen, (50, 200, 50), start_button_rect)
-            text = font.render("Iniciar simulación", True, (255, 255, 255))
-            screen.blit(text, (start_button_rect.x + 25, start_button_rect.y + 18))
-            screen.blit(font.render("Ajusta los valores y presiona el botón", True, (255, 255, 255)), (10, 10))
-            pygame.display.flip()
+            dirty.add(pygame.draw.line(screen, (255, 255, 255), fixed_point, (particle.x, particle.y), 2))
+            dirty.add(pygame.draw.circle(screen, (255, 0, 0), fixed_point, 10))
+            dirty.add(particle.draw(screen))
+            dirty.add(k_slider.draw(screen))
+            dirty.add(mass_slider.draw(screen))
+            dirty.add(profiler.draw_hud(screen, font, (10, 40)))
+            with profiler.section("flip"):
+                dirty.finish()
+            profiler.end_frame()
+            idle = True
             continue
 
         # --- Simulación física ---
-        if not paused:
+        if paused:
+            # En pausa el reloj no acumula: al reanudar no hay pasos atrasados
+            physics_clock.accumulator = 0.0
+            prev_y = particle.y
+        else:
             particle.mass = mass_slider.value
-            k = k_slider.value
-
-            dy = particle.y - fixed_point[1]
-            dist = dy
-            force = -k * (dist - rest_length)  # Fuerza de resorte (Hooke)
-            force += particle.mass * g         # Gravedad
-            ay = force / particle.mass
-            particle.vy += ay * dt
-            particle.y += particle.vy * dt
-
-            # Conteo de oscilaciones: cuenta cada cruce por el equilibrio (ambos sentidos)
-            is_above = particle.y < equilibrium_y
-            if previous_above is not None and is_above != previous_above:
-                # Solo cuenta si no es el mismo cruce que el anterior
-                if last_cross != is_above:
-                    oscillation_count += 1
-                    last_cross = is_above
-            previous_above = is_above
-
-            # Rebote si toca el fondo
-            if particle.y + particle.radius > HEIGHT:
-                particle.y = HEIGHT - particle.radius
-                particle.vy *= -0.8
-
-            # Guardar trayectoria
-            trail.append((int(particle.x), int(particle.y)))
-            if len(trail) > max_trail_length:
-                trail.pop(0)
-
-        # Dibujar resorte y partícula
-        pygame.draw.line(screen, (255, 255, 255), fixed_point, (particle.x, particle.y), 2)
-        pygame.draw.circle(screen, (255, 0, 0), fixed_point, 10)
-        if len(trail) > 1:
-            pygame.draw.lines(screen, (0, 255, 255), False, trail, 2)
-        particle.draw(screen)
-        k_slider.draw(screen)
-        mass_slider.draw(screen)
-
-        # Botones de pausa y reinicio
-        pygame.draw.rect(screen, (200, 200, 50), pause_button_rect)
-        pause_text = font.render("Pausar" if not paused else "Reanudar", True, (0, 0, 0))
-        screen.blit(pause_text, (pause_button_rect.x + 10, pause_button_rect.y + 10))
+            spring.k = k_slider.value
+            with profiler.section("physics"):
+                for _ in range(physics_clock.advance(frame_time)):
+                    prev_y = particle.y
+                    spring.step(PHYSICS_DT)
 
-        pygame.draw.rect(screen, (200, 50, 50), reset_button_rect)
-        reset_text = font.render("Reiniciar", True, (255, 255, 255))
-        screen.blit(reset_text, (reset_button_rect.x + 15, reset_button_rect.y + 10))
+                    # Guardar trayectoria
+                    trail.append(particle.x, particle.y)
+        profiler.count("trail_points", len(trail))
 
-        screen.blit(font.render("ESC para volver", True, (255, 255, 255)), (10, 10))
-        screen.blit(font.render(f"Oscilaciones: {oscillation_count}", True, (255, 255, 255)), (10, 70))
-        pygame.display.flip()
+        # Dibujar resorte y partícula entre los dos últimos pasos de física
+        with profiler.section("render"):
+            y = prev_y + physics_clock.alpha * (particle.y - prev_y)
+            dirty.add(pygame.draw.line(screen, (255, 255, 255), fixed_point, (particle.x, y), 2))
+            dirty.add(pygame.draw.circle(screen, (255, 0, 0), fixed_point, 10))
+            dirty.add(trail.draw(screen, (0, 255, 255), 2))
+            dirty.add(pygame.draw.circle(screen, particle.color, (int(particle.x), int(y)), particle.radius))
+            dirty.add(k_slider.draw(screen))
+            dirty.add(mass_slider.draw(screen))
+            dirty.add(screen.blit(render_text(font, f"Oscilaciones: {spring.oscillation_count}", (255, 255, 255)), (10, 70)))
+            dirty.add(profiler.draw_hud(screen, font, (10, 100)))
+        with profiler.section("flip"):
+            dirty.finish()
+        profiler.end_frame()
+        idle = paused
     
 
 
 # --------- Iniciar ---------
-main_simulation()
-pygame.quit()
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulación de partículas 2D")
+    parser.add_argument("--seed", type=int, help="semilla para repetir la corrida")
+    parser.add_argument("--physics-thread", action="store_true", default=PHYSICS_THREAD,
+                        help="avanzar la física del gas en otro hilo")
+    parser.add_argument("--record", metavar="ARCHIVO", help="grabar el gas (se ve con replay.py)")
+    parser.add_argument("--engine", choices=["substeps", "events"], default=GAS_ENGINE,
+                        help="motor del gas: pasos fijos o choques con tiempos exactos")
+    args = parser.parse_args()
+    init_display()
+    main_simulation(args.seed, args.physics_thread, args.record, args.engine)
+    pygame.quit()
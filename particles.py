@@ -1,20 +1,176 @@
 import pygame
 import random
 import math
+import numpy as np
+
+
+def random_color():
+    return (
+        random.randint(100, 255),
+        random.randint(100, 255),
+        random.randint(100, 255),
+    )
+
+
+class ParticleSystem:
+    """Partículas guardadas como arreglos contiguos de NumPy (una fila por partícula)"""
+
+    def __init__(self, capacity=16):
+        capacity = max(int(capacity), 1)
+        self.n = 0
+        self._x = np.zeros(capacity)
+        self._y = np.zeros(capacity)
+        self._vx = np.zeros(capacity)
+        self._vy = np.zeros(capacity)
+        self._radius = np.zeros(capacity)
+        self._mass = np.zeros(capacity)
+        self._color = np.zeros((capacity, 3), dtype=np.uint8)
+        self._update_views()
+
+    def _update_views(self):
+        # Vistas sobre la parte ocupada de los buffers (sin copias)
+        n = self.n
+        self.x = self._x[:n]
+        self.y = self._y[:n]
+        self.vx = self._vx[:n]
+        self.vy = self._vy[:n]
+        self.radius = self._radius[:n]
+        self.mass = self._mass[:n]
+        self.color = self._color[:n]
+
+    def _reserve(self, capacity):
+        if capacity <= len(self._x):
+            return
+        capacity = max(capacity, 2 * len(self._x))
+        for name in ("_x", "_y", "_vx", "_vy", "_radius", "_mass", "_color"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, name, new)
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, index):
+        if not -self.n <= index < self.n:
+            raise IndexError("índice de partícula fuera de rango")
+        return Particle.view(self, index % self.n)
+
+    def __iter__(self):
+        for i in range(self.n):
+            yield Particle.view(self, i)
+
+    def add(self, x, y, vx, vy, radius=10, mass=1, color=None):
+        self._reserve(self.n + 1)
+        i = self.n
+        self._x[i] = x
+        self._y[i] = y
+        self._vx[i] = vx
+        self._vy[i] = vy
+        self._radius[i] = radius
+        self._mass[i] = mass
+        self._color[i] = random_color() if color is None else color
+        self.n += 1
+        self._update_views()
+        return i
+
+    def extend(self, x, y, vx, vy, radius, mass, color=None):
+        """Agrega muchas partículas a la vez a partir de arreglos"""
+        x = np.asarray(x, dtype=float)
+        count = len(x)
+        self._reserve(self.n + count)
+        s = slice(self.n, self.n + count)
+        self._x[s] = x
+        self._y[s] = y
+        self._vx[s] = vx
+        self._vy[s] = vy
+        self._radius[s] = radius
+        self._mass[s] = mass
+        if color is None:
+            color = np.random.randint(100, 256, size=(count, 3))
+        self._color[s] = color
+        self.n += count
+        self._update_views()
+
+    def move(self, dt):
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+
+    def wall_collision(self, width, height):
+        """Rebota contra las paredes; devuelve el impulso total que recibieron (sum 2 m |v|)"""
+        r = self.radius
+        left = self.x - r <= 0
+        right = ~left & (self.x + r >= width)
+        self.x[left] = r[left]
+        self.x[right] = width - r[right]
+        hit_x = left | right
+        self.vx[hit_x] *= -1
+
+        top = self.y - r <= 0
+        bottom = ~top & (self.y + r >= height)
+        self.y[top] = r[top]
+        self.y[bottom] = height - r[bottom]
+        hit_y = top | bottom
+        self.vy[hit_y] *= -1
+        return 2 * float(np.dot(self.mass[hit_x], np.abs(self.vx[hit_x]))
+                         + np.dot(self.mass[hit_y], np.abs(self.vy[hit_y])))
+
+    def clamp_speed(self, max_speed):
+        speed = np.hypot(self.vx, self.vy)
+        fast = speed > max_speed
+        if fast.any():
+            scale = max_speed / speed[fast]
+            self.vx[fast] *= scale
+            self.vy[fast] *= scale
+
+    def kinetic_energy(self):
+        return 0.5 * float(np.dot(self.mass, self.vx * self.vx + self.vy * self.vy))
+
+    def draw(self, surface):
+        for i in range(self.n):
+            pygame.draw.circle(surface, self.color[i].tolist(), (int(self.x[i]), int(self.y[i])), self.radius[i])
+
+
+def _field(name):
+    def get(self):
+        return float(getattr(self.system, name)[self.index])
+
+    def set(self, value):
+        getattr(self.system, name)[self.index] = value
+
+    return property(get, set)
+
 
 class Particle:
+    # Vista ligera sobre una fila de un ParticleSystem
+    __slots__ = ("system", "index")
+
     def __init__(self, x, y, vx, vy, radius=10, mass=1):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.radius = radius
-        self.mass = mass
-        self.color = (
-            random.randint(100, 255),
-            random.randint(100, 255),
-            random.randint(100, 255),
-        )
+        # Una partícula suelta tiene su propio sistema de una sola fila
+        self.system = ParticleSystem(1)
+        self.index = self.system.add(x, y, vx, vy, radius, mass)
+
+    @classmethod
+    def view(cls, system, index):
+        p = cls.__new__(cls)
+        p.system = system
+        p.index = index
+        return p
+
+    x = _field("x")
+    y = _field("y")
+    vx = _field("vx")
+    vy = _field("vy")
+    radius = _field("radius")
+    mass = _field("mass")
+
+    @property
+    def color(self):
+        return tuple(int(c) for c in self.system.color[self.index])
+
+    @color.setter
+    def color(self, value):
+        self.system.color[self.index] = value
 
     def move(self, dt):
         self.x += self.vx * dt
@@ -36,4 +192,4 @@ class Particle:
             self.vy *= -1
 
     def draw(self, surface):
-        pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), self.radius)
+        return pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), self.radius)
@@ -0,0 +1,175 @@
+"""Física del gas en un hilo aparte, desacoplada del dibujo
+
+El hilo avanza la simulación a paso fijo según el reloj real y publica
+instantáneas inmutables del estado en una cola acotada; el bucle de dibujo toma
+la que le toca sin esperar a la física, y la física no espera a display.flip.
+Los pasos de NumPy sueltan el GIL, así que los dos hilos avanzan a la vez.
+Las órdenes (pausar, reanudar, parar o cualquier función sobre la simulación)
+se mandan por otra cola y el hilo las ejecuta entre pasos: la simulación sólo la
+toca el hilo de física.
+"""
+import threading
+import time
+from collections import deque
+from queue import Queue, Empty
+import numpy as np
+from timestep import FixedTimestep
+
+
+class Snapshot:
+    """Estado del gas en un paso de física; x e y son de sólo lectura
+
+    Sigue siendo válida hasta la próxima llamada a PhysicsThread.take(): después sus
+    arreglos se reutilizan para otra instantánea.
+    """
+
+    __slots__ = ("step", "time", "x", "y", "kinetic_energy", "collisions", "_buffers")
+
+    def __init__(self, step, time, buffers, kinetic_energy, collisions):
+        self.step = step
+        self.time = time
+        self._buffers = buffers
+        self.x, self.y = buffers[2], buffers[3]
+        self.kinetic_energy = kinetic_energy
+        self.collisions = collisions
+
+
+def _buffers(n):
+    # Dos arreglos escribibles (sólo para el hilo) y sus vistas de sólo lectura
+    x, y = np.zeros(n), np.zeros(n)
+    x_view, y_view = x.view(), y.view()
+    x_view.flags.writeable = False
+    y_view.flags.writeable = False
+    return x, y, x_view, y_view
+
+
+class PhysicsThread:
+    """Corre simulation.step(dt) en un hilo y publica instantáneas
+
+    policy indica qué pasa cuando la cola (queue_size instantáneas) está llena:
+    "latest": se descarta la más vieja y take() devuelve siempre la más nueva; la
+    física nunca espera al dibujo (las descartadas se cuentan en dropped).
+    "block": la física espera a que se consuma; take() devuelve las instantáneas en
+    orden y no se pierde ninguna, pero un dibujo lento frena la simulación.
+    Hay queue_size + 2 juegos de arreglos: los de la cola, el que tiene el dibujo y
+    el que se está llenando, así que nunca se pisa una instantánea en uso.
+    on_step(simulation), si se da, corre en el hilo de física después de cada paso
+    (por ejemplo, para grabar la corrida).
+    """
+
+    def __init__(self, simulation, dt=1 / 60, max_steps=5, queue_size=2, policy="latest", on_step=None):
+        if policy not in ("latest", "block"):
+            raise ValueError(f"política desconocida: {policy}")
+        self.simulation = simulation
+        self.dt = dt
+        self.clock = FixedTimestep(dt, max_steps)
+        self.queue_size = queue_size
+        self.policy = policy
+        self.on_step = on_step
+        self.commands = Queue()
+        self.paused = False
+        self.published = 0
+        self.dropped = 0
+        n = len(simulation.particles)
+        self._free = [_buffers(n) for _ in range(queue_size + 2)]
+        self._queue = deque()
+        self._held = None
+        self._ready = threading.Condition()
+        self._running = False
+        self._last = 0.0
+        self._thread = threading.Thread(target=self._run, name="physics", daemon=True)
+
+    def start(self):
+        self._running = True
+        self._publish()  # el dibujo tiene algo que mostrar desde el primer cuadro
+        self._thread.start()
+
+    def stop(self, timeout=1.0):
+        # La bandera despierta a la física si espera cola libre; la orden, si está en pausa
+        self.send("stop")
+        with self._ready:
+            self._running = False
+            self._ready.notify_all()
+        self._thread.join(timeout)
+
+    def send(self, command, *args):
+        """Orden para el hilo: "pause", "resume", "stop" o "call" con una función(simulation)"""
+        self.commands.put((command, args))
+
+    def take(self):
+        """Instantánea a dibujar (la anterior vuelve a quedar libre); None si aún no hay"""
+        with self._ready:
+            if self._queue:
+                if self.policy == "latest":
+                    snapshot = self._queue.pop()
+                    while self._queue:
+                        self._free.append(self._queue.popleft()._buffers)
+                        self.dropped += 1
+                else:
+                    snapshot = self._queue.popleft()
+                if self._held is not None:
+                    self._free.append(self._held._buffers)
+                self._held = snapshot
+                self._ready.notify_all()
+            return self._held
+
+    def _publish(self):
+        with self._ready:
+            while len(self._queue) >= self.queue_size:
+                if self.policy == "latest":
+                    self._free.append(self._queue.popleft()._buffers)
+                    self.dropped += 1
+                else:
+                    if not self._running:
+                        return
+                    self._ready.wait(0.1)
+            buffers = self._free.pop()
+        simulation = self.simulation
+        particles = simulation.particles
+        np.copyto(buffers[0], particles.x)
+        np.copyto(buffers[1], particles.y)
+        snapshot = Snapshot(simulation.steps, simulation.time, buffers, particles.kinetic_energy(),
+                            simulation.collisions)
+        with self._ready:
+            self._queue.append(snapshot)
+            self.published += 1
+
+    def _handle(self, command, args):
+        if command == "pause":
+            self.paused = True
+        elif command == "resume":
+            # El tiempo en pausa no se recupera con pasos atrasados
+            self.paused = False
+            self.clock.accumulator = 0.0
+            self._last = time.perf_counter()
+        elif command == "stop":
+            self._running = False
+        elif command == "call":
+            args[0](self.simulation)
+            self._publish()
+        else:
+            raise ValueError(f"orden desconocida: {command}")
+
+    def _run(self):
+        self._last = time.perf_counter()
+        while self._running:
+            # En pausa se duerme esperando órdenes; si no, se atienden las pendientes
+            try:
+                command = self.commands.get(timeout=0.1) if self.paused else self.commands.get_nowait()
+                self._handle(*command)
+                continue
+            except Empty:
+                pass
+            if self.paused:
+                continue
+            now = time.perf_counter()
+            steps = self.clock.advance(now - self._last)
+            self._last = now
+            for _ in range(steps):
+                self.simulation.step(self.dt)
+                if self.on_step is not None:
+                    self.on_step(self.simulation)
+            if steps:
+                self._publish()
+            # Hasta el próximo paso no hay nada que hacer
+            time.sleep(max(self.dt - self.clock.accumulator, 0.0))
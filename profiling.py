@@ -0,0 +1,196 @@
+"""Temporizadores por cuadro, HUD de rendimiento y trazas en CSV/JSON
+
+    with profiler.section("physics"):
+        simulation.step(dt)
+    profiler.count("pairs", len(i))
+    profiler.end_frame()
+
+Apagado, section() devuelve siempre el mismo contexto vacío y count() no hace
+nada, así que las llamadas pueden quedar en los bucles sin costo apreciable.
+Se prende con F3 en las escenas o desde el arranque con la variable de entorno
+SIM_PROFILE; si su valor termina en .csv o .json, al salir se guarda ahí la traza.
+Con la física del gas en otro hilo (physics_thread), ese hilo suma sus secciones
+en el mismo profiler: tiempos y contadores se tocan con un lock, así que lo que
+mide la física cuenta en el cuadro de dibujo en el que terminó, y cada hilo usa
+sus propios objetos de sección.
+pygame se importa sólo para el HUD y la tecla: la física lo puede usar sin ventana.
+"""
+import atexit
+import csv
+import json
+import os
+import threading
+import time
+from collections import deque
+
+PROFILE_ENV = "SIM_PROFILE"
+TOGGLE_KEY = "K_F3"  # nombre de la constante de pygame
+HUD_REFRESH = 15  # cuadros entre actualizaciones del texto del HUD
+
+
+class _NullSection:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class _Section:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        profiler = self.profiler
+        # Se suma: una sección puede abrirse varias veces por cuadro (subpasos)
+        with profiler._lock:
+            times = profiler.times
+            times[self.name] = times.get(self.name, 0.0) + elapsed
+        return False
+
+
+class Profiler:
+    """Tiempos por sección y contadores de cada cuadro
+
+    Guarda los últimos window cuadros para el promedio del HUD y, si record está
+    activo, todos los cuadros (hasta max_frames) para exportarlos.
+    """
+
+    def __init__(self, enabled=False, window=60, record=False, max_frames=100000):
+        self.enabled = enabled
+        self.record = record
+        self.recent = deque(maxlen=window)
+        self.trace = deque(maxlen=max_frames)
+        self.times = {}
+        self.counters = {}
+        self.counter_names = set()
+        self.frame = 0
+        self.last_frame_end = None
+        self._sections = {}
+        self._hud_lines = []
+        self._lock = threading.Lock()
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        with self._lock:
+            self.times.clear()
+            self.counters.clear()
+        self.recent.clear()
+        self.last_frame_end = None
+
+    def handle_event(self, event):
+        import pygame
+        if event.type == pygame.KEYDOWN and event.key == getattr(pygame, TOGGLE_KEY):
+            self.toggle()
+
+    def section(self, name):
+        if not self.enabled:
+            return _NULL_SECTION
+        # Una por hilo: el inicio guardado en la sección no se pisa entre hilos
+        key = (name, threading.get_ident())
+        section = self._sections.get(key)
+        if section is None:
+            section = self._sections[key] = _Section(self, name)
+        return section
+
+    def count(self, name, value):
+        if self.enabled:
+            with self._lock:
+                self.counters[name] = self.counters.get(name, 0) + value
+                self.counter_names.add(name)
+
+    def end_frame(self):
+        """Cierra el cuadro: pasa los tiempos (en ms) y contadores a la historia"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        row = {"frame": self.frame}
+        if self.last_frame_end is not None:
+            row["frame_ms"] = (now - self.last_frame_end) * 1000
+        with self._lock:
+            row.update((name, seconds * 1000) for name, seconds in self.times.items())
+            row.update(self.counters)
+            self.times.clear()
+            self.counters.clear()
+        self.last_frame_end = now
+        self.frame += 1
+        self.recent.append(row)
+        if self.record:
+            self.trace.append(row)
+
+    def averages(self):
+        """Promedio de cada columna en la ventana reciente (0 en los cuadros sin ella)"""
+        if not self.recent:
+            return {}
+        totals = {}
+        for row in self.recent:
+            for name, value in row.items():
+                if name != "frame":
+                    totals[name] = totals.get(name, 0.0) + value
+        return {name: total / len(self.recent) for name, total in totals.items()}
+
+    def draw_hud(self, surface, font, pos=(10, 40), color=(255, 255, 0)):
+        """Dibuja los promedios; devuelve el área ocupada (None si está apagado)"""
+        if not self.enabled:
+            return None
+        from rendering import render_text
+        if self.frame % HUD_REFRESH == 0 or not self._hud_lines:
+            # El texto cambia poco a poco: así no se llena la caché de textos
+            averages = self.averages()
+            lines = []
+            frame_ms = averages.pop("frame_ms", 0.0)
+            if frame_ms > 0:
+                lines.append(f"FPS: {1000 / frame_ms:.0f} ({frame_ms:.2f} ms)")
+            for name, value in averages.items():
+                if name in self.counter_names:
+                    lines.append(f"{name}: {value:.0f}")
+                else:
+                    lines.append(f"{name}: {value:.2f} ms")
+            self._hud_lines = lines
+        area = None
+        x, y = pos
+        for line in self._hud_lines:
+            rect = surface.blit(render_text(font, line, color), (x, y))
+            area = rect if area is None else area.union(rect)
+            y += rect.height
+        return area
+
+    def export(self, path):
+        """Guarda la traza como CSV o JSON según la extensión"""
+        rows = list(self.trace)
+        if path.endswith(".json"):
+            with open(path, "w") as f:
+                json.dump(rows, f, indent=1)
+            return
+        columns = []
+        for row in rows:
+            columns.extend(name for name in row if name not in columns)
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+def _from_env():
+    value = os.environ.get(PROFILE_ENV, "")
+    trace_path = value if value.endswith((".csv", ".json")) else None
+    instance = Profiler(enabled=bool(value) and value != "0", record=trace_path is not None)
+    if trace_path is not None:
+        atexit.register(instance.export, trace_path)
+    return instance
+
+
+# Instancia compartida por todas las escenas (y por la física del gas, aun en su hilo)
+profiler = _from_env()
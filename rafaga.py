@@ -0,0 +1,161 @@
+"""Modo ráfaga: cientos de proyectiles en el aire contra muchos objetivos
+
+Los proyectiles son arreglos de NumPy y avanzan con la solución exacta del tiro sin
+aire. Los choques se buscan con un índice de objetivos ordenados por x, así que cada
+proyectil sólo se prueba contra los objetivos que tiene debajo. Sin nada de pygame:
+sirve igual para la escena del juego y para pruebas de carga sin ventana.
+Mismo sistema que trayectoria.py: metros, origen en el cañón y el eje y hacia arriba.
+"""
+import numpy as np
+from trayectoria import GRAVEDAD
+from profiling import profiler
+
+
+class IndiceObjetivos:
+    """Rectángulos (izquierda, abajo, derecha, arriba) ordenados por su borde izquierdo"""
+
+    def __init__(self, izquierda, abajo, derecha, arriba):
+        self.izquierda, self.abajo, self.derecha, self.arriba = (
+            np.asarray(b, dtype=float) for b in (izquierda, abajo, derecha, arriba))
+        self.orden = np.argsort(self.izquierda, kind="stable")
+        self.izquierda_ordenada = self.izquierda[self.orden]
+        self.derecha_ordenada = self.derecha[self.orden]
+        self.ancho_max = float((self.derecha - self.izquierda).max()) if len(self.orden) else 0.0
+
+    def __len__(self):
+        return len(self.orden)
+
+    def candidatos(self, x_min, x_max):
+        """Pares (consulta, objetivo) cuyos intervalos en x se solapan
+
+        Con búsqueda binaria: los objetivos que pueden solaparse con [x_min, x_max]
+        tienen el borde izquierdo entre x_min - ancho máximo y x_max.
+        """
+        desde = np.searchsorted(self.izquierda_ordenada, x_min - self.ancho_max, side="left")
+        hasta = np.searchsorted(self.izquierda_ordenada, x_max, side="right")
+        cuantos = hasta - desde
+        consulta = np.repeat(np.arange(len(x_min)), cuantos)
+        # Posición en el orden de cada par: desde de su consulta + 0, 1, 2...
+        k = np.arange(cuantos.sum()) + np.repeat(desde - np.cumsum(cuantos) + cuantos, cuantos)
+        solapa = self.derecha_ordenada[k] >= x_min[consulta]
+        return consulta[solapa], self.orden[k[solapa]]
+
+
+def _entrada_segmento(x0, y0, x1, y1, izquierda, abajo, derecha, arriba):
+    """Fracción del segmento (0 a 1) en que entra en el rectángulo, o inf si no entra"""
+    entrada = np.zeros(len(x0))
+    salida = np.ones(len(x0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for p0, p1, lo, hi in ((x0, x1, izquierda, derecha), (y0, y1, abajo, arriba)):
+            d = p1 - p0
+            a = (lo - p0) / d
+            b = (hi - p0) / d
+            quieto = d == 0
+            # Si no se mueve en este eje, o está siempre dentro de la franja o nunca
+            dentro = (p0 >= lo) & (p0 <= hi)
+            a = np.where(quieto, np.where(dentro, -np.inf, np.inf), a)
+            b = np.where(quieto, np.where(dentro, np.inf, -np.inf), b)
+            entrada = np.maximum(entrada, np.minimum(a, b))
+            salida = np.minimum(salida, np.maximum(a, b))
+    return np.where(entrada <= salida, entrada, np.inf)
+
+
+class Rafaga:
+    """Cielo lleno de proyectiles contra num_objetivos objetivos que reaparecen al ser alcanzados
+
+    Cada paso lanza hasta por_paso proyectiles nuevos para mantener num_proyectiles en el
+    aire, los avanza y busca choques barridos entre la posición anterior y la nueva
+    (el proyectil avanza más que el ancho del objetivo en un cuadro).
+    """
+
+    def __init__(self, num_proyectiles=300, num_objetivos=40, rng=None, radio=0.5, ancho=1.0,
+                 alto=4.0, x_max=None, gravedad=GRAVEDAD, por_paso=10):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.num_proyectiles = num_proyectiles
+        self.radio = radio
+        self.ancho = ancho
+        self.alto = alto
+        self.x_max = np.inf if x_max is None else x_max
+        self.g = gravedad
+        self.por_paso = por_paso
+        self.vx = np.zeros(0)
+        self.vy = np.zeros(0)
+        self.t = np.zeros(0)
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        # Objetivos como en el juego: (x, y) es la esquina superior izquierda
+        self.objetivo_x = self.rng.uniform(35, 70, num_objetivos)
+        self.objetivo_y = self.rng.uniform(3, 30, num_objetivos)
+        self.indice = self._indexar()
+        self.lanzados = 0
+        self.aciertos = 0
+        self.caidos = 0
+
+    def __len__(self):
+        return len(self.vx)
+
+    def _indexar(self):
+        return IndiceObjetivos(self.objetivo_x, self.objetivo_y - self.alto,
+                               self.objetivo_x + self.ancho, self.objetivo_y)
+
+    def lanzar(self, masas, angulos_deg, energias):
+        masas, angulos, energias = np.broadcast_arrays(masas, np.radians(angulos_deg), energias)
+        v0 = np.sqrt(2 * energias / masas)
+        n = len(v0)
+        self.vx = np.concatenate([self.vx, v0 * np.cos(angulos)])
+        self.vy = np.concatenate([self.vy, v0 * np.sin(angulos)])
+        self.t = np.concatenate([self.t, np.zeros(n)])
+        self.x = np.concatenate([self.x, np.zeros(n)])
+        self.y = np.concatenate([self.y, np.zeros(n)])
+        self.lanzados += n
+
+    def _quitar(self, fuera):
+        queda = ~fuera
+        self.vx, self.vy, self.t, self.x, self.y = (
+            a[queda] for a in (self.vx, self.vy, self.t, self.x, self.y))
+
+    def choques(self, x0, y0):
+        """(proyectil, objetivo) con el primer objetivo que toca cada proyectil en este paso"""
+        r = self.radio
+        with profiler.section("broad_phase"):
+            p, o = self.indice.candidatos(np.minimum(x0, self.x) - r, np.maximum(x0, self.x) + r)
+        profiler.count("pairs", len(p))
+        indice = self.indice
+        # Rectángulo agrandado por el radio (las esquinas quedan en ángulo recto)
+        with profiler.section("narrow_phase"):
+            s = _entrada_segmento(x0[p], y0[p], self.x[p], self.y[p], indice.izquierda[o] - r,
+                                  indice.abajo[o] - r, indice.derecha[o] + r, indice.arriba[o] + r)
+        toca = np.isfinite(s)
+        p, o, s = p[toca], o[toca], s[toca]
+        orden = np.lexsort((s, p))
+        p, o = p[orden], o[orden]
+        primero = np.ones(len(p), dtype=bool)
+        primero[1:] = p[1:] != p[:-1]
+        return p[primero], o[primero]
+
+    def step(self, dt):
+        """Avanza dt; devuelve los índices de los objetivos alcanzados (ya recolocados)"""
+        faltan = min(self.num_proyectiles - len(self), self.por_paso)
+        if faltan > 0:
+            # Ángulos y energías por kg que caen aproximadamente en la zona de objetivos
+            self.lanzar(1.0, self.rng.uniform(20, 70, faltan), self.rng.uniform(150, 700, faltan))
+
+        x0, y0 = self.x, self.y
+        self.t = self.t + dt
+        self.x = self.vx * self.t
+        self.y = self.vy * self.t - 0.5 * self.g * self.t * self.t
+
+        p, o = self.choques(x0, y0)
+        golpe = np.zeros(len(self), dtype=bool)
+        golpe[p] = True
+        cae = ((self.y < 0) | (self.x > self.x_max)) & ~golpe
+        self.aciertos += len(p)
+        self.caidos += int(np.count_nonzero(cae))
+        self._quitar(golpe | cae)
+
+        alcanzados = np.unique(o)
+        if alcanzados.size:
+            self.objetivo_x[alcanzados] = self.rng.uniform(35, 70, alcanzados.size)
+            self.objetivo_y[alcanzados] = self.rng.uniform(3, 30, alcanzados.size)
+            self.indice = self._indexar()
+        return alcanzados
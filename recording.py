@@ -0,0 +1,219 @@
+"""Grabación de corridas en archivos mapeados en memoria, para verlas después
+
+    with gas_writer("corrida.traj", simulation, dt, stride=5, quantize=True) as writer:
+        for _ in range(steps):
+            simulation.step(dt)
+            record_gas(writer, simulation)
+
+    trajectory = Trajectory("corrida.traj")
+    frame = trajectory[1234]  # sólo se leen las páginas de ese cuadro
+    frame["x"], trajectory.meta["radius"]
+
+Formato: MAGIC, cantidad de cuadros (uint64), largo del encabezado (uint64), el
+encabezado en JSON (campos, stride y los datos fijos de la escena) y, desde un
+múltiplo de ALIGN bytes, los cuadros. Todos los cuadros son un registro de NumPy
+del mismo tamaño, así que el cuadro i está en data_offset + i * itemsize: ir a
+cualquiera es O(1) sin cargar el archivo. El archivo crece de a CHUNK_FRAMES
+cuadros y la cantidad grabada se anota en cada crecimiento y al cerrar: si el
+programa se corta, el archivo se puede abrir con los cuadros anotados hasta ahí.
+"""
+import json
+import struct
+import numpy as np
+
+MAGIC = b"SIMTRAJ1"
+_PREFIX = struct.Struct("<8sQQ")
+_COUNT = struct.Struct("<Q")
+ALIGN = 64
+CHUNK_FRAMES = 1024
+
+
+def _aligned(size):
+    return -(-size // ALIGN) * ALIGN
+
+
+def _frame_dtype(fields):
+    return np.dtype([(name, dtype, tuple(shape)) for name, dtype, shape in fields])
+
+
+class TrajectoryWriter:
+    """Escribe cuadros de tamaño fijo en un archivo que crece por bloques
+
+    fields: lista de (nombre, dtype, forma), con forma () para escalares o un entero
+    para arreglos de una dimensión. Sólo se guarda una de cada stride llamadas a
+    append(); con quantize los arreglos de floats se guardan en float32 (la mitad de
+    espacio), pero los escalares (paso, tiempo, contadores) quedan exactos.
+    """
+
+    def __init__(self, path, fields, meta=None, stride=1, quantize=False, chunk_frames=CHUNK_FRAMES):
+        stored = []
+        for name, dtype, shape in fields:
+            dtype = np.dtype(dtype)
+            shape = (shape,) if isinstance(shape, int) else tuple(shape)
+            if quantize and shape and dtype.kind == "f":
+                dtype = np.dtype(np.float32)
+            stored.append((name, dtype.str, list(shape)))
+        self.path = path
+        self.dtype = _frame_dtype(stored)
+        self.stride = stride
+        self.chunk_frames = chunk_frames
+        self.frames = 0
+        self.calls = 0
+        header = json.dumps({"fields": stored, "stride": stride, "meta": meta or {}}).encode()
+        self.data_offset = _aligned(_PREFIX.size + len(header))
+        self._file = open(path, "w+b")
+        self._file.write(_PREFIX.pack(MAGIC, 0, len(header)))
+        self._file.write(header)
+        self._map = None
+        self._capacity = 0
+        self._grow()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def _grow(self):
+        # El mapa viejo se suelta antes de agrandar el archivo (en Windows es obligatorio)
+        if self._map is not None:
+            self._map.flush()
+            self._map = None
+        self._capacity += self.chunk_frames
+        self._file.truncate(self.data_offset + self._capacity * self.dtype.itemsize)
+        self._map = np.memmap(self._file, self.dtype, "r+", self.data_offset, (self._capacity,))
+        self._write_count()
+
+    def _write_count(self):
+        self._file.seek(len(MAGIC))
+        self._file.write(_COUNT.pack(self.frames))
+        self._file.flush()
+
+    def append(self, **values):
+        """Guarda un cuadro con los campos dados (los que falten quedan en cero)"""
+        call = self.calls
+        self.calls += 1
+        if call % self.stride:
+            return
+        if self.frames == self._capacity:
+            self._grow()
+        frame = self._map[self.frames]
+        for name, value in values.items():
+            frame[name] = value
+        self.frames += 1
+
+    def flush(self):
+        self._map.flush()
+        self._write_count()
+
+    def close(self):
+        """Anota la cantidad de cuadros y recorta el bloque sin usar"""
+        if self._file.closed:
+            return
+        self._map.flush()
+        self._map = None
+        self._file.truncate(self.data_offset + self.frames * self.dtype.itemsize)
+        self._write_count()
+        self._file.close()
+
+
+class Trajectory:
+    """Grabación abierta sin leerla: cada cuadro se lee recién al pedirlo"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            magic, frames, header_size = _PREFIX.unpack(f.read(_PREFIX.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path} no es una grabación")
+            header = json.loads(f.read(header_size))
+        self.path = path
+        self.meta = header["meta"]
+        self.stride = header["stride"]
+        self.dtype = _frame_dtype(header["fields"])
+        if frames:
+            offset = _aligned(_PREFIX.size + header_size)
+            self.frames = np.memmap(path, self.dtype, "r", offset, (frames,))
+        else:
+            self.frames = np.zeros(0, self.dtype)
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __getitem__(self, index):
+        return self.frames[index]
+
+    @property
+    def fields(self):
+        return self.dtype.names
+
+    def field(self, name):
+        """Una columna como vista sobre el archivo (se lee al recorrerla)"""
+        return self.frames[name]
+
+
+# --------- Escenas ---------
+# Cada escena tiene su writer (campos y datos fijos) y su record_*, que se llama
+# después de cada paso de física. "scene" en meta le dice a replay.py cómo dibujarla.
+
+def gas_writer(path, simulation, dt, **options):
+    """Posiciones y velocidades de cada partícula del gas"""
+    p = simulation.particles
+    n = len(p)
+    fields = [("step", "i8", ()), ("time", "f8", ()), ("collisions", "i8", ()),
+              ("x", "f8", n), ("y", "f8", n), ("vx", "f8", n), ("vy", "f8", n)]
+    meta = {"scene": "gas", "dt": dt, "size": [simulation.width, simulation.height],
+            "engine": simulation.engine, "radius": p.radius.tolist(), "mass": p.mass.tolist(),
+            "color": p.color.tolist()}
+    return TrajectoryWriter(path, fields, meta, **options)
+
+
+def record_gas(writer, simulation):
+    p = simulation.particles
+    writer.append(step=simulation.steps, time=simulation.time, collisions=simulation.collisions,
+                  x=p.x, y=p.y, vx=p.vx, vy=p.vy)
+
+
+def spring_writer(path, spring, dt, size=(800, 600), **options):
+    """Resorte vertical (springs.VerticalSpring); k y masa se guardan porque cambian"""
+    fields = [("step", "i8", ()), ("time", "f8", ()), ("y", "f8", ()), ("vy", "f8", ()),
+              ("k", "f8", ()), ("mass", "f8", ()), ("oscillations", "i8", ())]
+    particle = spring.particle
+    meta = {"scene": "spring", "dt": dt, "size": list(size), "fixed_point": list(spring.fixed_point),
+            "x": particle.x, "radius": particle.radius, "integrator": spring.integrator}
+    return TrajectoryWriter(path, fields, meta, **options)
+
+
+def record_spring(writer, spring, step, time):
+    p = spring.particle
+    writer.append(step=step, time=time, y=p.y, vy=p.vy, k=spring.k, mass=p.mass,
+                  oscillations=spring.oscillation_count)
+
+
+def impact_writer(path, impact, dt, size=(1000, 600), **options):
+    """Choque contra el resorte horizontal (springs.SpringImpact)"""
+    fields = [("step", "i8", ()), ("time", "f8", ()), ("x", "f8", ()), ("vx", "f8", ()),
+              ("restoring_force", "f8", ()), ("contacts", "i8", ()), ("k", "f8", ()), ("mass", "f8", ())]
+    particle = impact.particle
+    meta = {"scene": "impact", "dt": dt, "size": list(size), "x0": impact.x0, "y": particle.y,
+            "radius": particle.radius, "pixels_per_meter": impact.pixels_per_meter, "engine": impact.engine}
+    return TrajectoryWriter(path, fields, meta, **options)
+
+
+def record_impact(writer, impact, step):
+    p = impact.particle
+    writer.append(step=step, time=impact.time, x=p.x, vx=p.vx, restoring_force=impact.restoring_force,
+                  contacts=impact.contacts, k=impact.k, mass=p.mass)
+
+
+def projectile_writer(path, scale, base, projectile_radius, target_size, size=(800, 600), **options):
+    """Juego de tiro parabólico, un cuadro por cuadro dibujado (posiciones en metros)
+
+    El juego espera quieto entre disparos, así que los cuadros no van a paso fijo:
+    el tiempo de cada uno está en "time".
+    """
+    fields = [("time", "f8", ()), ("in_flight", "u1", ()), ("x", "f8", ()), ("y", "f8", ()),
+              ("target_x", "f8", ()), ("target_y", "f8", ()), ("lives", "i4", ()), ("hits", "i4", ())]
+    meta = {"scene": "projectile", "dt": None, "size": list(size), "scale": scale, "base": list(base),
+            "radius": projectile_radius, "target_size": list(target_size)}
+    return TrajectoryWriter(path, fields, meta, **options)
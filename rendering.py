@@ -0,0 +1,263 @@
+from collections import OrderedDict
+import numpy as np
+import pygame
+
+
+def blit_all(surface, sequence):
+    # fblits (pygame-ce) no devuelve rectángulos y es la variante más rápida
+    fblits = getattr(surface, "fblits", None)
+    if fblits is not None:
+        fblits(sequence)
+    else:
+        surface.blits(sequence, doreturn=False)
+
+
+class SpriteCache:
+    """Discos ya rasterizados por (radio, color), con desalojo LRU"""
+
+    def __init__(self, max_size=4096):
+        self.max_size = max_size
+        self.sprites = OrderedDict()
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def get(self, radius, color):
+        key = (radius, color)
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            return sprite
+        size = 2 * radius
+        sprite = pygame.Surface((size, size))
+        # Color clave para el fondo transparente (distinto del color del disco)
+        key_color = (0, 0, 0) if color != (0, 0, 0) else (255, 0, 255)
+        sprite.fill(key_color)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()  # mismo formato que la pantalla: blit más rápido
+        sprite.set_colorkey(key_color, pygame.RLEACCEL)
+        self.sprites[key] = sprite
+        if len(self.sprites) > self.max_size:
+            self.sprites.popitem(last=False)
+        return sprite
+
+
+class ParticleRenderer:
+    """Dibuja toda la población con una sola llamada a blits
+
+    color_step agrupa los colores en escalones (p. ej. 16). Si aun así hay más
+    combinaciones (radio, color) que sprites en la caché, el escalón se duplica hasta
+    que quepan, para no rasterizar miles de discos en cada cuadro.
+    Radio y color no cambian después de crear las partículas: el sprite de cada una
+    se elige una vez por población y se vuelve a elegir sólo si llegan otros arreglos
+    (ParticleSystem.extend crea vistas nuevas) o tras invalidate(). En cada cuadro
+    sólo se calculan las esquinas.
+    """
+
+    def __init__(self, cache=None, color_step=None):
+        self.cache = cache if cache is not None else SpriteCache()
+        self.color_step = color_step
+        self.invalidate()
+
+    def invalidate(self):
+        """Olvida los sprites elegidos (si se cambió el radio o el color en el lugar)"""
+        self._source = None
+        self._radius = None
+        self._sprites = None
+
+    def draw(self, surface, system):
+        self.draw_arrays(surface, system.x, system.y, system.radius, system.color)
+
+    def _choose_sprites(self, radius, color):
+        r = radius.astype(np.int64)
+        color = color.astype(np.int64)
+        step = self.color_step or 1
+        while True:
+            c = color // step * step if step > 1 else color
+            # Una clave entera por (radio, color) para agrupar con np.unique
+            keys = (r << 24) | (c[:, 0] << 16) | (c[:, 1] << 8) | c[:, 2]
+            unique, inverse = np.unique(keys, return_inverse=True)
+            if len(unique) <= self.cache.max_size or step >= 256:
+                break
+            step *= 2
+        sprites = [
+            self.cache.get(int(k >> 24), (int(k >> 16) & 255, int(k >> 8) & 255, int(k) & 255))
+            for k in unique
+        ]
+        self._radius = r
+        self._sprites = [sprites[k] for k in inverse.ravel().tolist()]
+
+    def draw_arrays(self, surface, x, y, radius, color):
+        if len(x) == 0:
+            return
+        # Se guardan los arreglos mismos: mientras estén aquí su identidad no se reusa
+        source = self._source
+        if source is None or source[0] is not radius or source[1] is not color:
+            self._choose_sprites(radius, color)
+            self._source = (radius, color)
+        r = self._radius
+        corners = np.stack((x.astype(np.int64) - r, y.astype(np.int64) - r), axis=1).tolist()
+        blit_all(surface, zip(self._sprites, corners))
+
+
+class TextCache:
+    """Superficies de texto ya renderizadas por (fuente, texto, color), con desalojo LRU"""
+
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+
+    def __len__(self):
+        return len(self.surfaces)
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+
+# Caché compartida por todas las pantallas
+text_cache = TextCache()
+
+
+def render_text(font, text, color, antialias=True):
+    return text_cache.render(font, text, color, antialias)
+
+
+class StaticLayer:
+    """Fondo con lo que no cambia entre cuadros (rectángulos, rótulos, botones)
+
+    build(surface) dibuja la capa completa. Se vuelve a construir sólo si se llama
+    a invalidate() o si cambia la clave que se pasa a blit (p. ej. (pausado, iniciado)).
+    pos permite usarla también como panel encima de otras cosas (p. ej. un botón).
+    """
+
+    def __init__(self, size, build, pos=(0, 0)):
+        self.size = size
+        self.build = build
+        self.pos = pos
+        self.surface = None
+        self.key = None
+        self.dirty = True
+
+    def invalidate(self):
+        self.dirty = True
+
+    def refresh(self, key=None):
+        """Reconstruye la capa si hace falta; devuelve True si cambió"""
+        if not self.dirty and self.surface is not None and key == self.key:
+            return False
+        if self.surface is None:
+            self.surface = pygame.Surface(self.size)
+            if pygame.display.get_surface() is not None:
+                self.surface = self.surface.convert()
+        self.build(self.surface)
+        self.key = key
+        self.dirty = False
+        return True
+
+    def blit(self, target, key=None):
+        self.refresh(key)
+        return target.blit(self.surface, self.pos)
+
+    def restore(self, target, rect):
+        """Vuelve a poner el fondo sólo dentro de rect"""
+        area = pygame.Rect(rect).move(-self.pos[0], -self.pos[1])
+        return target.blit(self.surface, rect, area)
+
+
+class DirtyRects:
+    """Actualización de pantalla por rectángulos sucios
+
+    Cada cuadro: begin() borra lo dibujado en el cuadro anterior restaurando el fondo,
+    se dibujan los objetos que se mueven registrando sus rectángulos con add(), y
+    finish() manda a la pantalla sólo esos rectángulos (los de ahora y los de antes).
+    Se redibuja todo en el primer cuadro, al cambiar la clave del fondo, tras
+    invalidate() (cambio de escena) o si hay más de max_rects regiones.
+    Con enabled=False se comporta como el clásico fondo completo + flip.
+    """
+
+    def __init__(self, background, enabled=True, max_rects=64):
+        self.background = background
+        self.enabled = enabled
+        self.max_rects = max_rects
+        self.previous = []
+        self.current = []
+        self.full = True
+        self.overflow = False
+
+    def invalidate(self):
+        self.full = True
+
+    def handle_event(self, event):
+        if event.type in _REDRAW_EVENTS:
+            self.invalidate()
+
+    def begin(self, screen, key=None):
+        if self.background.refresh(key) or self.full or not self.enabled:
+            self.background.blit(screen)
+            self.full = True
+        else:
+            for rect in self.previous:
+                self.background.restore(screen, rect)
+
+    def add(self, rect):
+        if rect is not None and not self.overflow:
+            if len(self.current) >= self.max_rects:
+                self.overflow = True
+            else:
+                self.current.append(pygame.Rect(rect))
+        return rect
+
+    def add_disks(self, x, y, radius):
+        if self.overflow or len(self.current) + len(x) > self.max_rects:
+            self.overflow = True
+            return
+        r = radius.astype(np.int64)
+        left = x.astype(np.int64) - r
+        top = y.astype(np.int64) - r
+        size = (2 * r).tolist()
+        self.current.extend(map(pygame.Rect, left.tolist(), top.tolist(), size, size))
+
+    def finish(self):
+        if self.full or self.overflow or not self.enabled:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.previous + self.current)
+        self.previous = self.current
+        self.current = []
+        # Si no se pudieron anotar todas las regiones, el próximo cuadro va completo
+        self.full = self.overflow
+        self.overflow = False
+
+
+def get_events(idle=False, clock=None, timeout=0):
+    """Eventos pendientes, como pygame.event.get()
+
+    Con idle=True (escena quieta: menús, pausa, pantallas finales) duerme en
+    pygame.event.wait hasta que llegue algo, o hasta timeout ms si es > 0 (para
+    animaciones lentas), en vez de redibujar lo mismo a 60 FPS. Si se pasa el
+    clock, al despertar se reinicia su medida: la espera no cuenta como cuadro.
+    """
+    if not idle:
+        return pygame.event.get()
+    first = pygame.event.wait(timeout) if timeout > 0 else pygame.event.wait()
+    if clock is not None:
+        clock.tick()
+    events = pygame.event.get()
+    return events if first.type == pygame.NOEVENT else [first] + events
+
+
+# Eventos tras los que hay que redibujar la ventana completa
+_REDRAW_EVENTS = {
+    getattr(pygame, name) for name in ("VIDEORESIZE", "VIDEOEXPOSE", "WINDOWRESIZED", "WINDOWEXPOSED")
+    if hasattr(pygame, name)
+}
@@ -0,0 +1,190 @@
+"""Visor de grabaciones hechas con recording.py (gas, resortes y tiro parabólico)
+
+    python replay.py corrida.traj
+    python replay.py corrida.traj --frame 5000 --speed 4
+
+ESPACIO pausa, ←/→ avanza o retrocede un cuadro (con SHIFT, 100), INICIO/FIN van
+a los extremos, ↑/↓ cambian la velocidad y un clic (o arrastre) en la barra de
+abajo salta a ese punto. El archivo no se carga: cada cuadro se lee del mapa en
+memoria recién al dibujarlo, así que saltar a cualquier cuadro cuesta lo mismo.
+"""
+import argparse
+import bisect
+import numpy as np
+import pygame
+from recording import Trajectory
+from rendering import ParticleRenderer, get_events
+
+WHITE = (255, 255, 255)
+BAR_HEIGHT = 24
+SPEEDS = [0.125, 0.25, 0.5, 1, 2, 4, 8, 16, 32, 64]
+
+
+# --------- Escenas ---------
+# Cada una recibe los datos fijos (meta) y devuelve draw(surface, frame) -> líneas de texto
+
+def gas_view(meta):
+    radius = np.array(meta["radius"])
+    mass = np.array(meta["mass"])
+    color = np.array(meta["color"], dtype=np.uint8)
+    renderer = ParticleRenderer()
+
+    def draw(surface, frame):
+        surface.fill((0, 0, 0))
+        renderer.draw_arrays(surface, frame["x"], frame["y"], radius, color)
+        vx, vy = frame["vx"], frame["vy"]
+        kinetic_energy = 0.5 * float(np.dot(mass, vx * vx + vy * vy))
+        return [f"Energía Cinética: {kinetic_energy:.2f}", f"Choques: {frame['collisions']}"]
+    return draw
+
+
+def spring_view(meta):
+    fixed_point = tuple(meta["fixed_point"])
+    x = meta["x"]
+    radius = meta["radius"]
+
+    def draw(surface, frame):
+        surface.fill((0, 0, 0))
+        y = float(frame["y"])
+        pygame.draw.line(surface, WHITE, fixed_point, (x, y), 2)
+        pygame.draw.circle(surface, (255, 0, 0), fixed_point, 10)
+        pygame.draw.circle(surface, (0, 200, 255), (int(x), int(y)), radius)
+        return [f"Oscilaciones: {frame['oscillations']}",
+                f"k: {frame['k']:.1f} N/m   Masa: {frame['mass']:.1f} kg"]
+    return draw
+
+
+def impact_view(meta):
+    from simulacion_de_choque import draw_spring
+    x0 = meta["x0"]
+    y = meta["y"]
+    radius = meta["radius"]
+
+    def draw(surface, frame):
+        surface.fill((30, 30, 30))
+        x = float(frame["x"])
+        draw_spring(surface, x0, x + radius, y)
+        pygame.draw.circle(surface, WHITE, (int(x), int(y)), radius)
+        return [f"Fuerza recuperadora: {frame['restoring_force']:.2f} N   Contactos: {frame['contacts']}",
+                f"k: {frame['k']:.1f} N/m   Masa: {frame['mass']:.2f} kg"]
+    return draw
+
+
+def projectile_view(meta):
+    scale = meta["scale"]
+    base_x, base_y = meta["base"]
+    radius = meta["radius"]
+    target_w, target_h = (int(side * scale) for side in meta["target_size"])
+
+    def to_screen(x_m, y_m):
+        return int(x_m * scale) + base_x, base_y - int(y_m * scale)
+
+    def draw(surface, frame):
+        surface.fill(WHITE)
+        pygame.draw.circle(surface, (80, 80, 80), (base_x, base_y), 18)
+        pygame.draw.rect(surface, (255, 0, 0), (*to_screen(frame["target_x"], frame["target_y"]),
+                                                target_w, target_h))
+        if frame["in_flight"]:
+            pygame.draw.circle(surface, (0, 0, 0), to_screen(frame["x"], frame["y"]), radius)
+        return [f"Vidas: {frame['lives']}   Aciertos: {frame['hits']}/5"]
+    return draw
+
+
+VIEWS = {
+    "gas": gas_view,
+    "spring": spring_view,
+    "impact": impact_view,
+    "projectile": projectile_view,
+}
+TEXT_COLORS = {"projectile": (0, 0, 0)}
+
+
+def replay(path, start_frame=0, speed=1):
+    trajectory = Trajectory(path)
+    if not len(trajectory):
+        raise SystemExit(f"{path} no tiene cuadros")
+    meta = trajectory.meta
+    width, height = meta.get("size", (800, 600))
+    pygame.init()
+    screen = pygame.display.set_mode((width, height + BAR_HEIGHT))
+    pygame.display.set_caption(f"Reproducción: {path}")
+    clock = pygame.time.Clock()
+    font = pygame.font.SysFont(None, 24)
+    draw_scene = VIEWS[meta["scene"]](meta)
+    text_color = TEXT_COLORS.get(meta["scene"], WHITE)
+    # Columna de tiempos sobre el archivo: bisect sólo lee log(n) valores
+    times = trajectory.field("time")
+    last = len(trajectory) - 1
+    bar = pygame.Rect(0, height, width, BAR_HEIGHT)
+
+    frame_index = min(max(start_frame, 0), last)
+    playback_time = float(times[frame_index])
+    speed_index = min(range(len(SPEEDS)), key=lambda i: abs(SPEEDS[i] - speed))
+    paused = False
+    dragging = False
+    running = True
+    idle = False
+
+    def seek(index):
+        nonlocal frame_index, playback_time
+        frame_index = min(max(index, 0), last)
+        playback_time = float(times[frame_index])
+
+    while running:
+        frame_time = clock.tick(60) / 1000
+        for event in get_events(idle, clock):
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                jump = 100 if event.mod & pygame.KMOD_SHIFT else 1
+                if event.key == pygame.K_SPACE:
+                    paused = not paused
+                    if not paused and frame_index == last:
+                        seek(0)
+                elif event.key == pygame.K_RIGHT:
+                    seek(frame_index + jump)
+                elif event.key == pygame.K_LEFT:
+                    seek(frame_index - jump)
+                elif event.key == pygame.K_HOME:
+                    seek(0)
+                elif event.key == pygame.K_END:
+                    seek(last)
+                elif event.key == pygame.K_UP:
+                    speed_index = min(speed_index + 1, len(SPEEDS) - 1)
+                elif event.key == pygame.K_DOWN:
+                    speed_index = max(speed_index - 1, 0)
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and bar.collidepoint(event.pos):
+                dragging = True
+            elif event.type == pygame.MOUSEBUTTONUP:
+                dragging = False
+            if dragging and event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION):
+                seek(round(min(max(event.pos[0] / width, 0), 1) * last))
+
+        if not paused and not dragging:
+            playback_time += frame_time * SPEEDS[speed_index]
+            frame_index = min(max(bisect.bisect_right(times, playback_time) - 1, 0), last)
+            if frame_index == last:
+                paused = True
+
+        frame = trajectory[frame_index]
+        lines = draw_scene(screen, frame)
+        lines.append(f"t = {frame['time']:.2f} s   cuadro {frame_index}/{last}   "
+                     f"x{SPEEDS[speed_index]:g}{'   (pausa)' if paused else ''}")
+        y = 10
+        for line in lines:
+            y += screen.blit(font.render(line, True, text_color), (10, y)).height
+        pygame.draw.rect(screen, (60, 60, 60), bar)
+        pygame.draw.rect(screen, (50, 150, 250), (0, height, round(width * frame_index / max(last, 1)), BAR_HEIGHT))
+        pygame.display.flip()
+        # En pausa y sin arrastrar no cambia nada hasta el próximo evento
+        idle = paused and not dragging
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reproducir una grabación")
+    parser.add_argument("path")
+    parser.add_argument("--frame", type=int, default=0, help="cuadro inicial")
+    parser.add_argument("--speed", type=float, default=1, help="velocidad de reproducción")
+    args = parser.parse_args()
+    replay(args.path, args.frame, args.speed)
+    pygame.quit()
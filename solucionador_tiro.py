@@ -0,0 +1,176 @@
+"""Problema inverso del tiro parabólico: qué (ángulo, energía) dan en un objetivo
+
+Mismo sistema que trayectoria.py: metros, origen en el cañón y el eje y hacia arriba.
+Con el ángulo fijo, la altura del tiro en cada x crece con la energía, así que los
+tiros que tocan el objetivo forman un intervalo de energías por ángulo: desde la
+trayectoria más baja que roza el borde inferior hasta la más alta que roza el
+superior. Para cada x la energía que pasa por un borde sale en forma cerrada; el
+mínimo y el máximo sobre x se buscan en una rejilla vectorizada ángulo × x.
+Las energías se guardan por kg: la masa sólo las escala.
+"""
+from collections import OrderedDict
+import numpy as np
+from trayectoria import GRAVEDAD
+
+ANGULOS = np.linspace(0.5, 89.5, 179)
+MUESTRAS_ESQUINA = 12
+
+
+def energia_para_punto(masa, angulo_deg, x, y, gravedad=GRAVEDAD):
+    """Energía para que el tiro pase por (x, y); inf si con ese ángulo no llega"""
+    angulo = np.radians(angulo_deg)
+    coseno = np.cos(angulo)
+    subida = x * np.tan(angulo) - y
+    with np.errstate(divide="ignore", invalid="ignore"):
+        energia = masa * gravedad * x * x / (4 * coseno * coseno * subida)
+    return np.where(subida > 0, energia, np.inf)
+
+
+def tiro_minimo(masa, x, y, gravedad=GRAVEDAD):
+    """(ángulo en grados, energía) del tiro más barato que pasa por (x, y)"""
+    r = np.hypot(x, y)
+    return float(np.degrees(np.arctan2(y + r, x))), float(0.5 * masa * gravedad * (y + r))
+
+
+def intervalos_energia(angulos, izquierda, abajo, derecha, arriba, radio=0.0, x_max=None,
+                       gravedad=GRAVEDAD, muestras=MUESTRAS_ESQUINA):
+    """Energía mínima y máxima por kg que toca el objetivo, para cada ángulo
+
+    Los bordes del objetivo pueden ser arreglos (varios objetivos a la vez); el
+    resultado tiene forma (objetivos..., ángulos). Si un ángulo no acierta con ninguna
+    energía, el intervalo es (inf, -inf); inf en la máxima: cualquier energía desde la
+    mínima sirve.
+    El disco de radio dado toca el rectángulo cuando su centro entra en el rectángulo
+    agrandado con esquinas redondeadas. En los lados rectos el extremo sale en forma
+    cerrada; en las esquinas se toman muestras, así que el intervalo puede quedar un
+    poco más corto que el real, pero no incluye tiros que fallan.
+    """
+    bordes = [np.asarray(b, dtype=float)[..., None, None] for b in (izquierda, abajo, derecha, arriba)]
+    izquierda, abajo, derecha, arriba = bordes
+    angulos = np.asarray(angulos, dtype=float)[:, None]
+    tangente = np.tan(np.radians(angulos))
+    fin = np.inf if x_max is None else x_max
+
+    # Esquinas redondeadas: muestras repartidas a lo largo de cada arco
+    fi = np.linspace(0.0, np.pi / 2, muestras)
+    dx = radio * np.cos(fi)
+    dy = np.concatenate([radio * np.sin(fi)] * 2)
+    x = np.concatenate(np.broadcast_arrays(izquierda - dx, derecha + dx), axis=-1)
+    # El vuelo termina al tocar el suelo: por debajo de y = 0 no hay nada que tocar
+    bajo = np.maximum(abajo - dy, 0.0)
+    alto = arriba + dy
+    valido = (x > 0) & (x <= fin) & (alto >= 0)
+    minima = np.where(valido, energia_para_punto(1.0, angulos, x, bajo, gravedad), np.inf).min(axis=-1)
+    maxima = np.where(valido, energia_para_punto(1.0, angulos, x, alto, gravedad), -np.inf).max(axis=-1)
+
+    # Lado de abajo, recto: C x² / (x tan - h) tiene su mínimo en x = 2 h / tan
+    h = np.maximum(abajo - radio, 0.0)
+    x = np.clip(2 * h / tangente, izquierda, np.minimum(derecha, fin))
+    valido = (x > 0) & (x <= fin) & (arriba + radio >= 0)
+    minima = np.minimum(minima, np.where(valido, energia_para_punto(1.0, angulos, x, h, gravedad), np.inf)[..., 0])
+    # Lado de arriba, recto: el máximo está en un extremo; si la pantalla lo corta, en el corte
+    x = np.minimum(derecha, fin)
+    valido = (x > 0) & (x >= izquierda) & (arriba + radio >= 0)
+    maxima = np.maximum(maxima, np.where(valido, energia_para_punto(1.0, angulos, x, arriba + radio, gravedad),
+                                         -np.inf)[..., 0])
+    # Sin muestras válidas o sin intervalo: ese ángulo no toca el objetivo
+    imposible = ~(minima <= maxima)
+    minima = np.where(imposible, np.inf, minima)
+    maxima = np.where(imposible, -np.inf, maxima)
+    return minima, maxima
+
+
+class Solucion:
+    """Tiros que dan en un objetivo: intervalo de energías por kg para cada ángulo"""
+
+    def __init__(self, caja, angulos, minima, maxima, radio, x_max, gravedad):
+        self.caja = caja
+        self.angulos = angulos
+        self.minima = minima
+        self.maxima = maxima
+        self.radio = radio
+        self.x_max = x_max
+        self.gravedad = gravedad
+
+    def intervalo(self, masa, angulo):
+        """(energía mínima, energía máxima) con ese ángulo; (inf, -inf) si no hay"""
+        minima, maxima = intervalos_energia([angulo], *self.caja, self.radio, self.x_max, self.gravedad)
+        return float(minima[0]) * masa, float(maxima[0]) * masa
+
+    def factible(self, masa, energias):
+        """Rejilla booleana ángulos × energías con los tiros que aciertan"""
+        energias = np.asarray(energias, dtype=float) / masa
+        return (energias >= self.minima[:, None]) & (energias <= self.maxima[:, None])
+
+    def fraccion(self, masa, energia_max):
+        """Parte de los tiros (ángulo de la rejilla, energía entre 0 y energia_max) que aciertan"""
+        tope = energia_max / masa
+        cubierto = np.clip(np.minimum(self.maxima, tope) - self.minima, 0.0, None)
+        return float(np.mean(cubierto / tope))
+
+    def pista(self, masa, angulo=None):
+        """(ángulo, energía) de un tiro que acierta, o None si no hay ninguno
+
+        Con ángulo dado se busca la energía que pasa por el centro del objetivo; sin
+        ángulo se usa el de la rejilla que pide menos energía.
+        """
+        if angulo is None:
+            if not np.isfinite(self.minima).any():
+                return None
+            angulo = float(self.angulos[np.argmin(self.minima)])
+        minima, maxima = self.intervalo(masa, angulo)
+        if not np.isfinite(minima):
+            return None
+        izquierda, abajo, derecha, arriba = self.caja
+        energia = float(energia_para_punto(masa, angulo, (izquierda + derecha) / 2,
+                                           max((abajo + arriba) / 2, 0.0), self.gravedad))
+        # Con el centro sobre la línea de tiro la energía sale inf (y maxima también)
+        if not (np.isfinite(energia) and minima <= energia <= maxima):
+            energia = minima * 1.01 if maxima == np.inf else (minima + maxima) / 2
+        return angulo, energia
+
+
+class SolucionadorTiro:
+    """Resuelve objetivos (izquierda, abajo, derecha, arriba) y recuerda los últimos max_size"""
+
+    def __init__(self, radio=0.0, x_max=None, gravedad=GRAVEDAD, angulos=ANGULOS, max_size=256):
+        self.radio = radio
+        self.x_max = x_max
+        self.gravedad = gravedad
+        self.angulos = np.asarray(angulos, dtype=float)
+        self.max_size = max_size
+        self.soluciones = OrderedDict()
+
+    def __len__(self):
+        return len(self.soluciones)
+
+    def resolver(self, caja):
+        caja = tuple(float(b) for b in caja)
+        solucion = self.soluciones.get(caja)
+        if solucion is not None:
+            self.soluciones.move_to_end(caja)
+            return solucion
+        minima, maxima = intervalos_energia(self.angulos, *caja, self.radio, self.x_max, self.gravedad)
+        solucion = Solucion(caja, self.angulos, minima, maxima, self.radio, self.x_max, self.gravedad)
+        self.soluciones[caja] = solucion
+        if len(self.soluciones) > self.max_size:
+            self.soluciones.popitem(last=False)
+        return solucion
+
+
+def dificultad(izquierda, abajo, derecha, arriba, masa, energia_max, radio=0.0, x_max=None,
+               gravedad=GRAVEDAD, angulos=ANGULOS, bloque=512):
+    """Para muchos objetivos a la vez: parte de los tiros que fallan (0 fácil, 1 imposible)
+
+    Cuenta los tiros con ángulo de la rejilla y energía entre 0 y energia_max.
+    Se procesan de a bloque objetivos para acotar la memoria.
+    """
+    bordes = [np.atleast_1d(np.asarray(b, dtype=float)) for b in (izquierda, abajo, derecha, arriba)]
+    tope = energia_max / masa
+    resultado = np.empty(len(bordes[0]))
+    for inicio in range(0, len(resultado), bloque):
+        parte = slice(inicio, inicio + bloque)
+        minima, maxima = intervalos_energia(angulos, *(b[parte] for b in bordes), radio, x_max, gravedad)
+        cubierto = np.clip(np.minimum(maxima, tope) - minima, 0.0, None)
+        resultado[parte] = 1.0 - np.mean(cubierto / tope, axis=-1)
+    return resultado
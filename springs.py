@@ -0,0 +1,293 @@
+import math
+import numpy as np
+from particles import Particle
+from integrators import INTEGRATORS, Harmonic, EnergyMonitor
+
+
+class VerticalSpring:
+    """Partícula colgada de un resorte vertical con gravedad (física de run_spring_simulation)
+
+    integrator: "euler" (semi-implícito, el de siempre), "verlet", "rk4" o "exact"
+    (solución analítica del oscilador lineal: el rebote en el piso y los cruces por el
+    equilibrio se hallan en forma cerrada, así que el paso puede ser tan grande como
+    se quiera). Con energy_tolerance, los pasos que cambian la energía relativa más
+    que eso se parten a la mitad (hasta MAX_HALVINGS veces).
+    """
+
+    MAX_HALVINGS = 8
+
+    def __init__(self, fixed_point=(400, 100), rest_length=150, k=100, mass=20, radius=15,
+                 floor=600, g=9.81 * 100, integrator="euler", energy_tolerance=None):
+        self.fixed_point = fixed_point
+        self.rest_length = rest_length
+        self.k = k
+        self.g = g  # gravedad "escalada" visualmente (pixeles ≈ cm)
+        self.floor = floor
+        self.integrator = integrator
+        self.energy = EnergyMonitor(energy_tolerance)
+        self.particle = Particle(fixed_point[0], fixed_point[1] + rest_length, 0, 0, radius, mass)
+        self.reset()
+
+    def reset(self):
+        self.oscillation_count = 0
+        self.previous_above = None
+        self.last_cross = None  # Para evitar dobles conteos
+        self.particle.vy = 0
+        self.particle.y = self.fixed_point[1] + self.rest_length
+        self._rebase()
+
+    @property
+    def equilibrium_y(self):
+        """Altura en la que el resorte equilibra el peso (depende de k y de la masa)"""
+        return self.fixed_point[1] + self.rest_length + self.particle.mass * self.g / self.k
+
+    def _rebase(self):
+        self._parameters = (self.k, self.particle.mass)
+        self.energy.rebase(self.mechanical_energy())
+
+    def _acceleration(self, y):
+        # Fuerza de resorte (Hooke) más gravedad, por unidad de masa
+        return -self.k * (y - self.fixed_point[1] - self.rest_length) / self.particle.mass + self.g
+
+    def mechanical_energy(self):
+        """Energía cinética más potencial (resorte y gravedad), medida desde el equilibrio"""
+        p = self.particle
+        stretch = p.y - self.equilibrium_y
+        return 0.5 * p.mass * p.vy * p.vy + 0.5 * self.k * stretch * stretch
+
+    def step(self, dt):
+        if self._parameters != (self.k, self.particle.mass):
+            # Cambió k o la masa (sliders): la energía de antes ya no sirve de referencia
+            self._rebase()
+        if self.integrator == "exact":
+            self._step_exact(dt)
+        else:
+            self._step_numeric(dt, INTEGRATORS[self.integrator], 0)
+
+    def advance(self, duration, dt):
+        """Adelanta duration segundos con pasos de a lo sumo dt (el exacto va de un salto)"""
+        if self.integrator == "exact":
+            self.step(duration)
+            return
+        steps = max(int(math.ceil(duration / dt - 1e-9)), 1)
+        for _ in range(steps):
+            self.step(duration / steps)
+
+    def _step_numeric(self, dt, integrate, halvings):
+        particle = self.particle
+        before = self.mechanical_energy()
+        y, vy = particle.y, particle.vy
+        particle.y, particle.vy = integrate(y, vy, dt, self._acceleration)
+        after = self.mechanical_energy()
+        if halvings < self.MAX_HALVINGS and not self.energy.accepts(before, after):
+            particle.y, particle.vy = y, vy
+            self._step_numeric(dt / 2, integrate, halvings + 1)
+            self._step_numeric(dt / 2, integrate, halvings + 1)
+            return
+        self.energy.record(before, after)
+
+        # Conteo de oscilaciones: cuenta cada cruce por el equilibrio (ambos sentidos)
+        is_above = particle.y < self.equilibrium_y
+        if self.previous_above is not None and is_above != self.previous_above:
+            # Solo cuenta si no es el mismo cruce que el anterior
+            if self.last_cross != is_above:
+                self.oscillation_count += 1
+                self.last_cross = is_above
+        self.previous_above = is_above
+
+        # Rebote si toca el fondo
+        if particle.y + particle.radius > self.floor:
+            particle.y = self.floor - particle.radius
+            particle.vy *= -0.8
+            self._rebase()
+
+    def _step_exact(self, dt):
+        particle = self.particle
+        omega = math.sqrt(self.k / particle.mass)
+        center = self.equilibrium_y
+        bottom = self.floor - particle.radius
+        remaining = dt
+        while remaining > 0:
+            before = self.mechanical_energy()
+            motion = Harmonic(particle.y, particle.vy, omega, center)
+            theta_end = motion.theta(remaining)
+            hit = motion.first_reach(bottom, motion.theta0, increasing=True)
+            bounced = hit is not None and hit <= theta_end
+            if bounced:
+                theta_end = hit
+            crossings = motion.crossings(center, motion.theta0, theta_end)
+            particle.y, particle.vy = motion.state(theta_end)
+            remaining -= motion.time(theta_end)
+
+            # Los cruces se cuentan todos, aunque caigan varios en el mismo paso
+            is_above = particle.y < center
+            if crossings:
+                self.oscillation_count += crossings
+                self.last_cross = is_above
+            self.previous_above = is_above
+            self.energy.record(before, self.mechanical_energy())
+
+            if not bounced:
+                break
+            particle.y = bottom
+            particle.vy *= -0.8
+            self._rebase()
+
+    def diagnostics(self):
+        p = self.particle
+        return {
+            "y": p.y,
+            "vy": p.vy,
+            "k": self.k,
+            "mass": p.mass,
+            "oscillation_count": self.oscillation_count,
+            "integrator": self.integrator,
+            "energy_drift": self.energy.max_drift,
+        }
+
+
+class SpringImpact:
+    """Partícula que choca contra un resorte horizontal anclado en x0 (física de simulacion_de_choque)
+
+    engine: "steps" (paso explícito de tamaño dt) o "events" (solución exacta: vuelo
+    libre recto y, en contacto, medio período de oscilador armónico, saltando de
+    una fase a otra en el instante justo)
+    """
+
+    def __init__(self, k=50.0, mass=1.0, vx=5.0, x0=700, pixels_per_meter=100, engine="steps"):
+        self.k = k  # N/m
+        self.mass = mass  # kg
+        self.vx = vx  # m/s
+        self.x0 = x0  # Posición del anclaje del resorte (en px)
+        self.pixels_per_meter = pixels_per_meter
+        self.engine = engine
+        self.restoring_force = 0.0
+        self.reset()
+
+    def reset(self):
+        self.particle = Particle(x=100, y=300, vx=self.vx * self.pixels_per_meter, vy=0, radius=15, mass=self.mass)
+        self.restoring_force = 0.0
+        self.peak_force = 0.0
+        self.time = 0.0
+        self.contacts = 0
+        self.touching = False
+
+    def _compression(self):
+        """(compresión en m, velocidad de compresión en m/s) del resorte"""
+        particle = self.particle
+        ppm = self.pixels_per_meter
+        return (particle.x + particle.radius - self.x0) / ppm, particle.vx / ppm
+
+    def _set_compression(self, p, u):
+        particle = self.particle
+        ppm = self.pixels_per_meter
+        particle.x = self.x0 - particle.radius + p * ppm
+        particle.vx = u * ppm
+
+    def step(self, dt):
+        particle = self.particle
+        particle.mass = self.mass
+        if self.engine == "events":
+            self._advance_exact(dt)
+        else:
+            # Movimiento normal
+            particle.move(dt)
+
+            # Colisión con el resorte sin fricción, rebote ideal
+            self.restoring_force = 0.0
+            if particle.x + particle.radius >= self.x0:
+                penetration = (particle.x + particle.radius) - self.x0
+                self.restoring_force = -self.k * (penetration / self.pixels_per_meter)
+                acceleration = self.restoring_force / particle.mass
+                particle.vx += acceleration * dt * self.pixels_per_meter
+        self.time += dt
+        self.peak_force = min(self.peak_force, self.restoring_force)
+        return self.restoring_force
+
+    def _advance_exact(self, dt):
+        # Salta de evento en evento (contacto, suelta) dentro del dt, sin error de paso
+        particle = self.particle
+        omega = math.sqrt(self.k / self.mass)
+        remaining = dt
+        while remaining > 0:
+            p, u = self._compression()
+            if not self.touching:
+                # Vuelo libre: ¿llega al resorte antes de terminar el dt?
+                if u > 0 and max(-p, 0.0) / u < remaining:
+                    remaining -= max(-p, 0.0) / u
+                    self._set_compression(0.0, u)
+                    self.touching = True
+                    self.contacts += 1
+                    continue
+                particle.x += particle.vx * remaining
+                break
+            # En contacto: p(t) = A sin(ω t + φ); se suelta cuando ω t + φ = π
+            amplitude = math.hypot(p, u / omega)
+            phase = math.atan2(p * omega, u)
+            release = (math.pi - phase) / omega
+            if phase <= math.pi / 2 < phase + omega * remaining:
+                # Pasa por la compresión máxima dentro de este dt
+                self.peak_force = min(self.peak_force, -self.k * amplitude)
+            if release <= remaining:
+                self._set_compression(0.0, -amplitude * omega)
+                self.touching = False
+                remaining -= release
+                continue
+            angle = phase + omega * remaining
+            self._set_compression(amplitude * math.sin(angle), amplitude * omega * math.cos(angle))
+            break
+        p, _ = self._compression()
+        self.restoring_force = -self.k * p if self.touching else 0.0
+
+    def next_contact(self):
+        """Próximo contacto calculado en forma cerrada, o None si la partícula no va a llegar
+
+        Tiempos absolutos (como time) del contacto, la compresión máxima y la suelta,
+        con la compresión máxima en m y la fuerza recuperadora en ese instante.
+        """
+        p, u = self._compression()
+        omega = math.sqrt(self.k / self.mass)
+        if not self.touching:
+            if u <= 0:
+                return None
+            start = self.time + max(-p, 0.0) / u
+            amplitude, phase = u / omega, 0.0
+        else:
+            amplitude = math.hypot(p, u / omega)
+            phase = math.atan2(p * omega, u)
+            start = self.time - phase / omega
+        return {
+            "contact_time": start,
+            "max_compression_time": start + math.pi / 2 / omega,
+            "release_time": start + math.pi / omega,
+            "max_compression": amplitude,
+            "peak_restoring_force": -self.k * amplitude,
+        }
+
+    def diagnostics(self):
+        p = self.particle
+        return {
+            "x": p.x,
+            "vx": p.vx,
+            "k": self.k,
+            "mass": p.mass,
+            "restoring_force": self.restoring_force,
+        }
+
+
+def contact_table(k, mass, vx):
+    """Duración del contacto, compresión máxima y fuerza máxima sin simular (arreglos)
+
+    k, mass y vx (en m/s) se combinan como en NumPy: para barrer una rejilla
+    completa basta con pasarlos con np.ix_ o como columnas/filas. Un choque contra
+    un resorte lineal dura medio período, π sqrt(m / k), sea cual sea la velocidad.
+    """
+    k, mass, vx = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (k, mass, vx)))
+    omega = np.sqrt(k / mass)
+    toca = vx > 0
+    compression = np.where(toca, vx / omega, 0.0)
+    return {
+        "contact_duration": np.where(toca, np.pi / omega, 0.0),
+        "max_compression": compression,
+        "peak_restoring_force": -k * compression,
+    }
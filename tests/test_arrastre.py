@@ -0,0 +1,30 @@
+import numpy as np
+from arrastre import CacheTrayectorias
+from juego_tiro_parabolico import GRAVEDAD, RADIO_PROYECTIL, ESCALA, X_MAX_M, caja_objetivo
+
+RADIO = RADIO_PROYECTIL / ESCALA
+
+
+def distancia_al_objetivo(x, y, caja):
+    """Distancia del centro del proyectil al rectángulo menos el radio (<= 0: lo toca)"""
+    izquierda, abajo, derecha, arriba = caja
+    dx = np.maximum(np.maximum(izquierda - x, x - derecha), 0.0)
+    dy = np.maximum(np.maximum(abajo - y, y - arriba), 0.0)
+    return np.hypot(dx, dy) - RADIO
+
+
+def test_tiempo_impacto_con_aire_coincide_con_muestreo():
+    rng = np.random.default_rng(5)
+    cache = CacheTrayectorias(gravedad=GRAVEDAD, x_max=X_MAX_M)
+    aciertos = 0
+    for _ in range(40):
+        tiro = cache.obtener(rng.uniform(1, 5), rng.uniform(10, 70), rng.uniform(100, 2000), 0.002)
+        caja = caja_objetivo(rng.uniform(20, 60), rng.uniform(3, 30))
+        t = tiro.tiempo_impacto(*caja, RADIO)
+        x, y = tiro.muestrear(2000, tiro.duracion if t is None else t)
+        # Nada de lo muestreado antes del impacto (o en todo el vuelo, si no hay) toca el objetivo
+        assert distancia_al_objetivo(x[:-1], y[:-1], caja).min() > -1e-6
+        if t is not None:
+            aciertos += 1
+            assert abs(distancia_al_objetivo(*tiro.posicion(t), caja)) < 1e-6
+    assert aciertos > 0
@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+from diagnostics import GasDiagnostics
+from gas import GasSimulation, spawn_particles
+
+
+@pytest.mark.parametrize("engine", ["substeps", "events"])
+def test_mide_cada_sample_interval_con_los_dos_motores(engine):
+    p = spawn_particles(50, 800, 600, rng=np.random.default_rng(0))
+    monitor = GasDiagnostics(p, 800, 600, sample_interval=1 / 30)
+    simulation = GasSimulation(p, 800, 600, engine=engine, monitor=monitor)
+    for _ in range(4):
+        simulation.step(1 / 60)
+    # 4 cuadros son 1/15 s: dos medidas, a los 2 y 4 cuadros, con cualquier motor;
+    # la primera pierde peso según el tiempo simulado entre las dos
+    assert monitor.histogram.sum() == pytest.approx(len(p) * (1 + np.exp(-1 / 30 / monitor.memory)))
+
+
+def test_resume_el_estado_final():
+    p = spawn_particles(50, 800, 600, rng=np.random.default_rng(0))
+    monitor = GasDiagnostics(p, 800, 600)
+    simulation = GasSimulation(p, 800, 600, engine="events", monitor=monitor)
+    simulation.step(1 / 60)
+    p.vx *= 2
+    p.vy *= 2
+    assert monitor.summary()["energy_drift"] == pytest.approx(3, rel=1e-9)
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+from event_driven import EventDrivenGas
+from gas import GasSimulation, spawn_particles
+
+
+@pytest.mark.parametrize("n, width, height", [(5, 800, 600), (300, 800, 600), (500, 1000, 800)])
+def test_celdas_sin_solapamientos_y_con_energia(n, width, height):
+    p = spawn_particles(n, width, height, "auto", np.random.default_rng(n))
+    energy = float(np.dot(p.mass, p.vx ** 2 + p.vy ** 2))
+    gas = EventDrivenGas(p, width, height)
+    for _ in range(60):
+        gas.step(1 / 60)
+    assert np.all((p.x >= p.radius - 1e-6) & (p.x <= width - p.radius + 1e-6))
+    assert np.all((p.y >= p.radius - 1e-6) & (p.y <= height - p.radius + 1e-6))
+    dist = np.hypot(p.x[:, None] - p.x[None, :], p.y[:, None] - p.y[None, :])
+    i, j = np.triu_indices(n, 1)
+    assert np.all(dist[i, j] >= (p.radius[i] + p.radius[j]) - 1e-6)
+    assert float(np.dot(p.mass, p.vx ** 2 + p.vy ** 2)) == pytest.approx(energy, rel=1e-12)
+    # Cada partícula está anotada en la celda que le toca por su posición
+    assert np.all(np.abs(p.x - (gas.cell_x + 0.5) * gas.cell_w) <= gas.cell_w / 2 + 1e-6)
+    assert np.all(np.abs(p.y - (gas.cell_y + 0.5) * gas.cell_h) <= gas.cell_h / 2 + 1e-6)
+    assert sum(len(cell) for cell in gas.cells) == n
+
+
+def test_simulacion_por_eventos_conserva_energia():
+    p = spawn_particles(200, 800, 600, rng=np.random.default_rng(1))
+    energy = p.kinetic_energy()
+    simulation = GasSimulation(p, 800, 600, engine="events")
+    for _ in range(300):
+        simulation.step(1 / 60)
+    assert simulation.collisions > 0
+    assert p.kinetic_energy() == pytest.approx(energy, rel=1e-12)
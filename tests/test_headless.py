@@ -0,0 +1,48 @@
+import json
+import pygame
+import pytest
+import headless
+
+
+def correr(capsys, *argv):
+    headless.main(list(argv))
+    return json.loads(capsys.readouterr().out)
+
+
+@pytest.mark.parametrize("argv, key", [
+    (["gas", "--particles", "20", "--steps", "10"], "kinetic_energy"),
+    (["gas", "--particles", "20", "--steps", "10", "--engine", "events", "--diagnostics"], "wall_pressure"),
+    (["spring", "--steps", "60", "--integrator", "verlet"], "energy_drift"),
+    (["impact", "--seconds", "3", "--engine", "events"], "contacts"),
+    (["impact-sweep", "--k", "10", "50", "--vx", "2", "5"], None),
+    (["projectile", "--masa", "2", "--angulo", "45", "--potencia", "600",
+      "--objetivo-x", "40", "--objetivo-y", "10"], "hit"),
+    (["volley", "--projectiles", "30", "--targets", "5", "--steps", "30", "--seed", "1"], "launched"),
+])
+def test_escenas_sin_ventana(capsys, argv, key):
+    result = correr(capsys, *argv)
+    if key is None:
+        assert len(result) == 4
+    else:
+        assert key in result
+    assert not pygame.display.get_init()
+
+
+def test_gas_con_la_misma_semilla_se_repite():
+    a = headless.run_gas(30, steps=20, seed=4)
+    b = headless.run_gas(30, steps=20, seed=4)
+    assert a["state"] == b["state"]
+    assert a["time"] == pytest.approx(20 / 60)
+
+
+@pytest.mark.parametrize("argv, message", [
+    (["gas", "--particles", "20"], "--steps o --seconds"),
+    (["volley"], "--steps o --seconds"),
+    (["gas", "--particles", "500", "--steps", "1"], "menos partículas"),
+    (["spring", "--steps", "1", "--float32"], "--float32"),
+])
+def test_errores_de_la_terminal_sin_traza(capsys, argv, message):
+    with pytest.raises(SystemExit) as exit_info:
+        headless.main(argv)
+    assert exit_info.value.code == 2
+    assert message in capsys.readouterr().err
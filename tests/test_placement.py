@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from gas import spawn_particles
+from placement import PlacementError, place_disks
+
+
+def assert_no_overlaps(x, y, radii, width, height):
+    assert np.all(x - radii >= 0) and np.all(x + radii <= width)
+    assert np.all(y - radii >= 0) and np.all(y + radii <= height)
+    dist = np.hypot(x[:, None] - x[None, :], y[:, None] - y[None, :])
+    touch = radii[:, None] + radii[None, :]
+    i, j = np.triu_indices(len(x), 1)
+    assert np.all(dist[i, j] >= touch[i, j] - 1e-9)
+
+
+# Los dardos se usan hasta una fracción de área de ~0.4 (150 discos); más arriba, la red
+@pytest.mark.parametrize("method, n", [("random", 10), ("random", 150), ("lattice", 10),
+                                       ("lattice", 300), ("auto", 150), ("auto", 300)])
+def test_sin_solapamientos(method, n):
+    rng = np.random.default_rng(n)
+    radii = rng.integers(10, 21, n).astype(float)
+    x, y = place_disks(radii, 800, 600, rng, method)
+    assert_no_overlaps(x, y, radii, 800, 600)
+
+
+@pytest.mark.parametrize("method", ["random", "lattice"])
+def test_spawn_sin_solapamientos(method):
+    p = spawn_particles(150, 800, 600, method, np.random.default_rng(3))
+    assert_no_overlaps(p.x, p.y, p.radius, 800, 600)
+
+
+def test_red_densa_con_radios_iguales():
+    # Con radios iguales la red llega cerca del límite físico
+    radii = np.full(1000, 5.0)
+    rng = np.random.default_rng(1)
+    x, y = place_disks(radii, 330, 330, rng, "lattice")
+    assert_no_overlaps(x, y, radii, 330, 330)
+
+
+def test_demasiadas_particulas():
+    # La red usa el radio máximo: 500 partículas de radio 10 a 20 no caben en 800x600
+    with pytest.raises(PlacementError):
+        spawn_particles(500, 800, 600, rng=np.random.default_rng(0))
@@ -0,0 +1,25 @@
+import threading
+from profiling import Profiler
+
+
+def test_otro_hilo_no_pierde_tiempos_ni_contadores():
+    profiler = Profiler(enabled=True, record=True)
+    done = threading.Event()
+
+    def physics():
+        for _ in range(20000):
+            with profiler.section("narrow_phase"):
+                profiler.count("pairs", 1)
+        done.set()
+
+    thread = threading.Thread(target=physics)
+    thread.start()
+    while not done.is_set():
+        with profiler.section("render"):
+            profiler.count("particles", 1)
+        profiler.end_frame()
+    thread.join()
+    profiler.end_frame()
+    # Cada suma cae entera en algún cuadro: nada se pierde al cerrarlos
+    assert sum(row.get("pairs", 0) for row in profiler.trace) == 20000
+    assert sum("narrow_phase" in row for row in profiler.trace) > 0
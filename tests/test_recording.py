@@ -0,0 +1,33 @@
+import numpy as np
+from gas import GasSimulation, spawn_particles
+from recording import Trajectory, gas_writer, record_gas
+
+
+def grabar(path, steps, **options):
+    p = spawn_particles(20, 800, 600, rng=np.random.default_rng(2))
+    simulation = GasSimulation(p, 800, 600)
+    with gas_writer(path, simulation, 1 / 60, **options) as writer:
+        record_gas(writer, simulation)
+        for _ in range(steps):
+            simulation.step(1 / 60)
+            record_gas(writer, simulation)
+    return simulation, writer
+
+
+def test_grabacion_coincide_con_el_estado(tmp_path):
+    path = str(tmp_path / "gas.traj")
+    simulation, writer = grabar(path, 30, stride=3, chunk_frames=4)
+    trajectory = Trajectory(path)
+    assert len(trajectory) == writer.frames == 11
+    assert trajectory[-1]["step"] == simulation.steps
+    assert np.array_equal(trajectory[-1]["x"], simulation.particles.x)
+    assert trajectory.meta["scene"] == "gas"
+
+
+def test_float32_solo_en_los_arreglos(tmp_path):
+    path = str(tmp_path / "gas.traj")
+    simulation, _ = grabar(path, 5, quantize=True)
+    trajectory = Trajectory(path)
+    assert trajectory.dtype["x"].base == np.float32
+    assert trajectory.dtype["time"] == np.float64
+    assert np.allclose(trajectory[-1]["vx"], simulation.particles.vx, rtol=1e-6)
@@ -0,0 +1,29 @@
+import numpy as np
+import pygame
+from particles import ParticleSystem
+from rendering import ParticleRenderer
+
+
+def dibujar(renderer, system):
+    surface = pygame.Surface((200, 200))
+    renderer.draw(surface, system)
+    return pygame.image.tobytes(surface, "RGB")
+
+
+def test_sprites_se_eligen_de_nuevo_al_agregar_particulas():
+    system = ParticleSystem()
+    system.extend([50, 150], [50, 50], [0, 0], [0, 0], [10, 20], 1, [(200, 0, 0), (0, 200, 0)])
+    renderer = ParticleRenderer()
+    assert dibujar(renderer, system) == dibujar(ParticleRenderer(), system)
+    system.x += 5  # las posiciones cambian en cada cuadro sin volver a elegir sprites
+    sprites = renderer._sprites
+    assert dibujar(renderer, system) == dibujar(ParticleRenderer(), system)
+    assert renderer._sprites is sprites
+    system.extend([100], [150], [0], [0], [30], 1, [(0, 0, 200)])
+    assert dibujar(renderer, system) == dibujar(ParticleRenderer(), system)
+    assert len(renderer._sprites) == 3
+    # Un cambio de color en el lugar no se detecta solo: hay que invalidar
+    system.color[0] = (0, 0, 200)
+    renderer.invalidate()
+    assert dibujar(renderer, system) == dibujar(ParticleRenderer(), system)
+    assert np.array_equal(system.color[0], (0, 0, 200))
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from juego_tiro_parabolico import RADIO_PROYECTIL, ESCALA, X_MAX_M, caja_objetivo
+from solucionador_tiro import SolucionadorTiro
+from trayectoria import Trayectoria
+
+RADIO = RADIO_PROYECTIL / ESCALA
+
+
+def acierta(masa, angulo, energia, caja):
+    tiro = Trayectoria(masa, angulo, energia, x_max=X_MAX_M)
+    return tiro.tiempo_impacto(*caja, RADIO) is not None
+
+
+@pytest.mark.parametrize("masa", [1.0, 5.0])
+def test_pista_con_angulo_fijo_y_objetivo_alto(masa):
+    # El centro del objetivo queda por encima de la recta de 20°: la energía por el
+    # centro es inf, pero el intervalo de energías que aciertan no está vacío
+    caja = caja_objetivo(63.5, 27.6)
+    solucion = SolucionadorTiro(RADIO, X_MAX_M).resolver(caja)
+    angulo, energia = solucion.pista(masa, 20.0)
+    assert angulo == 20.0
+    assert np.isfinite(energia)
+    assert acierta(masa, angulo, energia, caja)
+
+
+def test_pistas_siempre_finitas_y_certeras():
+    rng = np.random.default_rng(0)
+    solucionador = SolucionadorTiro(RADIO, X_MAX_M)
+    for _ in range(100):
+        caja = caja_objetivo(rng.uniform(35, 70), rng.uniform(3, 30))
+        solucion = solucionador.resolver(caja)
+        for angulo in (None, 10.0, 20.0, 45.0, 60.0):
+            pista = solucion.pista(2.0, angulo)
+            if pista is None:
+                continue
+            assert np.isfinite(pista[1])
+            assert acierta(2.0, *pista, caja)
+
+
+def test_energias_dentro_del_intervalo_aciertan():
+    rng = np.random.default_rng(6)
+    solucionador = SolucionadorTiro(RADIO, X_MAX_M)
+    masa = 2.0
+    for _ in range(20):
+        caja = caja_objetivo(rng.uniform(35, 70), rng.uniform(3, 30))
+        solucion = solucionador.resolver(caja)
+        for angulo in (15.0, 30.0, 45.0, 60.0):
+            minima, maxima = solucion.intervalo(masa, angulo)
+            if not np.isfinite(minima):
+                continue
+            tope = maxima if np.isfinite(maxima) else 3 * minima
+            for energia in minima + (tope - minima) * np.array([1e-6, 0.25, 0.5, 0.75, 1 - 1e-6]):
+                assert acierta(masa, angulo, energia, caja)
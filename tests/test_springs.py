@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+from springs import SpringImpact, VerticalSpring
+
+
+def test_choque_por_eventos_es_elastico():
+    # Sale con la misma rapidez y la compresión máxima es v sqrt(m / k): F = v sqrt(k m)
+    k, mass, vx = 50.0, 1.0, 5.0
+    impact = SpringImpact(k, mass, vx, engine="events")
+    for _ in range(150):
+        impact.step(0.02)
+    assert impact.contacts == 1
+    assert impact.particle.vx == pytest.approx(-vx * impact.pixels_per_meter, rel=1e-12)
+    assert abs(impact.peak_force) == pytest.approx(vx * np.sqrt(k * mass), rel=1e-12)
+
+
+def test_resorte_exacto_conserva_energia():
+    # Una hora en pasos de un minuto: el oscilador se resuelve en forma cerrada
+    spring = VerticalSpring(k=500, integrator="exact")
+    for _ in range(60):
+        spring.step(60)
+    assert spring.oscillation_count > 1000
+    assert abs(spring.diagnostics()["energy_drift"]) < 1e-12
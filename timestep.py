@@ -0,0 +1,52 @@
+import numpy as np
+
+
+class FixedTimestep:
+    """Reloj de física de paso fijo con acumulador
+
+    Cada cuadro se le pasa el tiempo real transcurrido y devuelve cuántos pasos de
+    física tocan. La física siempre avanza de a dt, así que el resultado no depende
+    de los FPS. Si un cuadro se atrasa mucho se hacen a lo sumo max_steps pasos y el
+    resto se descarta (la simulación va más lenta en lugar de congelarse).
+    alpha indica cuánto del siguiente paso ya pasó, para interpolar al dibujar.
+    """
+
+    def __init__(self, dt=1 / 60, max_steps=5):
+        self.dt = dt
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.steps = 0
+        self.dropped = 0.0
+
+    def advance(self, frame_time):
+        self.accumulator += frame_time
+        n = int(self.accumulator // self.dt)
+        if n > self.max_steps:
+            self.dropped += (n - self.max_steps) * self.dt
+            self.accumulator -= (n - self.max_steps) * self.dt
+            n = self.max_steps
+        self.accumulator -= n * self.dt
+        self.steps += n
+        return n
+
+    @property
+    def alpha(self):
+        return self.accumulator / self.dt
+
+    @property
+    def time(self):
+        return self.steps * self.dt
+
+    def reset(self):
+        self.accumulator = 0.0
+        self.steps = 0
+        self.dropped = 0.0
+
+
+def interpolate(previous, current, alpha, out=None):
+    """previous + alpha * (current - previous), sin crear arreglos si se pasa out"""
+    out = np.subtract(current, previous, out=out)
+    out *= alpha
+    out += previous
+    return out
+
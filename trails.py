@@ -0,0 +1,94 @@
+"""Estelas en buffers circulares de NumPy
+
+Agregar un punto es O(1) (se pisa el más viejo) y dibujar es una sola llamada a
+pygame.draw.lines por estela: los puntos recientes van todos y los viejos se
+diezman, así que el costo de dibujar no crece con la historia guardada.
+"""
+import numpy as np
+import pygame
+
+MAX_DRAWN_POINTS = 256  # puntos por estela que se mandan a pygame, como máximo
+
+
+def _decimated(count, size, max_points):
+    """Índices absolutos (0 = primer punto agregado) de los puntos a dibujar
+
+    Los últimos max_points // 2 van completos; del resto se toma uno de cada stride,
+    elegidos por su índice absoluto para que no "tiemblen" al correr la estela.
+    """
+    first = count - size
+    if size <= max_points:
+        return np.arange(first, count)
+    recent = max_points // 2
+    old_end = count - recent
+    stride = -(-(old_end - first) // (max_points - recent))
+    start = first + (-first) % stride
+    return np.concatenate([np.arange(start, old_end, stride), np.arange(old_end, count)])
+
+
+class Trail:
+    """Últimas capacity posiciones (x, y) de un punto"""
+
+    def __init__(self, capacity):
+        self.points = np.zeros((capacity, 2))
+        self.count = 0  # puntos agregados desde el último clear()
+
+    def __len__(self):
+        return min(self.count, len(self.points))
+
+    def clear(self):
+        self.count = 0
+
+    def append(self, x, y):
+        self.points[self.count % len(self.points)] = x, y
+        self.count += 1
+
+    def ordered(self, max_points=None):
+        """Puntos del más viejo al más nuevo (diezmados a max_points si se pide)"""
+        size = len(self)
+        if max_points is None:
+            indices = np.arange(self.count - size, self.count)
+        else:
+            indices = _decimated(self.count, size, max_points)
+        return self.points[indices % len(self.points)]
+
+    def draw(self, surface, color, width=1, max_points=MAX_DRAWN_POINTS, antialias=False):
+        """Dibuja la estela con una llamada; devuelve el área tocada (None si no hay línea)"""
+        if len(self) < 2:
+            return None
+        points = self.ordered(max_points)
+        if antialias:
+            return pygame.draw.aalines(surface, color, False, points.tolist())
+        # Enteros: draw.lines trunca igual y la lista sale más rápido
+        return pygame.draw.lines(surface, color, False, points.astype(np.int32).tolist(), width)
+
+
+class Trails:
+    """Estelas de n partículas que avanzan juntas (una fila por instante)"""
+
+    def __init__(self, n, capacity):
+        self.x = np.zeros((capacity, n))
+        self.y = np.zeros((capacity, n))
+        self.count = 0
+
+    def __len__(self):
+        return min(self.count, len(self.x))
+
+    def clear(self):
+        self.count = 0
+
+    def append(self, x, y):
+        row = self.count % len(self.x)
+        self.x[row] = x
+        self.y[row] = y
+        self.count += 1
+
+    def draw(self, surface, colors, width=1, max_points=MAX_DRAWN_POINTS):
+        """Una llamada a draw.lines por partícula; devuelve las áreas tocadas"""
+        if len(self) < 2:
+            return []
+        rows = _decimated(self.count, len(self), max_points) % len(self.x)
+        # (partículas, puntos, 2): cada fila es la polilínea de una partícula
+        lines = np.stack([self.x[rows].T, self.y[rows].T], axis=-1).astype(np.int32).tolist()
+        return [pygame.draw.lines(surface, tuple(color), False, points, width)
+                for color, points in zip(colors.tolist(), lines)]
@@ -0,0 +1,182 @@
+"""Tiro parabólico analítico (sin rozamiento)
+
+Todo en metros y segundos, con el origen en la boca del cañón y el eje y hacia arriba.
+El impacto contra un rectángulo se calcula resolviendo las ecuaciones del movimiento,
+sin muestrear la trayectoria, así que no se escapan objetivos finos.
+"""
+import math
+import numpy as np
+
+GRAVEDAD = 9.81
+
+
+def _raices_cuadratica(a, b, c):
+    """Raíces reales de a t² + b t + c = 0, ordenadas (tupla vacía si no hay)"""
+    if a == 0:
+        return (-c / b,) if b != 0 else ()
+    disc = b * b - 4 * a * c
+    if disc < 0:
+        return ()
+    raiz = math.sqrt(disc)
+    # Forma estable: evita restar dos números casi iguales
+    q = -0.5 * (b + math.copysign(raiz, b))
+    if q == 0:
+        return (0.0, 0.0)
+    t1, t2 = q / a, c / q
+    return (t1, t2) if t1 <= t2 else (t2, t1)
+
+
+class Trayectoria:
+    """Movimiento de un proyectil lanzado con cierta energía y ángulo
+
+    x_max recorta el vuelo cuando el proyectil sale por la derecha (p. ej. el borde
+    de la pantalla); duracion es el tiempo hasta tocar el suelo o ese borde.
+    """
+
+    def __init__(self, masa, angulo_deg, energia, gravedad=GRAVEDAD, x_max=None):
+        if masa <= 0:
+            raise ValueError("la masa debe ser positiva")
+        angulo = math.radians(angulo_deg)
+        self.v0 = math.sqrt(2 * energia / masa)
+        self.vx = self.v0 * math.cos(angulo)
+        self.vy = self.v0 * math.sin(angulo)
+        self.g = gravedad
+        self.duracion = self.tiempo_vuelo
+        if x_max is not None and self.vx > 0:
+            self.duracion = min(self.duracion, x_max / self.vx)
+
+    @property
+    def tiempo_vuelo(self):
+        """Tiempo hasta volver a la altura del cañón"""
+        return max(2 * self.vy / self.g, 0.0)
+
+    @property
+    def alcance(self):
+        return self.vx * self.tiempo_vuelo
+
+    @property
+    def apice(self):
+        """(t, x, y) del punto más alto"""
+        t = max(self.vy / self.g, 0.0)
+        x, y = self.posicion(t)
+        return t, x, y
+
+    def posicion(self, t):
+        return self.vx * t, self.vy * t - 0.5 * self.g * t * t
+
+    def velocidad(self, t):
+        return self.vx, self.vy - self.g * t
+
+    def puntos(self, paso, t_fin=None):
+        """Genera las posiciones cada paso segundos hasta t_fin (incluido), sin guardarlas"""
+        t_fin = self.duracion if t_fin is None else t_fin
+        k = 0
+        while k * paso < t_fin:
+            yield self.posicion(k * paso)
+            k += 1
+        yield self.posicion(t_fin)
+
+    def muestrear(self, n, t_fin=None):
+        """n posiciones equiespaciadas en el tiempo, como arreglos (para dibujar la curva entera)"""
+        t = np.linspace(0.0, self.duracion if t_fin is None else t_fin, n)
+        return self.vx * t, self.vy * t - 0.5 * self.g * t * t
+
+    def _entrada_rect(self, izquierda, abajo, derecha, arriba, t0, t1):
+        """Primer instante en [t0, t1] con el centro dentro del rectángulo, o None"""
+        # En x el movimiento es uniforme
+        if self.vx > 0:
+            t0 = max(t0, izquierda / self.vx)
+            t1 = min(t1, derecha / self.vx)
+        elif self.vx < 0:
+            t0 = max(t0, derecha / self.vx)
+            t1 = min(t1, izquierda / self.vx)
+        elif not izquierda <= 0 <= derecha:
+            return None
+        # y(t) >= abajo entre las dos raíces (la parábola abre hacia abajo)
+        raices = _raices_cuadratica(0.5 * self.g, -self.vy, abajo)
+        if not raices:
+            return None
+        t0 = max(t0, raices[0])
+        t1 = min(t1, raices[-1])
+        if t0 > t1:
+            return None
+        # y(t) <= arriba fuera de las dos raíces
+        raices = _raices_cuadratica(0.5 * self.g, -self.vy, arriba)
+        if len(raices) < 2 or t0 <= raices[0] or t0 >= raices[1]:
+            return t0
+        return raices[1] if raices[1] <= t1 else None
+
+    def _entrada_circulo(self, cx, cy, radio, t0, t1):
+        """Primer instante en [t0, t1] con el centro a distancia <= radio de (cx, cy), o None"""
+        # Sólo puede estar cerca mientras |x - cx| <= radio
+        if self.vx != 0:
+            a, b = (cx - radio) / self.vx, (cx + radio) / self.vx
+            t0 = max(t0, min(a, b))
+            t1 = min(t1, max(a, b))
+            if t0 > t1:
+                return None
+        x, y = self.posicion(t0)
+        if (x - cx) ** 2 + (y - cy) ** 2 <= radio * radio:
+            return t0
+        # |p(t) - c|² - radio² es un polinomio de grado 4 en t
+        p = -0.5 * self.g
+        coeficientes = [
+            p * p,
+            2 * p * self.vy,
+            self.vy ** 2 - 2 * p * cy + self.vx ** 2,
+            -2 * (self.vy * cy + self.vx * cx),
+            cx * cx + cy * cy - radio * radio,
+        ]
+        raices = np.roots(coeficientes)
+        reales = raices.real[np.abs(raices.imag) <= 1e-9 * (1 + np.abs(raices.real))]
+        reales = reales[(reales >= t0) & (reales <= t1)]
+        return float(reales.min()) if reales.size else None
+
+    def tiempo_impacto(self, izquierda, abajo, derecha, arriba, radio=0.0, t_fin=None):
+        """Primer instante en que un disco de ese radio toca el rectángulo, o None si no lo toca
+
+        El disco toca el rectángulo cuando su centro entra en el rectángulo agrandado
+        radio por cada lado con las esquinas redondeadas: dos rectángulos en cruz más
+        cuatro círculos. Cada parte se resuelve en forma cerrada.
+        """
+        t0, t1 = 0.0, self.duracion if t_fin is None else t_fin
+        # Si ni siquiera entra en la caja que lo envuelve todo, no hay impacto
+        if self._entrada_rect(izquierda - radio, abajo - radio, derecha + radio, arriba + radio, t0, t1) is None:
+            return None
+        tiempos = [
+            self._entrada_rect(izquierda - radio, abajo, derecha + radio, arriba, t0, t1),
+            self._entrada_rect(izquierda, abajo - radio, derecha, arriba + radio, t0, t1),
+        ]
+        tiempos = [t for t in tiempos if t is not None]
+        if radio > 0:
+            # Las esquinas sólo importan si se tocan antes que los lados
+            for cx in (izquierda, derecha):
+                for cy in (abajo, arriba):
+                    t = self._entrada_circulo(cx, cy, radio, t0, min(tiempos, default=t1))
+                    if t is not None:
+                        tiempos.append(t)
+        return min(tiempos) if tiempos else None
+
+
+class Reproduccion:
+    """Cursor que recorre un vuelo según el tiempo real transcurrido
+
+    ritmo: 1 = tiempo real, < 1 cámara lenta, None = instantáneo (salta al final).
+    Sirve para cualquier trayectoria con posicion(t) y duracion (también con aire).
+    """
+
+    def __init__(self, trayectoria, t_fin=None, ritmo=1.0):
+        self.trayectoria = trayectoria
+        self.t_fin = trayectoria.duracion if t_fin is None else t_fin
+        self.ritmo = ritmo
+        self.t = self.t_fin if ritmo is None else 0.0
+
+    @property
+    def terminado(self):
+        return self.t >= self.t_fin
+
+    def avanzar(self, dt):
+        """Avanza dt segundos de reloj y devuelve la posición en ese instante"""
+        if self.ritmo is not None:
+            self.t = min(self.t + dt * self.ritmo, self.t_fin)
+        return self.trayectoria.posicion(self.t)